@@ -0,0 +1,292 @@
+// RevNova docs search
+// Queries the index built by scripts/build_search_index.py: meta.json holds the
+// document table, shards/<prefix>.json the positional postings for every term
+// starting with <prefix>. Only the shards a query needs are fetched.
+(function() {
+    const scriptUrl = document.currentScript ? document.currentScript.src : '';
+    const indexBase = new URL('.', scriptUrl || window.location.href);
+    const docsBase = new URL('..', indexBase);
+    const MAX_RESULTS = 10;
+
+    // Keep WORD_PATTERN, PART_PATTERN, STOPWORDS and stem() in step with build_search_index.py
+    const WORD_PATTERN = /[A-Za-z0-9_]+/g;
+    const STOPWORDS = new Set(('a an and are as at be by for from has have in is it its of on or that ' +
+                               'the this to was were will with').split(' '));
+    const DERIVATIONAL_SUFFIXES = [['ization', 'ize'], ['ational', 'ate'], ['fulness', 'ful'],
+                                   ['iveness', 'ive'], ['ation', 'ate'], ['ness', ''], ['ment', ''], ['ly', '']];
+
+    let metaPromise = null;
+    const shardCache = new Map();
+
+    function hasVowel(word) {
+        return /[aeiouy]/.test(word);
+    }
+
+    function stem(word) {
+        if (word.length <= 3 || !/^[a-z]+$/.test(word)) {
+            return word;
+        }
+        if (word.endsWith('sses')) {
+            word = word.slice(0, -2);
+        } else if (word.endsWith('ies')) {
+            word = word.slice(0, -3) + 'y';
+        } else if (word.endsWith('s') && !/(ss|us|is)$/.test(word)) {
+            word = word.slice(0, -1);
+        }
+
+        for (const suffix of ['ing', 'ed']) {
+            const stemmed = word.slice(0, -suffix.length);
+            if (word.endsWith(suffix) && stemmed.length >= 3 && hasVowel(stemmed)) {
+                word = stemmed;
+                const last = word[word.length - 1];
+                if (last === word[word.length - 2] && !'aeiouylsz'.includes(last)) {
+                    word = word.slice(0, -1);
+                }
+                break;
+            }
+        }
+
+        for (const [suffix, replacement] of DERIVATIONAL_SUFFIXES) {
+            if (word.endsWith(suffix) && word.length - suffix.length >= 3) {
+                word = word.slice(0, -suffix.length) + replacement;
+                break;
+            }
+        }
+
+        if (word.endsWith('e') && word.length > 4) {
+            word = word.slice(0, -1);
+        }
+        return word;
+    }
+
+    function isIndexed(term) {
+        return !STOPWORDS.has(term) && (term.length >= 2 || /^[0-9]+$/.test(term));
+    }
+
+    // Parse a query into groups; each group is a phrase of [offset, term] pairs
+    // (a single word is a one-term phrase). The last word also matches as a prefix.
+    function parseQuery(query) {
+        const groups = [];
+        const pattern = /"([^"]*)"?|([^\s"]+)/g;
+        let match;
+        while ((match = pattern.exec(query)) !== null) {
+            const text = match[1] !== undefined ? match[1] : match[2];
+            const words = text.match(WORD_PATTERN) || [];
+            const terms = [];
+            words.forEach((word, offset) => {
+                const term = stem(word.toLowerCase());
+                if (isIndexed(term)) {
+                    terms.push([offset, term, word.toLowerCase()]);
+                }
+            });
+            if (terms.length) {
+                groups.push({terms: terms, phrase: match[1] !== undefined});
+            }
+        }
+        const last = groups[groups.length - 1];
+        if (last && !last.phrase && !/\s$/.test(query)) {
+            last.prefix = true;
+        }
+        return groups;
+    }
+
+    function shardKey(term) {
+        return term.slice(0, 2).replace(/[^a-z0-9]/g, '_');
+    }
+
+    function fetchJson(path) {
+        return fetch(new URL(path, indexBase)).then(response => response.ok ? response.json() : {});
+    }
+
+    function loadMeta() {
+        if (!metaPromise) {
+            metaPromise = fetchJson('meta.json');
+        }
+        return metaPromise;
+    }
+
+    function loadShard(key) {
+        if (!shardCache.has(key)) {
+            shardCache.set(key, fetchJson('shards/' + key + '.json'));
+        }
+        return shardCache.get(key);
+    }
+
+    // Decode [doc, weight, delta, delta, ...] postings into doc -> {weight, positions}
+    function decodePostings(postings) {
+        const docs = new Map();
+        (postings || []).forEach(posting => {
+            const positions = [];
+            let position = 0;
+            for (let i = 2; i < posting.length; i++) {
+                position += posting[i];
+                positions.push(position);
+            }
+            docs.set(posting[0], {weight: posting[1], positions: positions});
+        });
+        return docs;
+    }
+
+    function phraseMatches(termDocs, offsets, doc) {
+        const first = termDocs[0].get(doc);
+        return first.positions.some(start => termDocs.every((docs, i) => {
+            const entry = docs.get(doc);
+            return entry.positions.includes(start + offsets[i] - offsets[0]);
+        }));
+    }
+
+    async function search(query) {
+        const meta = await loadMeta();
+        const groups = parseQuery(query);
+        if (!groups.length || !meta.docs) {
+            return [];
+        }
+        const totalDocs = Object.keys(meta.docs).length;
+        const keys = new Set();
+        groups.forEach(group => group.terms.forEach(([, term]) => keys.add(shardKey(term))));
+        const shards = {};
+        await Promise.all([...keys].map(key => loadShard(key).then(shard => { shards[key] = shard; })));
+
+        let candidates = null;
+        const scores = new Map();
+        for (const group of groups) {
+            const termDocs = group.terms.map(([, term, raw]) => {
+                const shard = shards[shardKey(term)] || {};
+                if (!group.prefix || group.terms.length > 1) {
+                    return decodePostings(shard[term]);
+                }
+                // Prefix match while typing: merge every term starting with the input
+                const merged = new Map();
+                Object.keys(shard).filter(t => t === term || t.startsWith(raw)).forEach(t => {
+                    decodePostings(shard[t]).forEach((entry, doc) => {
+                        const existing = merged.get(doc);
+                        merged.set(doc, existing && existing.weight > entry.weight ? existing : entry);
+                    });
+                });
+                return merged;
+            });
+
+            let docs = [...termDocs[0].keys()].filter(doc => termDocs.every(d => d.has(doc)));
+            if (group.phrase && group.terms.length > 1) {
+                const offsets = group.terms.map(([offset]) => offset);
+                docs = docs.filter(doc => phraseMatches(termDocs, offsets, doc));
+            }
+            candidates = candidates === null ? new Set(docs) : new Set(docs.filter(doc => candidates.has(doc)));
+
+            // BM25 over the field-weighted term frequency
+            termDocs.forEach(d => {
+                const idf = Math.log(1 + (totalDocs - d.size + 0.5) / (d.size + 0.5));
+                d.forEach((entry, doc) => {
+                    const length = meta.docs[doc] ? meta.docs[doc][4] : meta.avg_length;
+                    const tf = entry.weight;
+                    const score = idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * length / meta.avg_length));
+                    scores.set(doc, (scores.get(doc) || 0) + score);
+                });
+            });
+        }
+
+        return [...candidates]
+            .filter(doc => meta.docs[doc])
+            .sort((a, b) => scores.get(b) - scores.get(a))
+            .slice(0, MAX_RESULTS)
+            .map(doc => {
+                const [url, title, section, excerpt] = meta.docs[doc];
+                return {url: new URL(url, docsBase).href, title: title, section: section, excerpt: excerpt};
+            });
+    }
+
+    function escapeHtml(text) {
+        return text.replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}[c]));
+    }
+
+    const STYLES = `
+        .docs-search { position: relative; margin-left: auto; margin-right: 1rem; color: #16325c; }
+        .docs-search-input { width: 260px; padding: 0.4rem 0.75rem; border: 1px solid #c9c9c9; border-radius: 4px; font-size: 0.9rem; }
+        .docs-search-results { position: absolute; right: 0; top: calc(100% + 6px); width: 420px; max-height: 70vh; overflow-y: auto;
+            background: #fff; border: 1px solid #c9c9c9; border-radius: 4px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); z-index: 2000; text-align: left; }
+        .docs-search-result { display: block; padding: 0.6rem 0.9rem; border-bottom: 1px solid #eef1f6; color: inherit; text-decoration: none; }
+        .docs-search-result:hover, .docs-search-result.selected { background: #f4f6f9; }
+        .docs-search-result strong { display: block; color: #0070d2; font-size: 0.9rem; }
+        .docs-search-result small { display: block; color: #54698d; font-size: 0.78rem; margin-top: 0.2rem; line-height: 1.35; }
+        .docs-search-empty { padding: 0.6rem 0.9rem; color: #54698d; font-size: 0.85rem; }
+        body > .docs-search { position: fixed; top: 12px; right: 12px; margin: 0; z-index: 2000; }
+        @media (max-width: 768px) { .docs-search-input { width: 160px; } .docs-search-results { width: 90vw; } }
+    `;
+
+    function initSearchBox(box) {
+        const input = box.querySelector('.docs-search-input');
+        const results = box.querySelector('.docs-search-results');
+        let selected = -1;
+        let latest = 0;
+
+        function render(items) {
+            selected = -1;
+            results.innerHTML = items.length ? items.map(item =>
+                `<a class="docs-search-result" href="${escapeHtml(item.url)}">` +
+                `<strong>${escapeHtml(item.title)}</strong>` +
+                `<small>${escapeHtml(item.section)} · ${escapeHtml(item.excerpt)}</small></a>`
+            ).join('') : '<div class="docs-search-empty">No matching pages</div>';
+            results.hidden = false;
+        }
+
+        function select(index) {
+            const links = results.querySelectorAll('.docs-search-result');
+            if (!links.length) {
+                return;
+            }
+            selected = (index + links.length) % links.length;
+            links.forEach((link, i) => link.classList.toggle('selected', i === selected));
+            links[selected].scrollIntoView({block: 'nearest'});
+        }
+
+        input.addEventListener('focus', loadMeta, {once: true});
+        input.addEventListener('input', function() {
+            const query = input.value;
+            const request = ++latest;
+            if (!query.trim()) {
+                results.hidden = true;
+                return;
+            }
+            search(query).then(items => {
+                if (request === latest) {
+                    render(items);
+                }
+            });
+        });
+        input.addEventListener('keydown', function(e) {
+            const links = results.querySelectorAll('.docs-search-result');
+            if (e.key === 'ArrowDown' || e.key === 'ArrowUp') {
+                e.preventDefault();
+                select(selected + (e.key === 'ArrowDown' ? 1 : -1));
+            } else if (e.key === 'Enter' && links.length) {
+                e.preventDefault();
+                window.location.href = links[Math.max(selected, 0)].href;
+            } else if (e.key === 'Escape') {
+                results.hidden = true;
+                input.blur();
+            }
+        });
+        document.addEventListener('click', function(e) {
+            if (!box.contains(e.target)) {
+                results.hidden = true;
+            }
+        });
+    }
+
+    function init() {
+        const style = document.createElement('style');
+        style.textContent = STYLES;
+        document.head.appendChild(style);
+        document.querySelectorAll('.docs-search').forEach(initSearchBox);
+    }
+
+    if (typeof document !== 'undefined' && document.querySelectorAll) {
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', init);
+        } else {
+            init();
+        }
+    }
+
+    window.RevNovaSearch = {search: search, stem: stem, parseQuery: parseQuery};
+})();
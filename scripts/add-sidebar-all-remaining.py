@@ -7,6 +7,10 @@ This covers Week 3-5 for all developers.
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Sidebar templates for each developer
 SIDEBARS = {
     'dev1': '''<body>
@@ -248,10 +252,9 @@ CLOSING_HTML = '''        </main>
     <script src="../script.js"></script>
 </body>'''
 
-def add_sidebar_to_file(filepath):
+def add_sidebar_to_file(filepath, tx):
     """Add header and sidebar to a day file if it doesn't have one."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = tx.read(filepath)
     
     # Check if sidebar already exists
     if '<aside class="sidebar">' in content:
@@ -274,8 +277,7 @@ def add_sidebar_to_file(filepath):
     # Replace closing </div></body>
     content = re.sub(r'</div>\s*</body>', CLOSING_HTML, content, count=1)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    tx.write(filepath, content)
     
     return True
 
@@ -283,20 +285,22 @@ def main():
     docs_dir = Path(__file__).parent.parent / 'docs' / 'Onboarding'
     
     # Get all day files for all developers
-    all_files = sorted(docs_dir.glob('dev*-day*.html'))
+    all_files = [page.path for page in docs_pages.find_day_pages(docs_dir)]
     
     print(f"Checking {len(all_files)} onboarding files...")
     print("=" * 60)
     
     updated_count = 0
-    for filepath in all_files:
-        if add_sidebar_to_file(filepath):
-            print(f"  ✅ {filepath.name}")
-            updated_count += 1
+    with docs_writer.transaction() as tx:
+        for filepath in all_files:
+            if add_sidebar_to_file(filepath, tx):
+                print(f"  ✅ {filepath.name}")
+                updated_count += 1
     
     print("=" * 60)
     print(f"\n✨ Complete! Updated {updated_count} files")
     print(f"Skipped {len(all_files) - updated_count} files (already had sidebars)")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -7,6 +7,9 @@ import re
 import os
 from pathlib import Path
 
+import docs_profile
+import docs_writer
+
 # Header HTML template for Dev1
 HEADER_HTML = '''<body>
     <header>
@@ -107,10 +110,9 @@ CLOSING_HTML = '''        </main>
     <script src="../script.js"></script>
 </body>'''
 
-def add_sidebar_to_file(filepath):
+def add_sidebar_to_file(filepath, tx):
     """Add header and sidebar to a Dev1 day file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = tx.read(filepath)
     
     # Check if sidebar already exists
     if '<aside class="sidebar">' in content:
@@ -133,8 +135,7 @@ def add_sidebar_to_file(filepath):
         count=1
     )
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    tx.write(filepath, content)
     
     print(f"  ✅ {filepath.name} - Added sidebar")
     return True
@@ -155,12 +156,14 @@ def main():
     print("=" * 60)
     
     updated_count = 0
-    for filepath in files_to_update:
-        if add_sidebar_to_file(filepath):
-            updated_count += 1
+    with docs_writer.transaction() as tx:
+        for filepath in files_to_update:
+            if add_sidebar_to_file(filepath, tx):
+                updated_count += 1
     
     print("=" * 60)
     print(f"\n✨ Complete! Updated {updated_count} files")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -7,6 +7,10 @@ import re
 import os
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Header HTML template
 HEADER_HTML = '''<body>
     <header>
@@ -107,10 +111,9 @@ CLOSING_HTML = '''        </main>
     <script src="../script.js"></script>
 </body>'''
 
-def add_sidebar_to_file(filepath):
+def add_sidebar_to_file(filepath, tx):
     """Add header and sidebar to a single Dev2 day file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = tx.read(filepath)
     
     # Check if sidebar already exists
     if '<aside class="sidebar">' in content:
@@ -133,8 +136,7 @@ def add_sidebar_to_file(filepath):
         count=1
     )
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    tx.write(filepath, content)
     
     print(f"  ✅ {filepath.name} - Added sidebar")
     return True
@@ -143,20 +145,22 @@ def main():
     docs_dir = Path(__file__).parent.parent / 'docs' / 'Onboarding'
     
     # Get all dev2-day*.html files
-    dev2_files = sorted(docs_dir.glob('dev2-day*.html'))
+    dev2_files = [page.path for page in docs_pages.find_day_pages(docs_dir, dev=2)]
     
     print(f"Found {len(dev2_files)} Dev2 day files")
     print("\nAdding header and sidebar to all files...")
     print("=" * 60)
     
     updated_count = 0
-    for filepath in dev2_files:
-        if add_sidebar_to_file(filepath):
-            updated_count += 1
+    with docs_writer.transaction() as tx:
+        for filepath in dev2_files:
+            if add_sidebar_to_file(filepath, tx):
+                updated_count += 1
     
     print("=" * 60)
     print(f"\n✨ Complete! Updated {updated_count} files")
     print(f"Skipped {len(dev2_files) - updated_count} files (already had sidebars)")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
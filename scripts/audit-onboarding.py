@@ -8,7 +8,11 @@ Checks:
 
 import os
 import re
-from pathlib import Path
+from collections import defaultdict
+
+import docs_content
+import docs_pages
+import docs_profile
 
 # RevNova Core Requirements
 REVNOVA_CORE = {
@@ -26,32 +30,9 @@ REVNOVA_CORE = {
     "devops": ["Docker", "docker-compose", "GitHub Actions", "Prometheus", "Grafana", "k6"]
 }
 
-def get_all_day_files():
-    """Get all day files from Week 2 onwards"""
-    docs_dir = Path(__file__).parent.parent / "docs" / "Onboarding"
-    pattern = re.compile(r"dev(\d+)-day(\d+)\.html")
-    
-    files = []
-    for file in docs_dir.glob("dev*-day*.html"):
-        match = pattern.match(file.name)
-        if match:
-            dev = int(match.group(1))
-            day = int(match.group(2))
-            if day >= 6:  # Week 2+ only (Day 6 onwards)
-                files.append({
-                    'path': file,
-                    'dev': dev,
-                    'day': day,
-                    'week': ((day - 1) // 5) + 1,
-                    'name': file.name
-                })
-    
-    return sorted(files, key=lambda x: (x['dev'], x['day']))
-
-def check_navigation_structure(file_info):
+def check_navigation_structure(page):
     """Check navigation structure for consistency"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = page.read()
     
     issues = []
     
@@ -63,7 +44,7 @@ def check_navigation_structure(file_info):
     week_pattern = r'<li class="has-children">'
     week_count = len(re.findall(week_pattern, content))
     
-    if file_info['dev'] in [1, 2]:
+    if page.dev in [1, 2]:
         expected_min = 4  # Should have at least 4-5 week groupings
         if week_count < expected_min:
             issues.append(f"Expected {expected_min}+ week groupings, found {week_count}")
@@ -93,38 +74,29 @@ def check_navigation_structure(file_info):
         issues.append("Missing sidebar navigation structure")
     
     return {
-        'file': file_info['name'],
+        'file': page.name,
         'issues': issues,
         'week_count': week_count,
         'day_links': day_links,
         'status': '✅ PASS' if not issues else '⚠️ ISSUES'
     }
 
-def check_task_content(file_info):
+def check_task_content(page):
     """Check if tasks are present and comprehensive"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Remove header and navigation to focus on main content
-    main_content = content
-    if '<main' in content:
-        main_start = content.find('<main')
-        main_end = content.find('</main>')
-        if main_start != -1 and main_end != -1:
-            main_content = content[main_start:main_end]
+    # Steps, prompts, code and list items come from the page's cached content record
+    record = docs_content.record_for(page)
     
     metrics = {
-        'has_copilot_prompt': 'RevNova' in main_content and 'Copilot' in main_content,
-        'has_tasks': bool(re.search(r'<li>.*?</li>', main_content, re.DOTALL)),
-        'has_code': '<code>' in main_content or '<pre>' in main_content,
-        'has_acceptance_criteria': 'Acceptance Criteria' in main_content or 'acceptance criteria' in main_content,
-        'content_length': len(main_content.strip()),
-        'has_implementation_steps': 'Step 1' in main_content or 'Step 2' in main_content
+        'has_copilot_prompt': bool(record['prompts']),
+        'has_tasks': bool(record['tasks']),
+        'has_code': bool(record['code_blocks'] or record['prompts']),
+        'has_acceptance_criteria': bool(record['acceptance_criteria']),
+        'content_length': record['text_length'],
+        'has_implementation_steps': bool(record['steps'])
     }
     
     # Extract task count
-    task_matches = re.findall(r'<li[^>]*>(.+?)</li>', main_content, re.DOTALL)
-    metrics['task_count'] = len([t for t in task_matches if len(t.strip()) > 10])
+    metrics['task_count'] = len([t for t in record['tasks'] if len(t) > 10])
     
     # Quality score (0-100)
     score = 0
@@ -139,13 +111,12 @@ def check_task_content(file_info):
     
     return metrics
 
-def check_tech_alignment(file_info):
+def check_tech_alignment(page):
     """Check if content aligns with RevNova tech stack"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        content = f.read().lower()
+    content = page.read().lower()
     
-    dev = file_info['dev']
-    week = file_info['week']
+    dev = page.dev
+    week = page.week
     
     # Define expected technologies per developer per week
     expected = []
@@ -198,7 +169,7 @@ def print_report():
     print("Checking: Navigation consistency, Task quality, Tech alignment")
     print("=" * 90 + "\n")
     
-    files = get_all_day_files()
+    files = docs_pages.find_day_pages(min_day=6)  # Week 2+ only (Day 6 onwards)
     print(f"📁 Auditing {len(files)} files (Week 2 onwards - Days 6-25)\n")
     
     # Navigation Audit
@@ -207,8 +178,8 @@ def print_report():
     nav_pass = 0
     nav_issues = []
     
-    for file_info in files:
-        result = check_navigation_structure(file_info)
+    for page in files:
+        result = check_navigation_structure(page)
         if not result['issues']:
             nav_pass += 1
         else:
@@ -231,13 +202,13 @@ def print_report():
     print("📝 TASK CONTENT QUALITY AUDIT")
     print("-" * 90)
     
-    content_by_dev = {1: [], 2: [], 3: []}
-    for file_info in files:
-        metrics = check_task_content(file_info)
-        metrics['file'] = file_info['name']
-        content_by_dev[file_info['dev']].append(metrics)
+    content_by_dev = defaultdict(list)
+    for page in files:
+        metrics = check_task_content(page)
+        metrics['file'] = page.name
+        content_by_dev[page.dev].append(metrics)
     
-    for dev in [1, 2, 3]:
+    for dev in sorted(content_by_dev):
         files_dev = content_by_dev[dev]
         avg_score = sum(f['quality_score'] for f in files_dev) / len(files_dev) if files_dev else 0
         
@@ -264,14 +235,14 @@ def print_report():
     print("🔧 TECHNOLOGY ALIGNMENT AUDIT")
     print("-" * 90)
     
-    alignment_by_dev = {1: [], 2: [], 3: []}
-    for file_info in files:
-        alignment = check_tech_alignment(file_info)
-        alignment['file'] = file_info['name']
-        alignment['week'] = file_info['week']
-        alignment_by_dev[file_info['dev']].append(alignment)
+    alignment_by_dev = defaultdict(list)
+    for page in files:
+        alignment = check_tech_alignment(page)
+        alignment['file'] = page.name
+        alignment['week'] = page.week
+        alignment_by_dev[page.dev].append(alignment)
     
-    for dev in [1, 2, 3]:
+    for dev in sorted(alignment_by_dev):
         files_dev = alignment_by_dev[dev]
         avg_alignment = sum(f['alignment_percent'] for f in files_dev) / len(files_dev) if files_dev else 0
         
@@ -301,7 +272,7 @@ def print_report():
     
     all_content = []
     all_alignment = []
-    for dev in [1, 2, 3]:
+    for dev in sorted(content_by_dev):
         all_content.extend(content_by_dev[dev])
         all_alignment.extend(alignment_by_dev[dev])
     
@@ -331,4 +302,6 @@ def print_report():
     print("\n" + "=" * 90 + "\n")
 
 if __name__ == "__main__":
-    print_report()
+    with docs_profile.profile_from_argv():
+        print_report()
+        docs_content.save()
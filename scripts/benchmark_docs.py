@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Benchmark the docs build and audit scripts.
+
+Runs every stage script against the real docs/ tree and against synthetic
+corpora (see generate_synthetic_corpus.py) and records, per corpus and stage:
+
+  - wall time (best of --repeat runs)
+  - peak memory (max RSS of the script process)
+  - files read and files written
+
+Each corpus gets a throwaway workspace holding a copy of scripts/ and either a
+copy of docs/ or a freshly generated synthetic tree. The scripts resolve their
+paths relative to their own location or the working directory, so they run
+unmodified inside the workspace; the real docs/ is never touched. Stages run
+in build order over the same workspace, as they would in a real build.
+
+Results are written as JSON and compared against a stored baseline
+(scripts/data/benchmark-baseline.json); stages that got slower or bigger than
+--threshold are flagged.
+
+Usage:
+    python scripts/benchmark_docs.py
+    python scripts/benchmark_docs.py --corpora real,1x,10x,100x --repeat 3
+    python scripts/benchmark_docs.py --save-baseline
+    python scripts/benchmark_docs.py --stages audit-onboarding --fail-on-regression
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import docs_pipeline
+import generate_synthetic_corpus
+
+RESULTS_PATH = docs_pipeline.REPO_ROOT / 'build' / 'benchmarks' / 'latest.json'
+BASELINE_PATH = docs_pipeline.SCRIPTS_DIR / 'data' / 'benchmark-baseline.json'
+MAPPING_WORKBOOK = Path('docs') / 'revnova_mapping.xlsx'
+
+# Build order. "requires" lists optional modules; the stage is skipped without them.
+BENCH_STAGES = [
+    {'name': 'regenerate', 'script': 'regenerate_all_pages.py'},
+    {'name': 'update-sidebars', 'script': 'update-sidebars.py'},
+    {'name': 'fix-requirements-sidebar', 'script': 'fix-requirements-sidebar.py'},
+    {'name': 'standardize-requirements-sidebar', 'script': 'standardize-requirements-sidebar.py'},
+    {'name': 'requirements-sidebar', 'script': 'fix-requirements-sidebar-final.py'},
+    {'name': 'copilot-prompts', 'script': 'add-copilot-prompts.py'},
+    {'name': 'task-status', 'script': 'update-task-completion-status.py'},
+    {'name': 'search-index', 'script': 'build_search_index.py'},
+    {'name': 'mapping-html', 'script': 'generate_mapping_html.py',
+     'args': ['-i', str(MAPPING_WORKBOOK)], 'requires': ['pandas', 'openpyxl']},
+    {'name': 'extract-content', 'script': 'docs_content.py'},
+    {'name': 'audit-onboarding', 'script': 'audit-onboarding.py'},
+    {'name': 'comprehensive-audit', 'script': 'comprehensive-audit.py'},
+]
+
+BENCH_STAGES_BY_NAME = {stage['name']: stage for stage in BENCH_STAGES}
+
+DEFAULT_CORPORA = ['real', '1x', '10x']
+
+# Runs a script with open() wrapped to record which files it reads and writes.
+PROBE = r'''
+import builtins, io, json, os, runpy, sys
+reads, writes = set(), set()
+_open = io.open
+def _recording_open(file, mode='r', *args, **kwargs):
+    if isinstance(file, (str, bytes, os.PathLike)):
+        path = os.path.abspath(os.fsdecode(file))
+        (writes if any(flag in mode for flag in 'wax+') else reads).add(path)
+    return _open(file, mode, *args, **kwargs)
+builtins.open = io.open = _recording_open
+script, report = sys.argv[1], sys.argv[2]
+sys.argv = [script] + sys.argv[3:]
+sys.path.insert(0, os.path.dirname(script))
+try:
+    runpy.run_path(script, run_name='__main__')
+finally:
+    with _open(report, 'w') as f:
+        json.dump({'read': sorted(reads), 'written': sorted(writes)}, f)
+'''
+
+
+def missing_modules(stage):
+    return [name for name in stage.get('requires', []) if importlib.util.find_spec(name) is None]
+
+
+def prepare_workspace(corpus, workspace, report=print):
+    """Fill workspace with scripts/ plus the corpus docs. Returns corpus stats."""
+    shutil.copytree(docs_pipeline.SCRIPTS_DIR, workspace / 'scripts',
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    if corpus == 'real':
+        shutil.copytree(docs_pipeline.DOCS_DIR, workspace / 'docs')
+    else:
+        developers, days, requirements = generate_synthetic_corpus.PRESETS[corpus]
+        generate_synthetic_corpus.generate_corpus(workspace, developers, days, requirements, report=None)
+        workbook = docs_pipeline.REPO_ROOT / MAPPING_WORKBOOK
+        if workbook.exists():
+            shutil.copyfile(workbook, workspace / MAPPING_WORKBOOK)
+
+    pages = [path for path in (workspace / 'docs').rglob('*.html')]
+    return {'pages': len(pages), 'bytes': sum(path.stat().st_size for path in pages)}
+
+
+def run_script(workspace, stage, timeout):
+    """Run one stage script in the workspace. Returns its measurements."""
+    report_path = workspace / '.bench-probe.json'
+    log_path = workspace / f".bench-{stage['name']}.log"
+    command = [sys.executable, '-c', PROBE, str(workspace / 'scripts' / stage['script']),
+               str(report_path), *stage.get('args', [])]
+
+    with open(log_path, 'w', encoding='utf-8') as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=workspace, stdout=log, stderr=subprocess.STDOUT,
+                                   env={**os.environ, 'PYTHONIOENCODING': 'utf-8'})
+        deadline = start + timeout
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            if time.perf_counter() > deadline:
+                process.kill()
+                pid, status, usage = os.wait4(process.pid, 0)
+                break
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            files = json.load(f)
+        report_path.unlink()
+    except FileNotFoundError:
+        files = {'read': [], 'written': []}
+
+    def inside(paths):
+        root = str(workspace) + os.sep
+        return [p for p in paths if p.startswith(root) and '.bench-' not in p]
+
+    # ru_maxrss is in KB on Linux and in bytes on macOS.
+    peak_kb = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return {
+        'status': 'ok' if process.returncode == 0 else 'failed',
+        'exit_code': process.returncode,
+        'seconds': round(elapsed, 4),
+        'peak_rss_kb': peak_kb,
+        'files_read': len(inside(files['read'])),
+        'files_written': len(inside(files['written'])),
+    }
+
+
+def benchmark_corpus(corpus, stages, repeat=1, timeout=600, report=print):
+    """Benchmark every stage on one corpus. Returns the corpus result dict."""
+    result = {'stages': {}}
+    with tempfile.TemporaryDirectory(prefix=f'docs-bench-{corpus}-') as tmp:
+        workspace = Path(tmp)
+        start = time.perf_counter()
+        result.update(prepare_workspace(corpus, workspace))
+        report(f"📦 {corpus}: {result['pages']} pages, {result['bytes'] / 1024 / 1024:.1f} MB "
+               f"(prepared in {time.perf_counter() - start:.1f}s)")
+
+        for stage in stages:
+            missing = missing_modules(stage)
+            if missing:
+                result['stages'][stage['name']] = {'status': 'skipped', 'reason': f"missing {', '.join(missing)}"}
+                report(f"  ⏭  {stage['name']:<34} skipped (missing {', '.join(missing)})")
+                continue
+
+            # Stages rewrite the workspace, so repeats measure the steady
+            # state after the first run; keep the fastest.
+            runs = [run_script(workspace, stage, timeout) for _ in range(repeat)]
+            best = min(runs, key=lambda run: run['seconds'])
+            best['peak_rss_kb'] = max(run['peak_rss_kb'] for run in runs)
+            result['stages'][stage['name']] = best
+            flag = '✅' if best['status'] == 'ok' else '❌'
+            report(f"  {flag} {stage['name']:<34} {best['seconds'] * 1000:9.0f} ms "
+                   f"{best['peak_rss_kb'] / 1024:7.1f} MB  {best['files_read']:>6} read "
+                   f"{best['files_written']:>6} written")
+    return result
+
+
+def run_benchmarks(corpora, stage_names=None, repeat=1, timeout=600, report=print):
+    stages = [BENCH_STAGES_BY_NAME[name] for name in stage_names] if stage_names else BENCH_STAGES
+    results = {
+        'version': 1,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'corpora': {},
+    }
+    for corpus in corpora:
+        results['corpora'][corpus] = benchmark_corpus(corpus, stages, repeat, timeout, report)
+    return results
+
+
+def save_results(results, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, threshold=1.25, min_seconds=0.05):
+    """Return a list of (corpus, stage, metric, before, after) regressions."""
+    regressions = []
+    for corpus, current in results['corpora'].items():
+        previous = baseline.get('corpora', {}).get(corpus)
+        if not previous:
+            continue
+        for name, stage in current['stages'].items():
+            before = previous['stages'].get(name)
+            if not before or stage['status'] != 'ok' or before.get('status') != 'ok':
+                if before and before.get('status') == 'ok' and stage['status'] == 'failed':
+                    regressions.append((corpus, name, 'status', 'ok', 'failed'))
+                continue
+            if (stage['seconds'] > before['seconds'] * threshold
+                    and stage['seconds'] - before['seconds'] > min_seconds):
+                regressions.append((corpus, name, 'seconds', before['seconds'], stage['seconds']))
+            if stage['peak_rss_kb'] > before['peak_rss_kb'] * threshold:
+                regressions.append((corpus, name, 'peak_rss_kb', before['peak_rss_kb'], stage['peak_rss_kb']))
+            for metric in ('files_read', 'files_written'):
+                if stage[metric] > before[metric]:
+                    regressions.append((corpus, name, metric, before[metric], stage[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark docs build and audit stages')
+    parser.add_argument('--corpora', default=','.join(DEFAULT_CORPORA),
+                        help=f"Comma-separated corpora: real, {', '.join(generate_synthetic_corpus.PRESETS)} "
+                             f"(default: {','.join(DEFAULT_CORPORA)})")
+    parser.add_argument('--stages', help='Comma-separated stages (default: all)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per stage; the fastest is kept')
+    parser.add_argument('--timeout', type=float, default=600, help='Seconds before a stage is killed')
+    parser.add_argument('--output', default=str(RESULTS_PATH), help='Results JSON (default: build/benchmarks/latest.json)')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=1.25, help='Slowdown/growth ratio flagged as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit with status 1 on regressions')
+    parser.add_argument('--list', action='store_true', help='List benchmark stages')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for stage in BENCH_STAGES:
+            missing = missing_modules(stage)
+            note = f"  (needs {', '.join(missing)})" if missing else ''
+            print(f"  {stage['name']:<34} {stage['script']}{note}")
+        return 0
+
+    corpora = args.corpora.split(',')
+    unknown = [c for c in corpora if c != 'real' and c not in generate_synthetic_corpus.PRESETS]
+    stage_names = args.stages.split(',') if args.stages else None
+    unknown += [name for name in stage_names or [] if name not in BENCH_STAGES_BY_NAME]
+    if unknown:
+        print(f"❌ Unknown corpus or stage: {', '.join(unknown)}")
+        return 2
+
+    results = run_benchmarks(corpora, stage_names, args.repeat, args.timeout)
+    save_results(results, args.output)
+    print(f"\n💾 Results: {args.output}")
+
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"📌 Baseline updated: {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print("ℹ️  No baseline yet (run with --save-baseline)")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"✅ No regressions against {Path(args.baseline).name}")
+        return 0
+    print(f"\n🐢 {len(regressions)} regression(s) against {Path(args.baseline).name}:")
+    for corpus, name, metric, before, after in regressions:
+        print(f"  {corpus:<6} {name:<34} {metric:<14} {before} → {after}")
+    return 1 if args.fail_on_regression else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
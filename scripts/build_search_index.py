@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Build the client-side full-text search index for the onboarding and
+requirements docs.
+
+Text is extracted from each page's <main> onwards (or all of <body> when a
+page has no <main>), minus header, nav, sidebar and scripts, with headings
+and <code> blocks weighted above body text. Extraction does not depend on
+where <main> closes: a stray </div> closes it early in libxml2 (and in
+browsers), and some pages have content after it. Terms are stemmed and stored with positional postings, so
+the browser can rank results and match quoted phrases. Postings are split
+into shards by the first two characters of the term; a query only fetches
+the shards of its own terms.
+
+Output under docs/search/:
+    meta.json            document table (url, title, section, excerpt)
+    shards/<prefix>.json term -> [[doc id, weight, position deltas...], ...]
+    search.js            client (hand-written, not generated)
+    .index-cache.json    per-page hash and extracted terms (build cache)
+
+The build is incremental: pages whose content hash is unchanged reuse their
+cached terms, and only the shards touched by changed pages are rewritten.
+The same stage also puts the search box into each page header
+(add_search_box), which the pipeline runs as the search-box stage.
+
+Usage:
+    python scripts/build_search_index.py
+    python scripts/build_search_index.py --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+import docs_html
+
+DOCS_DIR = Path(__file__).parent.parent / 'docs'
+SEARCH_DIR_NAME = 'search'
+CACHE_NAME = '.index-cache.json'
+SOURCE_PATTERNS = ['Onboarding/*.html', 'Onboarding/*/*.html', 'RevNovaRequirements/*.html']
+# Stale copies kept next to the live pages; indexing them would only duplicate hits.
+EXCLUDED_PAGE_PATTERN = re.compile(r'(-OLD|-new|\.backup)\.html$')
+
+# Bump when extraction, tokenizing or stemming changes, so every page is re-extracted.
+INDEX_VERSION = 2
+SHARD_PREFIX_LENGTH = 2
+FIELD_WEIGHTS = {'title': 8, 'heading': 4, 'code': 2, 'body': 1}
+EXCERPT_LENGTH = 180
+TITLE_SUFFIX_PATTERN = re.compile(r'\s+[-|–]\s+RevNova\b.*$')
+
+# Keep WORD_PATTERN, PART_PATTERN, STOPWORDS and stem() in step with search.js.
+WORD_PATTERN = re.compile(r'[A-Za-z0-9_]+')
+PART_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or that the this to was were will with'.split()
+)
+DERIVATIONAL_SUFFIXES = [('ization', 'ize'), ('ational', 'ate'), ('fulness', 'ful'),
+                         ('iveness', 'ive'), ('ation', 'ate'), ('ness', ''), ('ment', ''), ('ly', '')]
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+CODE_TAGS = {'code', 'pre'}
+BLOCK_TAGS = {'p', 'div', 'li', 'ul', 'ol', 'table', 'tr', 'td', 'th', 'section', 'article', 'br',
+              'blockquote', 'dt', 'dd'} | HEADING_TAGS | CODE_TAGS
+
+SEARCH_BOX_START = '<!-- docs-search -->'
+SEARCH_BOX_END = '<!-- /docs-search -->'
+
+
+def _has_vowel(word):
+    return any(c in 'aeiouy' for c in word)
+
+
+def stem(word):
+    """Light suffix-stripping stemmer (plurals, -ed/-ing, common derivations, final -e)."""
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies'):
+        word = word[:-3] + 'y'
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    for suffix in ('ing', 'ed'):
+        stemmed = word[:-len(suffix)]
+        if word.endswith(suffix) and len(stemmed) >= 3 and _has_vowel(stemmed):
+            word = stemmed
+            if word[-1] == word[-2] and word[-1] not in 'aeiouylsz':
+                word = word[:-1]
+            break
+
+    for suffix, replacement in DERIVATIONAL_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)] + replacement
+            break
+
+    if word.endswith('e') and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Yield (offset, term) pairs. Compound identifiers also yield their parts at the same offset."""
+    for offset, match in enumerate(WORD_PATTERN.finditer(text)):
+        word = match.group()
+        lowered = word.lower()
+        terms = [stem(lowered)]
+        parts = PART_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(stem(part.lower()) for part in parts)
+        seen = set()
+        for term in terms:
+            if term in seen or term in STOPWORDS or (len(term) < 2 and not term.isdigit()):
+                continue
+            seen.add(term)
+            yield offset, term
+
+
+def shard_key(term):
+    return re.sub(r'[^a-z0-9]', '_', term[:SHARD_PREFIX_LENGTH])
+
+
+class PageTextExtractor:
+    """Collect the searchable text of one page, split by field.
+
+    Consumes docs_html events, which are balanced: every start tag gets its
+    end tag and stray end tags never arrive.
+    """
+
+    def __init__(self, has_main):
+        self.has_main = has_main
+        self.stack = []
+        self.main_seen = False
+        self.skip_depth = 0
+        self.chrome_depth = 0
+        self.heading_depth = 0
+        self.code_depth = 0
+        self.in_title = False
+        self.title = []
+        # (field, text) runs in reading order
+        self.runs = []
+
+    def feed(self, events):
+        text, start, end = docs_html.TEXT, docs_html.START, docs_html.END
+        handle_data, handle_starttag, handle_endtag = self.handle_data, self.handle_starttag, self.handle_endtag
+        for kind, value, attrs in events:
+            if kind == text:
+                handle_data(value)
+            elif kind == start:
+                handle_starttag(value, attrs)
+            elif kind == end:
+                handle_endtag(value)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in docs_html.VOID_TAGS:
+            if tag == 'br':
+                self._add_text(' ')
+            return
+        classes = set(attrs.get('class', '').split())
+        if tag == 'title':
+            kind = 'title'
+            self.in_title = True
+        elif tag == 'main':
+            kind = 'main'
+            self.main_seen = True
+        elif tag in docs_html.SKIPPED_TAGS or classes & docs_html.SKIPPED_CLASSES:
+            kind = 'skip'
+            self.skip_depth += 1
+        elif tag in docs_html.CHROME_TAGS:
+            kind = 'chrome'
+            self.chrome_depth += 1
+        elif tag in HEADING_TAGS:
+            kind = 'heading'
+            self.heading_depth += 1
+        elif tag in CODE_TAGS:
+            kind = 'code'
+            self.code_depth += 1
+        else:
+            kind = None
+        self.stack.append((tag, kind))
+        if tag in BLOCK_TAGS:
+            self._add_text(' ')
+
+    def handle_endtag(self, tag):
+        if tag in docs_html.VOID_TAGS or not self.stack:
+            return
+        _, kind = self.stack.pop()
+        if kind == 'title':
+            self.in_title = False
+        elif kind == 'skip':
+            self.skip_depth -= 1
+        elif kind == 'chrome':
+            self.chrome_depth -= 1
+        elif kind == 'heading':
+            self.heading_depth -= 1
+        elif kind == 'code':
+            self.code_depth -= 1
+        if tag in BLOCK_TAGS:
+            self._add_text(' ')
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title.append(data)
+        else:
+            self._add_text(data)
+
+    def _add_text(self, text):
+        if self.skip_depth:
+            return
+        if self.chrome_depth or (self.has_main and not self.main_seen):
+            return
+        if self.heading_depth:
+            field = 'heading'
+        elif self.code_depth:
+            field = 'code'
+        else:
+            field = 'body'
+        if self.runs and self.runs[-1][0] == field:
+            self.runs[-1][1].append(text)
+        else:
+            self.runs.append((field, [text]))
+
+
+def extract_page(html):
+    """Return the index record for one page: title, excerpt, length and term postings.
+
+    terms maps each term to [weight, position, position, ...] where weight is
+    the summed field weight of its occurrences.
+    """
+    parser = PageTextExtractor(has_main='<main' in html)
+    parser.feed(docs_html.iter_events(html))
+
+    title = ' '.join(''.join(parser.title).split())
+    title = TITLE_SUFFIX_PATTERN.sub('', title)
+    terms = {}
+    position = 0
+
+    def add(text, field):
+        nonlocal position
+        last = -1
+        for offset, term in tokenize(text):
+            entry = terms.setdefault(term, [0])
+            entry[0] += FIELD_WEIGHTS[field]
+            entry.append(position + offset)
+            last = offset
+        position += last + 1
+
+    add(title, 'title')
+    position += 10  # no phrase matches across the title/content boundary
+    body_text = []
+    for field, parts in parser.runs:
+        text = ' '.join(''.join(parts).split())
+        add(text, field)
+        if field == 'body' and text:
+            body_text.append(text)
+
+    excerpt = ' '.join(body_text)
+    if len(excerpt) > EXCERPT_LENGTH:
+        excerpt = excerpt[:EXCERPT_LENGTH].rsplit(' ', 1)[0] + '…'
+    return {'title': title, 'excerpt': excerpt, 'length': position, 'terms': terms}
+
+
+def find_pages(docs_dir):
+    pages = set()
+    for pattern in SOURCE_PATTERNS:
+        pages.update(path for path in docs_dir.glob(pattern) if not EXCLUDED_PAGE_PATTERN.search(path.name))
+    return sorted(pages)
+
+
+def load_cache(search_dir):
+    try:
+        with open(search_dir / CACHE_NAME, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    # Backends recover differently from malformed markup, so switching
+    # between them re-extracts every page
+    backend = docs_html.default_backend()
+    if cache.get('version') != INDEX_VERSION or cache.get('backend') != backend:
+        cache = {'version': INDEX_VERSION, 'backend': backend, 'next_id': 0, 'pages': {}}
+    return cache
+
+
+def _dump(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, sort_keys=True) + '\n'
+
+
+def _write_if_changed(path, text):
+    """Write text unless the file already holds it. Returns whether it was written."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return True
+
+
+def build_shards(cache_pages, keys):
+    """Postings for every term in the given shards: key -> term -> [[doc, weight, deltas...], ...]."""
+    shards = {key: {} for key in keys}
+    for record in cache_pages.values():
+        for term, (weight, *positions) in record['terms'].items():
+            shard = shards.get(shard_key(term))
+            if shard is None:
+                continue
+            deltas = [positions[0]] + [b - a for a, b in zip(positions, positions[1:])]
+            shard.setdefault(term, []).append([record['id'], weight, *deltas])
+    for shard in shards.values():
+        for postings in shard.values():
+            postings.sort()
+    return shards
+
+
+def build_index(docs_dir=DOCS_DIR, force=False, paths=None):
+    """Update docs/search for changed pages. Returns (stats, written paths).
+
+    With paths=None every page is scanned and deleted pages are dropped;
+    otherwise only the given pages are looked at.
+    """
+    docs_dir = Path(docs_dir)
+    search_dir = docs_dir / SEARCH_DIR_NAME
+    shards_dir = search_dir / 'shards'
+    shards_dir.mkdir(parents=True, exist_ok=True)
+
+    cache = load_cache(search_dir)
+    pages = cache['pages']
+    candidates = find_pages(docs_dir) if paths is None else [
+        Path(p) for p in paths if not EXCLUDED_PAGE_PATTERN.search(Path(p).name)]
+    changed_keys = set()
+    reindexed = 0
+
+    for path in candidates:
+        key = path.relative_to(docs_dir).as_posix()
+        if not path.exists():
+            if key in pages:
+                changed_keys.update(shard_key(term) for term in pages.pop(key)['terms'])
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        previous = pages.get(key)
+        if previous and previous['hash'] == digest and not force:
+            continue
+
+        record = extract_page(data.decode('utf-8', errors='replace'))
+        if previous:
+            record['id'] = previous['id']
+            changed_keys.update(shard_key(term) for term in previous['terms'])
+        else:
+            record['id'] = cache['next_id']
+            cache['next_id'] += 1
+        record['hash'] = digest
+        record['section'] = 'Requirements' if key.startswith('RevNovaRequirements/') else 'Onboarding'
+        pages[key] = record
+        changed_keys.update(shard_key(term) for term in record['terms'])
+        reindexed += 1
+
+    if paths is None:
+        live = {path.relative_to(docs_dir).as_posix() for path in candidates}
+        for key in sorted(set(pages) - live):
+            changed_keys.update(shard_key(term) for term in pages.pop(key)['terms'])
+
+    existing_shards = {path.stem for path in shards_dir.glob('*.json')}
+    if force:
+        changed_keys |= existing_shards
+    all_keys = {shard_key(term) for record in pages.values() for term in record['terms']}
+    # Shards missing on disk (first run, or deleted by hand) are rebuilt too
+    changed_keys |= all_keys - existing_shards
+
+    written = []
+    for key in sorted(changed_keys - all_keys):
+        shard_path = shards_dir / f'{key}.json'
+        if shard_path.exists():
+            shard_path.unlink()
+    for key, shard in sorted(build_shards(pages, changed_keys & all_keys).items()):
+        shard_path = shards_dir / f'{key}.json'
+        if _write_if_changed(shard_path, _dump(shard)):
+            written.append(shard_path)
+
+    lengths = [record['length'] for record in pages.values()]
+    meta = {
+        'version': INDEX_VERSION,
+        'prefix': SHARD_PREFIX_LENGTH,
+        'avg_length': round(sum(lengths) / len(lengths), 1) if lengths else 0,
+        'docs': {str(record['id']): [key, record['title'], record['section'], record['excerpt'], record['length']]
+                 for key, record in sorted(pages.items())},
+    }
+    meta_path = search_dir / 'meta.json'
+    if _write_if_changed(meta_path, _dump(meta)):
+        written.append(meta_path)
+
+    if changed_keys or reindexed:
+        with open(search_dir / CACHE_NAME, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, separators=(',', ':'), sort_keys=True)
+
+    index_bytes = sum(path.stat().st_size for path in shards_dir.glob('*.json')) + meta_path.stat().st_size
+    stats = {'pages': len(pages), 'reindexed': reindexed, 'shards': len(all_keys),
+             'shards_written': len([p for p in written if p != meta_path]),
+             'terms': len({term for record in pages.values() for term in record['terms']}),
+             'bytes': index_bytes}
+    return stats, written
+
+
+def render_search_box(page_path, docs_dir=DOCS_DIR, indent='        '):
+    """Search box markup for one page, with the script path relative to it."""
+    script = os.path.relpath(Path(docs_dir) / SEARCH_DIR_NAME / 'search.js', Path(page_path).parent)
+    return (f'{indent}{SEARCH_BOX_START}\n'
+            f'{indent}<div class="docs-search" role="search">\n'
+            f'{indent}    <input type="search" class="docs-search-input" placeholder="Search docs…" '
+            f'aria-label="Search the docs" autocomplete="off">\n'
+            f'{indent}    <div class="docs-search-results" hidden></div>\n'
+            f'{indent}</div>\n'
+            f'{indent}<script src="{Path(script).as_posix()}" defer></script>\n'
+            f'{indent}{SEARCH_BOX_END}\n')
+
+
+def remove_search_box(content):
+    """Drop every search box with its indentation and trailing line break.
+
+    Found with str.find rather than a regex that starts with [ \\t]*, which
+    would start a match attempt at every character of the page.
+    """
+    start = content.find(SEARCH_BOX_START)
+    while start >= 0:
+        end = content.find(SEARCH_BOX_END, start)
+        if end < 0:
+            break
+        end += len(SEARCH_BOX_END)
+        if content.startswith('\n', end):
+            end += 1
+        line_start = start
+        while line_start > 0 and content[line_start - 1] in ' \t':
+            line_start -= 1
+        content = content[:line_start] + content[end:]
+        start = content.find(SEARCH_BOX_START, line_start)
+    return content
+
+
+def add_search_box(page_path, content, docs_dir=DOCS_DIR):
+    """Put the search box into the page header (or at the top of <body> if it has none)."""
+    content = remove_search_box(content)
+    header_right = content.find('<div class="header-right">')
+    header_end = content.find('</header>')
+    if header_right >= 0 and (header_end < 0 or header_right < header_end):
+        insert_at = content.index('\n', header_right) + 1
+        indent = '                '
+    elif header_end >= 0:
+        insert_at = content.rfind('\n', 0, header_end) + 1
+        indent = '        '
+    else:
+        body = re.search(r'<body\b[^>]*>\n?', content)
+        if body is None:
+            return content
+        insert_at = body.end()
+        indent = '    '
+    return content[:insert_at] + render_search_box(page_path, docs_dir, indent) + content[insert_at:]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the client-side docs search index')
+    parser.add_argument('--docs', default=str(DOCS_DIR), help='Docs directory (default: docs/)')
+    parser.add_argument('--force', action='store_true', help='Re-extract every page and rewrite every shard')
+    args = parser.parse_args(argv)
+
+    stats, written = build_index(args.docs, force=args.force)
+    print(f"🔎 Search index: {stats['pages']} pages ({stats['reindexed']} re-indexed), "
+          f"{stats['terms']:,} terms in {stats['shards']} shards ({stats['shards_written']} rewritten), "
+          f"{stats['bytes'] / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -8,8 +8,12 @@ Checks:
 
 import os
 import re
-from pathlib import Path
-from bs4 import BeautifulSoup
+from collections import defaultdict
+
+import docs_content
+import docs_html
+import docs_pages
+import docs_profile
 
 # RevNova Core Requirements (7-Step Migration Wizard)
 REVNOVA_REQUIREMENTS = {
@@ -36,31 +40,13 @@ REVNOVA_REQUIREMENTS = {
     ]
 }
 
-def get_all_day_files():
-    """Get all day files from docs/Onboarding"""
-    docs_dir = Path(__file__).parent.parent / "docs" / "Onboarding"
-    pattern = re.compile(r"dev(\d+)-day(\d+)\.html")
-    
-    files = []
-    for file in docs_dir.glob("dev*-day*.html"):
-        match = pattern.match(file.name)
-        if match:
-            dev = int(match.group(1))
-            day = int(match.group(2))
-            if day >= 6:  # Week 2+ only
-                files.append({
-                    'path': file,
-                    'dev': dev,
-                    'day': day,
-                    'week': ((day - 1) // 5) + 1
-                })
-    
-    return sorted(files, key=lambda x: (x['dev'], x['day']))
+def parse_html(content):
+    """Parse a page into a docs_html DOM (lxml-backed when installed)"""
+    return docs_html.parse(content)
 
-def check_navigation_consistency(file_info):
+def check_navigation_consistency(page):
     """Check if navigation structure is consistent"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f.read(), 'html.parser')
+    soup = parse_html(page.read())
     
     issues = []
     
@@ -70,7 +56,7 @@ def check_navigation_consistency(file_info):
         issues.append("Missing collapsible navigation (has-children)")
     
     # Check for week groupings
-    if file_info['dev'] in [1, 2]:
+    if page.dev in [1, 2]:
         expected_weeks = 5
     else:  # Dev3 has condensed structure
         expected_weeks = 3  # Week 1-2, Week 3-4, Week 5
@@ -94,65 +80,33 @@ def check_navigation_consistency(file_info):
         issues.append(f"Expected ~25 day links, found {len(day_links)}")
     
     return {
-        'file': file_info['path'].name,
+        'file': page.name,
         'issues': issues,
         'status': 'PASS' if not issues else 'ISSUES'
     }
 
-def extract_tasks(file_info):
-    """Extract task content from day file"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        content = f.read()
-        soup = BeautifulSoup(content, 'html.parser')
-    
-    # Extract main content section
-    main = soup.find('main')
-    if not main:
-        return {'tasks': [], 'has_content': False}
-    
-    # Look for task indicators
-    tasks = []
-    
-    # Look for numbered tasks or objectives
-    task_patterns = [
-        re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL),
-        re.compile(r'\d+\.\s+([^\n]+)', re.MULTILINE),
-        re.compile(r'<h3[^>]*>.*?Step \d+:(.*?)</h3>', re.DOTALL)
-    ]
+def extract_tasks(page):
+    """Summarize the task content of a day file from its cached content record"""
+    record = docs_content.record_for(page)
     
-    main_text = main.get_text()
-    
-    # Extract task titles
-    for pattern in task_patterns:
-        matches = pattern.findall(str(main))
-        if matches:
-            tasks.extend([m.strip()[:100] for m in matches if m.strip()])
-    
-    # Check for enhanced Copilot prompt
-    has_copilot_prompt = 'RevNova' in main_text and 'Copilot' in main_text
-    
-    # Check for code examples
-    has_code = bool(soup.find('code') or soup.find('pre'))
-    
-    # Check for acceptance criteria
-    has_acceptance = 'Acceptance Criteria' in main_text or 'acceptance criteria' in main_text
+    # Step titles first, then list items (objectives, checklists)
+    tasks = [title[:100] for _, title in record['steps']] + [task[:100] for task in record['tasks']]
     
     return {
         'tasks': tasks[:10],  # First 10 tasks
         'has_content': len(tasks) > 0,
-        'has_copilot_prompt': has_copilot_prompt,
-        'has_code': has_code,
-        'has_acceptance': has_acceptance,
-        'content_length': len(main_text)
+        'has_copilot_prompt': bool(record['prompts']),
+        'has_code': bool(record['code_blocks'] or record['prompts']),
+        'has_acceptance': bool(record['acceptance_criteria']),
+        'content_length': record['text_length']
     }
 
-def validate_tech_alignment(file_info, tasks_info):
+def validate_tech_alignment(page, tasks_info):
     """Validate if tasks align with RevNova tech stack"""
-    with open(file_info['path'], 'r', encoding='utf-8') as f:
-        content = f.read().lower()
+    content = page.read().lower()
     
-    dev = file_info['dev']
-    week = file_info['week']
+    dev = page.dev
+    week = page.week
     
     expected_tech = []
     found_tech = []
@@ -216,7 +170,7 @@ def generate_report():
     print("=" * 80)
     print()
     
-    files = get_all_day_files()
+    files = docs_pages.find_day_pages(min_day=6)  # Week 2+ only
     print(f"📁 Found {len(files)} day files (Week 2+)")
     print()
     
@@ -224,8 +178,8 @@ def generate_report():
     print("🔍 NAVIGATION AUDIT (Week 2+)")
     print("-" * 80)
     nav_issues = []
-    for file_info in files:
-        result = check_navigation_consistency(file_info)
+    for page in files:
+        result = check_navigation_consistency(page)
         if result['status'] != 'PASS':
             nav_issues.append(result)
             print(f"⚠️  {result['file']}: {len(result['issues'])} issues")
@@ -239,31 +193,26 @@ def generate_report():
     # Task content audit
     print("📝 TASK CONTENT AUDIT")
     print("-" * 80)
-    content_summary = {
-        'dev1': {'total': 0, 'with_content': 0, 'with_code': 0, 'with_acceptance': 0},
-        'dev2': {'total': 0, 'with_content': 0, 'with_code': 0, 'with_acceptance': 0},
-        'dev3': {'total': 0, 'with_content': 0, 'with_code': 0, 'with_acceptance': 0}
-    }
+    content_summary = defaultdict(
+        lambda: {'total': 0, 'with_content': 0, 'with_code': 0, 'with_acceptance': 0})
     
-    for file_info in files:
-        tasks_info = extract_tasks(file_info)
-        dev_key = f"dev{file_info['dev']}"
-        
-        content_summary[dev_key]['total'] += 1
+    for page in files:
+        tasks_info = extract_tasks(page)
+        content_summary[page.dev]['total'] += 1
         if tasks_info['has_content']:
-            content_summary[dev_key]['with_content'] += 1
+            content_summary[page.dev]['with_content'] += 1
         if tasks_info['has_code']:
-            content_summary[dev_key]['with_code'] += 1
+            content_summary[page.dev]['with_code'] += 1
         if tasks_info['has_acceptance']:
-            content_summary[dev_key]['with_acceptance'] += 1
+            content_summary[page.dev]['with_acceptance'] += 1
         
         if not tasks_info['has_content'] or tasks_info['content_length'] < 500:
-            print(f"⚠️  {file_info['path'].name}: Minimal content ({tasks_info['content_length']} chars)")
+            print(f"⚠️  {page.name}: Minimal content ({tasks_info['content_length']} chars)")
     
     print()
-    for dev in ['dev1', 'dev2', 'dev3']:
+    for dev in sorted(content_summary):
         stats = content_summary[dev]
-        print(f"Developer {dev[-1]}:")
+        print(f"Developer {dev}:")
         print(f"  📄 Total files: {stats['total']}")
         print(f"  ✅ With tasks: {stats['with_content']}/{stats['total']}")
         print(f"  💻 With code: {stats['with_code']}/{stats['total']}")
@@ -275,17 +224,17 @@ def generate_report():
     print("-" * 80)
     alignment_issues = []
     
-    for file_info in files:
-        tasks_info = extract_tasks(file_info)
-        tech_result = validate_tech_alignment(file_info, tasks_info)
+    for page in files:
+        tasks_info = extract_tasks(page)
+        tech_result = validate_tech_alignment(page, tasks_info)
         
         if not tech_result['aligned']:
             alignment_issues.append({
-                'file': file_info['path'].name,
+                'file': page.name,
                 'score': tech_result['alignment_score'],
                 'missing': tech_result['missing_tech']
             })
-            print(f"⚠️  {file_info['path'].name}: {tech_result['alignment_score']:.0f}% aligned")
+            print(f"⚠️  {page.name}: {tech_result['alignment_score']:.0f}% aligned")
             if tech_result['missing_tech']:
                 print(f"    Missing: {', '.join(tech_result['missing_tech'][:5])}")
     
@@ -310,4 +259,6 @@ def generate_report():
     print()
 
 if __name__ == "__main__":
-    generate_report()
+    with docs_profile.profile_from_argv():
+        generate_report()
+        docs_content.save()
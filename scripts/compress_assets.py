@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Pre-compress the published docs site for nginx gzip_static / brotli_static.
+
+Writes a .gz (and, when the `brotli` package is installed, a .br) sibling next
+to every HTML/CSS/JS/JSON file under the publish directory (build/docs, which
+nginx serves), at maximum compression. Run it last, after minify_html.py and
+fingerprint_assets.py have written the files nginx will serve. Siblings are
+written to a temp file and renamed into place; recompressing without brotli
+deletes the now-stale .br. A manifest of source hashes
+(build/docs/.precompress-manifest.json) means only files whose content changed
+are recompressed on the next run; siblings of deleted sources are removed.
+
+Usage:
+    python scripts/compress_assets.py
+    python scripts/compress_assets.py --root build/docs/Onboarding --force
+
+Optional dependency for .br output:
+    pip install brotli
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PUBLISH_DIR = Path(__file__).parent.parent / 'build' / 'docs'
+MANIFEST_NAME = '.precompress-manifest.json'
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.json'}
+
+
+def find_assets(root):
+    """Every compressible file under root, skipping hidden files and directories."""
+    assets = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if path.suffix.lower() in COMPRESSIBLE_SUFFIXES and not filename.startswith('.'):
+                assets.append(path)
+    return assets
+
+
+def load_manifest(root):
+    try:
+        with open(root / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(root, manifest):
+    with open(root / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+def gzip_bytes(data):
+    # mtime=0 keeps the output byte-for-byte reproducible between runs.
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(data):
+    return brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+
+def _write_sibling(path, suffix, data):
+    # Written beside the target and renamed over it, so nginx never serves a
+    # half-written sibling.
+    sibling = path.with_name(path.name + suffix)
+    temp_path = sibling.with_name(sibling.name + f'.{os.getpid()}.tmp')
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, sibling)
+    return len(data)
+
+
+def _remove_sibling(path, suffix):
+    try:
+        path.with_name(path.name + suffix).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def compress_file(path, data=None):
+    """Write .gz/.br siblings for one file. Returns (original, gz, br) sizes.
+
+    Without brotli, an existing .br sibling is deleted: it was compressed from
+    an older version of the file and brotli_static would keep serving it.
+    """
+    if data is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+    gz_size = _write_sibling(path, '.gz', gzip_bytes(data))
+    if brotli:
+        br_size = _write_sibling(path, '.br', brotli_bytes(data))
+    else:
+        _remove_sibling(path, '.br')
+        br_size = None
+    return len(data), gz_size, br_size
+
+
+def _sibling_size(path, suffix):
+    try:
+        return path.with_name(path.name + suffix).stat().st_size
+    except FileNotFoundError:
+        return None
+
+
+def compress_tree(root=PUBLISH_DIR, force=False, paths=None):
+    """Compress changed assets under root.
+
+    Returns (stats, compressed, skipped, removed) where stats maps each
+    directory to [files, original bytes, gz bytes, br bytes].
+    """
+    root = Path(root)
+    manifest = load_manifest(root)
+    assets = find_assets(root) if paths is None else [Path(p) for p in paths]
+    stats = defaultdict(lambda: [0, 0, 0, 0])
+    compressed = skipped = 0
+
+    for path in assets:
+        if not path.exists():
+            continue
+        key = path.relative_to(root).as_posix()
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        gz_size = _sibling_size(path, '.gz')
+        br_size = _sibling_size(path, '.br')
+        # Without brotli a leftover .br cannot be checked against the source,
+        # so the file is recompressed (which deletes it).
+        up_to_date = (not force and manifest.get(key) == digest and gz_size is not None
+                      and (br_size is not None) == (brotli is not None))
+        if up_to_date:
+            skipped += 1
+        else:
+            _, gz_size, br_size = compress_file(path, data)
+            manifest[key] = digest
+            compressed += 1
+
+        directory = stats[path.parent.relative_to(root).as_posix()]
+        directory[0] += 1
+        directory[1] += len(data)
+        directory[2] += gz_size
+        directory[3] += br_size or 0
+
+    removed = 0
+    if paths is None:
+        current = {path.relative_to(root).as_posix() for path in assets}
+        for key in sorted(set(manifest) - current):
+            for suffix in ('.gz', '.br'):
+                _remove_sibling(root / key, suffix)
+            del manifest[key]
+            removed += 1
+
+    save_manifest(root, manifest)
+    return dict(stats), compressed, skipped, removed
+
+
+def print_report(stats):
+    """Print compression ratios per directory plus a total line."""
+    header = f"{'Directory':<32} {'Files':>5} {'Original':>11} {'gzip':>11} {'ratio':>6}"
+    if brotli:
+        header += f" {'brotli':>11} {'ratio':>6}"
+    print(header)
+    print('-' * len(header))
+
+    totals = [0, 0, 0, 0]
+    for directory in sorted(stats):
+        files, original, gz_total, br_total = stats[directory]
+        totals = [a + b for a, b in zip(totals, stats[directory])]
+        print(_report_line(directory or '.', files, original, gz_total, br_total))
+    print('-' * len(header))
+    print(_report_line('TOTAL', *totals))
+
+
+def _report_line(label, files, original, gz_total, br_total):
+    line = (f"{label:<32} {files:>5} {original / 1024:>9.1f}KB {gz_total / 1024:>9.1f}KB "
+            f"{original / gz_total if gz_total else 0:>5.1f}x")
+    if brotli:
+        line += f" {br_total / 1024:>9.1f}KB {original / br_total if br_total else 0:>5.1f}x"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write .gz/.br siblings for docs assets')
+    parser.add_argument('--root', default=str(PUBLISH_DIR), help='Directory to compress (default: build/docs)')
+    parser.add_argument('--force', action='store_true', help='Recompress every file, ignoring the manifest')
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"❌ Not a directory: {root} (run minify_html.py first to build the publish directory)")
+        return 1
+
+    if brotli is None:
+        print("⚠️  brotli not installed, writing .gz only (pip install brotli)")
+
+    stats, compressed, skipped, removed = compress_tree(root, force=args.force)
+    print_report(stats)
+    print(f"\n📦 {compressed} compressed, {skipped} unchanged, {removed} stale removed")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Local dev server for the docs site.
+
+Serves docs/ over HTTP, rendering onboarding and requirements pages in memory
+through the docs pipeline transforms (see docs_pipeline.py) instead of
+writing them to disk. Rendered pages are cached until one of their sources
+changes, responses carry an ETag and conditional requests get a 304.
+
+Open pages reload themselves: every HTML response gets a small script that
+listens on /__livereload (Server-Sent Events), and the server pushes a reload
+event whenever the watcher sees a source change.
+
+Usage:
+    python scripts/dev_server.py
+    python scripts/dev_server.py --port 8080 --stages regenerate,copilot-prompts
+"""
+
+import argparse
+import hashlib
+import mimetypes
+import queue
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+import docs_pipeline
+import watch_docs
+
+LIVERELOAD_PATH = '/__livereload'
+
+LIVERELOAD_SNIPPET = (
+    '<script>(function(){var s=new EventSource("' + LIVERELOAD_PATH + '");'
+    's.addEventListener("reload",function(){location.reload();});})();</script>'
+)
+
+
+class PageCache:
+    """In-memory cache of rendered responses keyed by docs path."""
+
+    def __init__(self, stage_names=None):
+        self.stage_names = stage_names
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """Return (body, etag, content_type) for a file under docs/, or None."""
+        stat_key = self._stat_key(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == stat_key:
+                self.hits += 1
+                return entry[1]
+
+        self.misses += 1
+        response = self._render(path)
+        if response is not None:
+            with self._lock:
+                self._entries[path] = (stat_key, response)
+        return response
+
+    def invalidate(self, changed_paths):
+        """Drop cached pages affected by a set of changed source files."""
+        with self._lock:
+            for changed in changed_paths:
+                changed = Path(changed).resolve()
+                if self._is_stage_source(changed):
+                    # Scripts, data and templates feed many pages: start over.
+                    self._entries.clear()
+                    return
+                self._entries.pop(changed, None)
+
+    def _is_stage_source(self, path):
+        relative = docs_pipeline.relative_path(path)
+        return any(relative in stage['sources'] for stage in docs_pipeline.STAGES)
+
+    @staticmethod
+    def _stat_key(path):
+        try:
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _render(self, path):
+        content_type = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        if path.suffix == '.html':
+            html = docs_pipeline.render_page(path, self.stage_names)
+            if html is None:
+                return None
+            if '</body>' in html:
+                html = html.replace('</body>', LIVERELOAD_SNIPPET + '\n</body>', 1)
+            else:
+                html += LIVERELOAD_SNIPPET
+            body = html.encode('utf-8')
+            content_type = 'text/html; charset=utf-8'
+        else:
+            try:
+                with open(path, 'rb') as f:
+                    body = f.read()
+            except (FileNotFoundError, IsADirectoryError):
+                return None
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        return body, etag, content_type
+
+
+class LiveReloadHub:
+    """Fans reload events out to every connected SSE client."""
+
+    def __init__(self):
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        client = queue.Queue()
+        with self._lock:
+            self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self._lock:
+            self._clients.discard(client)
+
+    def publish(self, data):
+        with self._lock:
+            clients = list(self._clients)
+        for client in clients:
+            client.put(data)
+        return len(clients)
+
+
+class DevRequestHandler(BaseHTTPRequestHandler):
+    server_version = 'RevNovaDocsDev/1.0'
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _handle(self, send_body):
+        url_path = unquote(urlsplit(self.path).path)
+        if url_path == LIVERELOAD_PATH:
+            self._stream_events()
+            return
+
+        path = self._resolve(url_path)
+        if path is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        if path.is_dir():
+            if not url_path.endswith('/'):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', url_path + '/')
+                self.end_headers()
+                return
+            path = path / 'index.html'
+
+        response = self.server.cache.get(path)
+        if response is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        body, etag, content_type = response
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _resolve(self, url_path):
+        """Map a URL path onto docs/, refusing anything outside it."""
+        docs_root = docs_pipeline.DOCS_DIR.resolve()
+        path = (docs_root / url_path.lstrip('/')).resolve()
+        if path != docs_root and docs_root not in path.parents:
+            return None
+        return path
+
+    def _stream_events(self):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+
+        client = self.server.hub.subscribe()
+        try:
+            self.wfile.write(b': connected\n\n')
+            self.wfile.flush()
+            while True:
+                try:
+                    data = client.get(timeout=15)
+                    message = f'event: reload\ndata: {data}\n\n'
+                except queue.Empty:
+                    message = ': keep-alive\n\n'
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.hub.unsubscribe(client)
+
+    def log_request(self, code='-', size='-'):
+        if self.path != LIVERELOAD_PATH:
+            sys.stderr.write(f"  {self.command} {self.path} → {int(code)}\n")
+
+    def log_error(self, format, *args):
+        pass
+
+
+class DevServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, stage_names=None):
+        super().__init__(address, DevRequestHandler)
+        self.cache = PageCache(stage_names)
+        self.hub = LiveReloadHub()
+
+
+def watch_sources(server, debounce):
+    """Background loop: invalidate the cache and notify browsers on changes."""
+    watcher = watch_docs.create_watcher(watch_docs.watch_dirs() + [docs_pipeline.DOCS_DIR])
+    while True:
+        changed = watch_docs.wait_for_changes(watcher, debounce)
+        server.cache.invalidate(changed)
+        # The server never writes pages, so a cohort added to the config only
+        # gets a directory once a build runs; pick it up on any later change.
+        watcher.add(watch_docs.watch_dirs())
+        names = ', '.join(sorted(path.name for path in changed))
+        clients = server.hub.publish(names)
+        print(f"🔄 Changed: {names} → reloading {clients} browser(s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the docs site from memory with live reload')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('--stages', help=f"Comma-separated transform stages (default: {','.join(docs_pipeline.DEFAULT_STAGES)})")
+    parser.add_argument('--debounce', type=float, default=0.15, help='Quiet period in seconds before reloading')
+    args = parser.parse_args(argv)
+
+    stage_names = args.stages.split(',') if args.stages else None
+    try:
+        docs_pipeline.select_stages(stage_names)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    server = DevServer((args.host, args.port), stage_names)
+    threading.Thread(target=watch_sources, args=(server, args.debounce), daemon=True).start()
+
+    print(f"🚀 Serving docs/ at http://{args.host}:{args.port}/Onboarding/onboarding-home.html")
+    print("   Pages are rendered in memory; nothing is written to docs/.")
+    print("   Press Ctrl+C to stop.\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        cache = server.cache
+        print(f"\n👋 Stopped ({cache.hits} cache hits, {cache.misses} renders)")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
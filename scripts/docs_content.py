@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Structured content records for the onboarding pages.
+
+extract_record() reads a page once, as a docs_html event stream, and keeps
+what the audits and reports ask about as a plain JSON-serializable dict:
+
+    title                the page <h1>
+    steps                [[number, title], ...] from the "Step N:" headings
+    prompts              Copilot prompt texts
+    code_blocks          [{'file': path or None, 'lines': n, 'head': first line}, ...]
+    files                file paths named in inline <code>
+    tasks                list item texts
+    acceptance_criteria  list items under an "Acceptance Criteria" heading
+    endpoints            'METHOD /api/...' routes mentioned anywhere in the content
+    components           React components (Name.tsx files and <Name> JSX tags)
+    text_length          characters of content text
+
+Like the search index, content starts at <main> (the whole <body> when a
+page has none) and runs to the end of the page, so a stray </div> that makes
+libxml2 close <main> early loses nothing; header, nav, sidebar, breadcrumb,
+prev/next buttons and scripts are skipped.
+
+Records are cached by content hash in .cache/content-records.json, so a page
+is parsed once however many scripts and runs ask about it.
+
+Usage:
+    python scripts/docs_content.py                 # content report for the day pages
+    python scripts/docs_content.py --page docs/Onboarding/dev1-day08.html
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+import docs_html
+import docs_pages
+
+# Bump when extraction changes, so every page is re-extracted.
+CONTENT_VERSION = 1
+CACHE_PATH = docs_pages.INDEX_CACHE_DIR / 'content-records.json'
+# Least recently used records beyond this are dropped when the cache is saved
+MAX_CACHED_RECORDS = 50000
+TEXT_LIMIT = 200
+
+STEP_PATTERN = re.compile(r'\bStep (\d+):\s*(.*)', re.DOTALL)
+ACCEPTANCE_PATTERN = re.compile(r'acceptance criteria', re.IGNORECASE)
+ENDPOINT_PATTERN = re.compile(r'\b(GET|POST|PUT|PATCH|DELETE)\s+(/api/[\w/:{}.\-]*\w)')
+COMPONENT_FILE_PATTERN = re.compile(r'\b([A-Z][A-Za-z0-9]+)\.[jt]sx\b')
+JSX_TAG_PATTERN = re.compile(r'<([A-Z][A-Za-z0-9]+)[\s/>]')
+FILE_PATTERN = re.compile(r'^[\w.\-]+(/[\w.\-\[\]]+)*\.\w+$')
+
+SECTION_HEADINGS = {'h1', 'h2', 'h3', 'h4'}
+BLOCK_TAGS = {'p', 'div', 'li', 'ul', 'ol', 'table', 'tr', 'td', 'th', 'section', 'br', 'pre'} | SECTION_HEADINGS
+
+
+def _clean(text, limit=TEXT_LIMIT):
+    text = ' '.join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + '…'
+
+
+def _unique(items):
+    return list(dict.fromkeys(items))
+
+
+class ContentExtractor:
+    """Build a content record from balanced docs_html events."""
+
+    def __init__(self, has_main):
+        self.has_main = has_main
+        self.main_seen = False
+        self.stack = []
+        self.hidden_depth = 0
+        # Open captures: (kind, depth in stack, text parts)
+        self.captures = []
+        self.prompt_depth = 0
+        self.in_acceptance = False
+        self.last_file = None
+        self.text = []
+        self.record = {'title': '', 'steps': [], 'prompts': [], 'code_blocks': [], 'files': [], 'tasks': [],
+                       'acceptance_criteria': []}
+
+    def feed(self, events):
+        text, start, end = docs_html.TEXT, docs_html.START, docs_html.END
+        for kind, value, attrs in events:
+            if kind == text:
+                self.handle_data(value)
+            elif kind == start:
+                self.handle_starttag(value, attrs)
+            elif kind == end:
+                self.handle_endtag(value)
+
+    @property
+    def active(self):
+        return not self.hidden_depth and (self.main_seen or not self.has_main)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in docs_html.VOID_TAGS:
+            if tag == 'br':
+                self.handle_data(' ')
+            return
+        classes = set(attrs.get('class', '').split())
+        if tag == 'main':
+            self.main_seen = True
+        hidden = (tag in docs_html.SKIPPED_TAGS or tag in docs_html.CHROME_TAGS
+                  or bool(classes & docs_html.SKIPPED_CLASSES))
+        prompt = 'copilot-prompt' in classes
+        self.stack.append((tag, hidden, prompt))
+        if hidden:
+            self.hidden_depth += 1
+            return
+        if prompt:
+            self.prompt_depth += 1
+        if not self.active:
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append(' ')
+        if tag in SECTION_HEADINGS or tag in ('li', 'pre') or (tag == 'code' and not self._capturing('pre')):
+            self.captures.append((tag, len(self.stack), []))
+
+    def handle_endtag(self, tag):
+        if tag in docs_html.VOID_TAGS or not self.stack:
+            return
+        depth = len(self.stack)
+        _, hidden, prompt = self.stack.pop()
+        if hidden:
+            self.hidden_depth -= 1
+            return
+        if self.captures and self.captures[-1][1] == depth:
+            kind, _, parts = self.captures.pop()
+            self._finish(kind, ''.join(parts))
+        if prompt:
+            self.prompt_depth -= 1
+        if self.active and tag in BLOCK_TAGS:
+            self.text.append(' ')
+
+    def handle_data(self, data):
+        if not self.active:
+            return
+        self.text.append(data)
+        for _, _, parts in self.captures:
+            parts.append(data)
+
+    def _capturing(self, kind):
+        return any(capture[0] == kind for capture in self.captures)
+
+    def _finish(self, kind, text):
+        record = self.record
+        if kind in SECTION_HEADINGS:
+            heading = ' '.join(text.split())
+            if kind == 'h1' and not record['title']:
+                record['title'] = heading
+            if self.prompt_depth:
+                return
+            match = STEP_PATTERN.search(heading)
+            if match:
+                record['steps'].append([int(match.group(1)), _clean(match.group(2))])
+            self.in_acceptance = bool(ACCEPTANCE_PATTERN.search(heading))
+        elif kind == 'li':
+            item = _clean(text)
+            if item:
+                record['tasks'].append(item)
+                if self.in_acceptance:
+                    record['acceptance_criteria'].append(item)
+        elif kind == 'pre':
+            if self.prompt_depth:
+                record['prompts'].append(text.strip('\n'))
+            elif text.strip():
+                lines = text.strip('\n').splitlines()
+                record['code_blocks'].append({'file': self.last_file, 'lines': len(lines),
+                                              'head': _clean(lines[0], 80)})
+                self.last_file = None
+        elif kind == 'code':
+            path = text.strip()
+            if FILE_PATTERN.match(path) and ('/' in path or '.' in path[1:]):
+                record['files'].append(path)
+                self.last_file = path
+
+    def result(self):
+        record = self.record
+        text = ''.join(self.text)
+        content = ' '.join(text.split())
+        record['files'] = _unique(record['files'])
+        record['endpoints'] = _unique(f'{method} {path}' for method, path in ENDPOINT_PATTERN.findall(content))
+        record['components'] = _unique(COMPONENT_FILE_PATTERN.findall(content) + JSX_TAG_PATTERN.findall(text))
+        record['text_length'] = len(content)
+        return record
+
+
+def extract_record(content):
+    """The content record of one page's HTML."""
+    extractor = ContentExtractor(has_main='<main' in content)
+    extractor.feed(docs_html.iter_events(content))
+    return extractor.result()
+
+
+class RecordCache:
+    """Content records by page hash, persisted between runs."""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self.records = {}
+        self.dirty = False
+        self.extracted = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        # Backends recover differently from malformed markup
+        if data.get('version') == CONTENT_VERSION and data.get('backend') == docs_html.default_backend():
+            self.records = data['records']
+
+    def get(self, content, digest=None):
+        digest = digest or hashlib.sha256(content.encode('utf-8')).hexdigest()
+        record = self.records.pop(digest, None)
+        if record is None:
+            record = extract_record(content)
+            self.extracted += 1
+            self.dirty = True
+        # Re-inserted at the end: dict order is the LRU order
+        self.records[digest] = record
+        return record
+
+    def save(self):
+        if not self.dirty:
+            return
+        while len(self.records) > MAX_CACHED_RECORDS:
+            del self.records[next(iter(self.records))]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': CONTENT_VERSION, 'backend': docs_html.default_backend(), 'records': self.records}
+        temp_path = self.path.with_name(self.path.name + f'.{os.getpid()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+
+_cache = None
+
+
+def cache():
+    global _cache
+    if _cache is None:
+        _cache = RecordCache()
+    return _cache
+
+
+def record_for(page):
+    """Content record of a DayPage (or any object with read() and sha256)."""
+    content = page.read()
+    return cache().get(content, page.sha256)
+
+
+def record_for_path(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return cache().get(f.read())
+
+
+def save():
+    """Persist records extracted by this process. Scripts call this once at the end."""
+    if _cache is not None:
+        _cache.save()
+
+
+def print_report(pages):
+    """Content totals per developer and week."""
+    totals = defaultdict(lambda: defaultdict(int))
+    endpoints = defaultdict(set)
+    components = defaultdict(set)
+    for page in pages:
+        record = record_for(page)
+        row = totals[(page.dev, page.week)]
+        row['pages'] += 1
+        for field in ('steps', 'prompts', 'code_blocks', 'acceptance_criteria'):
+            row[field] += len(record[field])
+        endpoints[page.dev].update(record['endpoints'])
+        components[page.dev].update(record['components'])
+
+    print("=" * 78)
+    print("ONBOARDING CONTENT REPORT")
+    print("=" * 78)
+    print(f"{'Developer':<10} {'Week':>4} {'Pages':>6} {'Steps':>6} {'Prompts':>8} {'Code':>6} {'Criteria':>9}")
+    for (dev, week), row in sorted(totals.items()):
+        print(f"{'dev' + str(dev):<10} {week:>4} {row['pages']:>6} {row['steps']:>6} {row['prompts']:>8} "
+              f"{row['code_blocks']:>6} {row['acceptance_criteria']:>9}")
+    for dev in sorted(endpoints):
+        print(f"\n🔌 dev{dev}: {len(endpoints[dev])} endpoints, {len(components[dev])} components")
+        for endpoint in sorted(endpoints[dev])[:8]:
+            print(f"   {endpoint}")
+        if components[dev]:
+            print(f"   components: {', '.join(sorted(components[dev])[:12])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Extract structured content records from the onboarding pages')
+    parser.add_argument('--page', help='Print the record of one page as JSON')
+    parser.add_argument('--min-day', type=int, default=1, help='First day included in the report (default: 1)')
+    args = parser.parse_args(argv)
+
+    if args.page:
+        print(json.dumps(record_for_path(args.page), indent=1, ensure_ascii=False))
+    else:
+        print_report(docs_pages.find_day_pages(min_day=args.min_day))
+    save()
+
+
+if __name__ == '__main__':
+    main()
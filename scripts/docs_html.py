@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Shared HTML parsing for the docs scripts.
+
+Two layers over one tokenizer:
+
+    iter_events(html)   streaming (kind, value, attrs) events:
+                          (START, tag, {attr: value})
+                          (END, tag, None)
+                          (TEXT, text, None)      character references decoded;
+                                                  a run may arrive in pieces
+                          (COMMENT, text, None)
+    parse(html)         a small DOM of Element nodes (find, find_all, text,
+                        html), enough for the audits
+
+The event stream is balanced whatever the page looks like: void elements
+(<br>, <img>, ...) get their END right after START, elements whose end tag
+is optional (<li>, <p>, ...) are closed implicitly, stray end tags (an extra
+</div> is common in these pages) never unbalance it and anything still open
+is closed at the end.
+
+Backends:
+    lxml     libxml2's HTML parser (C), used when lxml is installed
+    stdlib   html.parser, always available
+
+Both yield the same text. They differ in how they recover from malformed
+markup: libxml2 lets a stray end tag close the elements opened after its
+match, as browsers do, and adds or drops html/head/body wrappers, while the
+stdlib path drops the stray tag. --bench counts the pages whose element
+structure differs between backends; consumers must not depend on where a
+malformed element closes.
+
+The rewriting scripts keep their regex splicing: they must leave every byte
+they do not touch as it was, which no parser round-trip guarantees.
+
+Usage:
+    python scripts/docs_html.py --bench
+    python scripts/docs_html.py --bench --corpora real,10x --repeat 3
+"""
+
+import argparse
+import html as html_lib
+import importlib.util
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+
+DOCS_DIR = Path(__file__).parent.parent / 'docs'
+
+START, END, TEXT, COMMENT = 'start', 'end', 'text', 'comment'
+# Tag of the root node parse() returns
+DOCUMENT = '#document'
+
+VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                       'source', 'track', 'wbr'})
+IMPLIED_END_TAGS = frozenset({'p', 'li', 'dt', 'dd', 'tr', 'td', 'th', 'option'})
+RAW_TEXT_TAGS = frozenset({'script', 'style'})
+# Wrappers libxml2 synthesizes (or merges) when a page is malformed
+DOCUMENT_TAGS = frozenset({'html', 'head', 'body'})
+
+# Page content extraction (docs_content, build_search_index): elements whose text is never content
+SKIPPED_TAGS = frozenset({'script', 'style', 'svg', 'noscript', 'template'})
+CHROME_TAGS = frozenset({'header', 'nav', 'aside', 'footer'})
+# Page furniture inside <main>: breadcrumbs, prev/next buttons, the sidebar, the search box
+SKIPPED_CLASSES = frozenset({'breadcrumb', 'nav-buttons', 'sidebar', 'docs-search'})
+
+# Fastest first; the first one that imports is the default
+BACKEND_ORDER = ['lxml', 'stdlib']
+CHUNK_SIZE = 64 * 1024
+
+
+def _attr_dict(attrs):
+    attrs = dict(attrs)
+    if None in attrs.values():
+        # Boolean attributes (<input hidden>) read as '' like libxml2's
+        attrs = {name: value or '' for name, value in attrs.items()}
+    return attrs
+
+
+class _StdlibTokenizer(HTMLParser):
+    """html.parser events, balanced the way libxml2 balances them."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.events = []
+        self.open = []
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append((START, tag, _attr_dict(attrs)))
+        if tag in VOID_TAGS:
+            self.events.append((END, tag, None))
+        else:
+            self.open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <path ... /> inside inline SVG: complete on its own
+        self.events.append((START, tag, _attr_dict(attrs)))
+        self.events.append((END, tag, None))
+
+    def handle_endtag(self, tag):
+        if self.open and self.open[-1] == tag:
+            self.events.append((END, self.open.pop(), None))
+            return
+        if tag in VOID_TAGS:
+            return
+        depth = len(self.open)
+        while depth and self.open[depth - 1] != tag and self.open[depth - 1] in IMPLIED_END_TAGS:
+            depth -= 1
+        if not depth or self.open[depth - 1] != tag:
+            return
+        while len(self.open) >= depth:
+            self.events.append((END, self.open.pop(), None))
+
+    def handle_data(self, data):
+        self.events.append((TEXT, data, None))
+
+    def handle_comment(self, data):
+        self.events.append((COMMENT, data, None))
+
+    def push(self, data):
+        self.feed(data)
+        events, self.events = self.events, []
+        return events
+
+    def finish(self):
+        self.close()
+        while self.open:
+            self.events.append((END, self.open.pop(), None))
+        events, self.events = self.events, []
+        return events
+
+
+class _LxmlTarget:
+    """Parser target collecting libxml2's (already balanced) events."""
+
+    def __init__(self):
+        self.events = []
+
+    def start(self, tag, attrib):
+        self.events.append((START, tag, dict(attrib)))
+
+    def end(self, tag):
+        self.events.append((END, tag, None))
+
+    def data(self, data):
+        self.events.append((TEXT, data, None))
+
+    def comment(self, text):
+        self.events.append((COMMENT, text, None))
+
+    def close(self):
+        return None
+
+
+class _LxmlTokenizer:
+    def __init__(self):
+        from lxml import etree
+        self.target = _LxmlTarget()
+        self.parser = etree.HTMLParser(target=self.target)
+
+    def push(self, data):
+        self.parser.feed(data)
+        events, self.target.events = self.target.events, []
+        return events
+
+    def finish(self):
+        self.parser.close()
+        events, self.target.events = self.target.events, []
+        return events
+
+
+TOKENIZERS = {'lxml': _LxmlTokenizer, 'stdlib': _StdlibTokenizer}
+_REQUIRES = {'lxml': 'lxml'}
+_default_backend = None
+
+
+def available_backends():
+    """Backends whose dependencies are installed, fastest first."""
+    return [name for name in BACKEND_ORDER
+            if name not in _REQUIRES or importlib.util.find_spec(_REQUIRES[name]) is not None]
+
+
+def default_backend():
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = available_backends()[0]
+    return _default_backend
+
+
+def iter_events(source, backend=None, chunk_size=CHUNK_SIZE):
+    """Iterate balanced (kind, value, attrs) events for an HTML string or text file object.
+
+    File objects are read chunk by chunk, so a page never has to be held in
+    memory whole; events are yielded as each chunk is tokenized.
+    """
+    name = backend or default_backend()
+    if name not in TOKENIZERS:
+        raise ValueError(f"Unknown HTML backend '{name}' (choose from {', '.join(TOKENIZERS)})")
+    tokenizer = TOKENIZERS[name]()
+    if isinstance(source, str):
+        events = tokenizer.push(source)
+        events.extend(tokenizer.finish())
+        return iter(events)
+    return _iter_chunks(tokenizer, source, chunk_size)
+
+
+def _iter_chunks(tokenizer, source, chunk_size):
+    for chunk in iter(lambda: source.read(chunk_size), ''):
+        yield from tokenizer.push(chunk)
+    yield from tokenizer.finish()
+
+
+class Element:
+    """One element of a parsed page. Text children are plain strings."""
+
+    __slots__ = ('tag', 'attrs', 'children', 'parent')
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+
+    def __repr__(self):
+        return f'<Element {self.tag} {self.attrs!r}>' if self.attrs else f'<Element {self.tag}>'
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    @property
+    def classes(self):
+        return self.attrs.get('class', '').split()
+
+    def iter(self, tag=None):
+        """This element and every element below it, in document order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if tag is None or node.tag == tag:
+                yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, Element))
+
+    def find_all(self, tag=None, class_=None, limit=None, **attrs):
+        """Descendant elements matching tag, a class name and attribute filters.
+
+        An attribute filter is a string (equal), True (present) or a compiled
+        regex (searched), as in BeautifulSoup.
+        """
+        found = []
+        nodes = self.iter(tag)
+        if tag is None or self.tag == tag:
+            next(nodes)  # never self
+        for node in nodes:
+            if class_ is not None and class_ not in node.classes:
+                continue
+            if any(not _attr_matches(node.attrs.get(name), wanted) for name, wanted in attrs.items()):
+                continue
+            found.append(node)
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def find(self, tag=None, class_=None, **attrs):
+        found = self.find_all(tag, class_, limit=1, **attrs)
+        return found[0] if found else None
+
+    def text(self):
+        """All text below this element, concatenated."""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return ''.join(parts)
+
+    def html(self):
+        """Serialize this element (attributes double-quoted, text re-escaped)."""
+        if self.tag == DOCUMENT:
+            return self.inner_html()
+        parts = []
+        _serialize(self, parts)
+        return ''.join(parts)
+
+    def inner_html(self):
+        parts = []
+        for child in self.children:
+            _serialize(child, parts, self.tag in RAW_TEXT_TAGS)
+        return ''.join(parts)
+
+
+def _attr_matches(value, wanted):
+    if wanted is True:
+        return value is not None
+    if value is None:
+        return False
+    if hasattr(wanted, 'search'):
+        return wanted.search(value) is not None
+    return value == wanted
+
+
+def _serialize(node, parts, raw=False):
+    if isinstance(node, str):
+        parts.append(node if raw else html_lib.escape(node, quote=False))
+        return
+    attrs = ''.join(f' {name}="{html_lib.escape(value)}"' for name, value in node.attrs.items())
+    parts.append(f'<{node.tag}{attrs}>')
+    if node.tag in VOID_TAGS:
+        return
+    for child in node.children:
+        _serialize(child, parts, node.tag in RAW_TEXT_TAGS)
+    parts.append(f'</{node.tag}>')
+
+
+def parse(source, backend=None):
+    """Parse an HTML string or text file object into a DOCUMENT Element."""
+    document = Element(DOCUMENT)
+    node = document
+    for kind, value, attrs in iter_events(source, backend):
+        if kind == START:
+            child = Element(value, attrs, node)
+            node.children.append(child)
+            node = child
+        elif kind == END:
+            node = node.parent or document
+        elif kind == TEXT:
+            if node.children and isinstance(node.children[-1], str):
+                node.children[-1] += value
+            else:
+                node.children.append(value)
+    return document
+
+
+def _load_corpus(corpus, tmp):
+    """Return the HTML pages of a corpus: 'real' (docs/) or a synthetic preset."""
+    if corpus == 'real':
+        root = DOCS_DIR
+    else:
+        import benchmark_docs
+        workspace = Path(tmp) / corpus
+        workspace.mkdir()
+        benchmark_docs.prepare_workspace(corpus, workspace, report=lambda message: None)
+        root = workspace / 'docs'
+    pages = []
+    for path in sorted(root.rglob('*.html')):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    return pages
+
+
+def _signature(events):
+    """Element structure and normalized text, for comparing backends."""
+    tags = [(kind, value) for kind, value, _ in events if kind in (START, END) and value not in DOCUMENT_TAGS]
+    text = ' '.join(''.join(value for kind, value, _ in events if kind == TEXT).split())
+    return tags, text
+
+
+def benchmark(corpora, backends=None, repeat=3, report=print):
+    """Parse throughput per corpus and backend. Returns a list of result dicts."""
+    import tempfile
+
+    backends = backends or available_backends()
+    results = []
+    with tempfile.TemporaryDirectory(prefix='revnova-html-bench-') as tmp:
+        for corpus in corpora:
+            pages = _load_corpus(corpus, tmp)
+            size = sum(len(page.encode('utf-8')) for page in pages)
+            report(f"\n📚 {corpus}: {len(pages)} pages, {size / 1024 / 1024:.1f} MB")
+            reference = None
+            for backend in backends:
+                timings = {}
+                for mode, run in (('events', lambda page: sum(1 for _ in iter_events(page, backend))),
+                                  ('dom', lambda page: parse(page, backend))):
+                    best = None
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        for page in pages:
+                            run(page)
+                        elapsed = time.perf_counter() - start
+                        best = elapsed if best is None else min(best, elapsed)
+                    timings[mode] = best
+                signatures = [_signature(list(iter_events(page, backend))) for page in pages]
+                if reference is None:
+                    reference, mismatches = signatures, 0
+                else:
+                    mismatches = sum(1 for a, b in zip(reference, signatures) if a != b)
+                result = {'corpus': corpus, 'backend': backend, 'pages': len(pages), 'bytes': size,
+                          'events_mb_s': size / 1e6 / timings['events'], 'dom_mb_s': size / 1e6 / timings['dom'],
+                          'mismatched_pages': mismatches}
+                results.append(result)
+                agreement = '' if backend == backends[0] else (
+                    f"  (structure differs from {backends[0]} on {mismatches} malformed page(s))" if mismatches
+                    else f"  (same as {backends[0]})")
+                report(f"  {backend:<8} events {result['events_mb_s']:6.1f} MB/s   "
+                       f"DOM {result['dom_mb_s']:6.1f} MB/s{agreement}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Shared HTML parsing layer for the docs scripts')
+    parser.add_argument('--bench', action='store_true', help='Measure parse throughput per backend')
+    parser.add_argument('--corpora', default='real,1x',
+                        help='Comma-separated corpora for --bench: real and/or synthetic presets (default: real,1x)')
+    parser.add_argument('--backends', help=f"Comma-separated backends (default: every installed one of {', '.join(BACKEND_ORDER)})")
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the fastest is kept (default: 3)')
+    args = parser.parse_args(argv)
+
+    installed = available_backends()
+    if not args.bench:
+        print(f"HTML backends: {', '.join(installed)} (default: {default_backend()})")
+        missing = [name for name in BACKEND_ORDER if name not in installed]
+        if missing:
+            print(f"Not installed: {', '.join(missing)} (pip install {' '.join(_REQUIRES[name] for name in missing)})")
+        return 0
+
+    backends = args.backends.split(',') if args.backends else installed
+    unknown = [name for name in backends if name not in installed]
+    if unknown:
+        print(f"❌ Backend(s) not available: {', '.join(unknown)}")
+        return 1
+    print(f"⏱  HTML parse throughput, best of {args.repeat}")
+    benchmark(args.corpora.split(','), backends, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Typed page model for the onboarding day pages (dev<N>-day<NN>.html).
+
+DayPage is a slotted record of path, developer, day and week; the content
+hash is filled in lazily. Page text is not kept on the page; a small LRU
+serves the repeated reads of the checks that run back to back on one page.
+What a page is made of (steps, prompts, code blocks) is docs_content's job.
+
+A DayPage is 72 bytes plus its Path (a dict with the same fields is 184),
+so tens of thousands of pages fit in a few MB; page text is only held for
+the pages in use.
+
+Page discovery goes through a persistent corpus index of every .html page
+under docs/: path, page kind, developer, day, week, size, mtime and content
+hash. Each query refreshes it with one stat-only walk of the tree, so
+scripts no longer glob and regex-match file names themselves; content hashes
+are computed only when asked for, and only for new or changed pages. The
+index lives in .cache/ at the repo root, outside docs/, so it never counts as
+a docs change.
+
+Usage:
+    import docs_pages
+    for page in docs_pages.find_day_pages(min_day=6):
+        print(page.name, page.dev, page.week)
+    docs_pages.list_pages(docs_pages.REQUIREMENTS_DIR)
+
+    python scripts/docs_pages.py            # index summary by page kind
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DIR = REPO_ROOT / 'docs'
+ONBOARDING_DIR = DOCS_DIR / 'Onboarding'
+REQUIREMENTS_DIR = DOCS_DIR / 'RevNovaRequirements'
+INDEX_CACHE_DIR = REPO_ROOT / '.cache'
+INDEX_VERSION = 1
+
+DAY_PAGE_PATTERN = re.compile(r'dev(\d+)-day(\d+)\.html')
+WEEK_PAGE_PATTERN = re.compile(r'dev(\d+)-week(\d+)\.html')
+LEGACY_PAGE_PATTERN = re.compile(r'(-OLD|\.backup)\.html$')
+# Kind of the pages that are neither day, week nor legacy pages, by top-level docs directory
+SECTION_KINDS = {'Onboarding': 'onboarding', 'RevNovaRequirements': 'requirements'}
+DAYS_PER_WEEK = 5
+# Decoded page texts kept for back-to-back reads of the same page
+TEXT_CACHE_PAGES = 64
+
+
+def week_of(day):
+    return (day - 1) // DAYS_PER_WEEK + 1
+
+
+def find_indented(pattern, content, pos=0, endpos=None, newline=False):
+    """(start, end) of the first match of `pattern` in content[pos:endpos], widened back
+    over the indentation before it (and with newline=True one line break), or None.
+
+    Same span as prefixing the pattern with [ \\t]* (or \\n?[ \\t]*), but a pattern
+    that starts with a literal is searched for directly instead of the engine
+    trying a match at every character of the page.
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.DOTALL)
+    match = pattern.search(content, pos, len(content) if endpos is None else endpos)
+    if match is None:
+        return None
+    return _widen(content, match.start(), pos, newline), match.end()
+
+
+def _widen(content, start, floor, newline):
+    while start > floor and content[start - 1] in ' \t':
+        start -= 1
+    if newline and start > floor and content[start - 1] == '\n':
+        start -= 1
+    return start
+
+
+def sub_indented(pattern, repl, content, count=0, newline=False):
+    """re.sub() with every match widened as in find_indented(). `repl` is a template
+    string (backslash escapes and group references, as in re.sub) or a function of the match."""
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.DOTALL)
+    parts = []
+    last = 0
+    for number, match in enumerate(pattern.finditer(content)):
+        if count and number >= count:
+            break
+        parts.append(content[last:_widen(content, match.start(), last, newline)])
+        parts.append(repl(match) if callable(repl) else match.expand(repl))
+        last = match.end()
+    if not parts:
+        return content
+    parts.append(content[last:])
+    return ''.join(parts)
+
+
+_text_cache = OrderedDict()
+
+
+class DayPage:
+    """One onboarding day page. The content hash is computed on first use."""
+
+    __slots__ = ('path', 'dev', 'day', 'week', '_sha256')
+
+    def __init__(self, path, dev, day):
+        self.path = Path(path)
+        self.dev = dev
+        self.day = day
+        self.week = week_of(day)
+        self._sha256 = None
+
+    def __repr__(self):
+        return f'<DayPage dev{self.dev} day{self.day} week{self.week} {self.path}>'
+
+    @property
+    def name(self):
+        return self.path.name
+
+    def read(self):
+        """The page text. Served from a small LRU while the file is unchanged."""
+        stat = os.stat(self.path)
+        key = (str(self.path), stat.st_mtime_ns, stat.st_size)
+        entry = _text_cache.get(key)
+        if entry is None:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            entry = _text_cache[key] = (data.decode('utf-8'), hashlib.sha256(data).hexdigest())
+            if len(_text_cache) > TEXT_CACHE_PAGES:
+                _text_cache.popitem(last=False)
+        else:
+            _text_cache.move_to_end(key)
+        self._sha256 = entry[1]
+        return entry[0]
+
+    @property
+    def sha256(self):
+        if self._sha256 is None:
+            self.read()
+        return self._sha256
+
+
+def day_page(path):
+    """DayPage for a dev<N>-day<NN>.html path, or None for any other file."""
+    match = DAY_PAGE_PATTERN.fullmatch(Path(path).name)
+    if not match:
+        return None
+    return DayPage(path, int(match.group(1)), int(match.group(2)))
+
+
+def page_kind(relative):
+    """(kind, dev, day, week) of a page from its path relative to the docs root."""
+    name = relative.rpartition('/')[2]
+    match = DAY_PAGE_PATTERN.fullmatch(name)
+    if match:
+        day = int(match.group(2))
+        return 'day', int(match.group(1)), day, week_of(day)
+    match = WEEK_PAGE_PATTERN.fullmatch(name)
+    if match:
+        return 'week', int(match.group(1)), None, int(match.group(2))
+    if LEGACY_PAGE_PATTERN.search(name):
+        return 'legacy', None, None, None
+    return SECTION_KINDS.get(relative.partition('/')[0], 'site'), None, None, None
+
+
+class PageEntry:
+    """One page in the corpus index. sha256 is None until hashed."""
+
+    __slots__ = ('root', 'relative', 'kind', 'dev', 'day', 'week', 'size', 'mtime_ns', 'sha256')
+
+    def __init__(self, root, relative, size, mtime_ns, sha256=None):
+        self.root = root
+        self.relative = relative
+        self.kind, self.dev, self.day, self.week = page_kind(relative)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.sha256 = sha256
+
+    def __repr__(self):
+        return f'<PageEntry {self.kind} {self.relative}>'
+
+    @property
+    def path(self):
+        return self.root / self.relative
+
+    @property
+    def directory(self):
+        return self.relative.rpartition('/')[0]
+
+    def day_page(self):
+        return DayPage(self.path, self.dev, self.day)
+
+
+def default_cache_path(root):
+    digest = hashlib.sha1(str(Path(root).resolve()).encode('utf-8')).hexdigest()[:12]
+    return INDEX_CACHE_DIR / f'corpus-index-{digest}.json'
+
+
+class CorpusIndex:
+    """Every .html page under a docs root, kept current by stat-only refreshes."""
+
+    def __init__(self, root=DOCS_DIR, cache_path=None):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path else default_cache_path(self.root)
+        self.entries = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get('version') != INDEX_VERSION or data.get('root') != str(self.root.resolve()):
+            return
+        for relative, (size, mtime_ns, sha256) in data['pages'].items():
+            self.entries[relative] = PageEntry(self.root, relative, size, mtime_ns, sha256)
+
+    def save(self):
+        """Write the index when a refresh or hash changed it."""
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'root': str(self.root.resolve()),
+            'pages': {relative: [entry.size, entry.mtime_ns, entry.sha256]
+                      for relative, entry in sorted(self.entries.items())},
+        }
+        temp_path = self.cache_path.with_name(self.cache_path.name + f'.{os.getpid()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, self.cache_path)
+        self.dirty = False
+
+    def refresh(self):
+        """Walk the tree with one stat per page. Returns (added, changed, removed) counts.
+
+        Pages whose size or mtime changed keep their entry but lose their hash.
+        Dot-files and dot-directories (transaction staging, caches) are skipped.
+        """
+        seen = set()
+        added = changed = 0
+        stack = [(str(self.root), '')]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                items = os.scandir(directory)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with items:
+                for item in items:
+                    if item.name.startswith('.'):
+                        continue
+                    if item.is_dir():
+                        stack.append((item.path, prefix + item.name + '/'))
+                        continue
+                    if not item.name.endswith('.html'):
+                        continue
+                    stat = item.stat()
+                    relative = prefix + item.name
+                    seen.add(relative)
+                    entry = self.entries.get(relative)
+                    if entry is None:
+                        self.entries[relative] = PageEntry(self.root, relative, stat.st_size, stat.st_mtime_ns)
+                        added += 1
+                    elif entry.size != stat.st_size or entry.mtime_ns != stat.st_mtime_ns:
+                        entry.size, entry.mtime_ns, entry.sha256 = stat.st_size, stat.st_mtime_ns, None
+                        changed += 1
+        removed = self.entries.keys() - seen
+        for relative in removed:
+            del self.entries[relative]
+        if added or changed or removed:
+            self.dirty = True
+        return added, changed, len(removed)
+
+    def hash(self, entry):
+        """Content hash of an entry, read from disk only when the stored one is stale."""
+        if entry.sha256 is None:
+            with open(entry.path, 'rb') as f:
+                entry.sha256 = hashlib.sha256(f.read()).hexdigest()
+            self.dirty = True
+        return entry.sha256
+
+    def pages(self, directory=None, kinds=None):
+        """Entries directly in directory (anywhere when None) of the given kinds, sorted by path."""
+        if directory is not None:
+            directory = os.path.relpath(directory, self.root).replace(os.sep, '/')
+            directory = '' if directory == '.' else directory
+        entries = [entry for entry in self.entries.values()
+                   if (directory is None or entry.directory == directory)
+                   and (kinds is None or entry.kind in kinds)]
+        return sorted(entries, key=lambda entry: entry.relative)
+
+
+_indexes = {}
+
+
+def _root_for(directory):
+    """docs/ for directories inside it; any other tree is indexed on its own."""
+    directory = Path(directory)
+    docs = DOCS_DIR.resolve()
+    resolved = directory.resolve()
+    return DOCS_DIR if resolved == docs or docs in resolved.parents else directory
+
+
+def corpus(root=DOCS_DIR):
+    """The process-wide index of root, refreshed against the tree and saved if it changed."""
+    key = Path(root).resolve()
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = CorpusIndex(root)
+    index.refresh()
+    index.save()
+    return index
+
+
+def list_pages(directory, kinds=None):
+    """Paths of the .html pages directly in directory, sorted; like sorted(directory.glob('*.html'))."""
+    return [entry.path for entry in corpus(_root_for(directory)).pages(directory, kinds)]
+
+
+def find_day_pages(onboarding_dir=ONBOARDING_DIR, min_day=1, dev=None):
+    """Day pages directly in onboarding_dir from min_day on, sorted by developer and day."""
+    entries = corpus(_root_for(onboarding_dir)).pages(onboarding_dir, kinds=('day',))
+    pages = [entry.day_page() for entry in entries
+             if entry.day >= min_day and (dev is None or entry.dev == dev)]
+    return sorted(pages, key=lambda page: (page.dev, page.day))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Refresh the docs corpus index and summarize it')
+    parser.add_argument('--root', default=str(DOCS_DIR), help='Docs tree to index (default: docs/)')
+    parser.add_argument('--hash', action='store_true', help='Also hash every new or changed page')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = CorpusIndex(args.root)
+    loaded = len(index.entries)
+    added, changed, removed = index.refresh()
+    refreshed = time.perf_counter()
+    if args.hash:
+        for entry in index.entries.values():
+            index.hash(entry)
+    index.save()
+    end = time.perf_counter()
+
+    print(f"📚 {len(index.entries)} pages under {args.root} ({loaded} cached, {added} added, "
+          f"{changed} changed, {removed} removed)")
+    print(f"   refresh {(refreshed - start) * 1000:.0f} ms" +
+          (f", hashing {(end - refreshed) * 1000:.0f} ms" if args.hash else ''))
+    kinds = Counter(entry.kind for entry in index.entries.values())
+    for kind, count in kinds.most_common():
+        size = sum(entry.size for entry in index.entries.values() if entry.kind == kind)
+        print(f"   {kind:<13} {count:>7} pages {size / 1024 / 1024:>8.1f} MB")
+    print(f"   index: {index.cache_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,486 @@
+"""
+Build pipeline for the docs site.
+
+Describes each docs build step (page regeneration, sidebar updates, fixers,
+Copilot prompts, task status, audits) as a stage. Rewriting stages expose a
+pure per-page transform, so the same stage can write pages to docs/ or
+render them in memory (see dev_server.py).
+
+run_pipeline() takes a set of changed paths and reruns only the affected
+stages, and only for the affected pages where the stage allows it. Pages
+written by one stage are fed to the stages after it.
+"""
+
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+import docs_content
+import docs_pages
+import docs_profile
+import docs_writer
+
+REPO_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = REPO_ROOT / 'scripts'
+DOCS_DIR = REPO_ROOT / 'docs'
+ONBOARDING_DIR = DOCS_DIR / 'Onboarding'
+REQUIREMENTS_DIR = DOCS_DIR / 'RevNovaRequirements'
+
+_script_cache = {}
+
+
+def load_script(filename):
+    """Import a script from scripts/ by file name (hyphenated names included).
+
+    Scripts are re-imported when their file changes on disk, so a long-running
+    watcher always runs the current version.
+    """
+    path = SCRIPTS_DIR / filename
+    mtime = path.stat().st_mtime_ns
+    cached = _script_cache.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    module_name = '_docs_script_' + path.stem.replace('-', '_')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _script_cache[filename] = (mtime, module)
+    return module
+
+
+def _parse_day_page(path):
+    """Return (dev_prefix, day) for dev<N>-day<NN>.html, else None."""
+    page = docs_pages.day_page(path)
+    return (f'dev{page.dev}', page.day) if page else None
+
+
+def _read_text(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+_regenerate_context = {}
+
+
+def _regenerate_inputs(module):
+    """Per-cohort base pages and the day-page index for regenerate.
+
+    Cached per template and cohort config version, so the template is parsed
+    and each cohort's sidebar rendered once for all of its pages.
+    """
+    key = (id(module), module.TEMPLATE_PATH.stat().st_mtime_ns, Path(module.CONFIG_PATH).stat().st_mtime_ns)
+    if key not in _regenerate_context:
+        _regenerate_context.clear()
+        cohorts = module.load_cohorts()
+        parsed = module.parse_template(_read_text(module.TEMPLATE_PATH))
+        bases = {cohort['id']: module.build_cohort_base(parsed, cohort) for cohort in cohorts}
+        index = {relative_path(module.day_page_path(entry[0], entry[1], entry[4])): entry
+                 for entry in module.iter_day_pages(cohorts)}
+        _regenerate_context[key] = (bases, index)
+    return _regenerate_context[key]
+
+
+# ---------------------------------------------------------------------------
+# Page transforms. Each takes (path, current content or None) and returns the
+# new content; returning the content unchanged means "nothing to do".
+# ---------------------------------------------------------------------------
+
+def transform_regenerate(path, content):
+    module = load_script('regenerate_all_pages.py')
+    bases, index = _regenerate_inputs(module)
+    entry = index.get(relative_path(path))
+    if entry is None:
+        return content
+    return module.render_day_page(bases[entry[0]['id']], *entry, content)
+
+
+def regenerate_targets():
+    module = load_script('regenerate_all_pages.py')
+    return [REPO_ROOT / relative for relative in _regenerate_inputs(module)[1]]
+
+
+def transform_update_sidebars(path, content):
+    module = load_script('update-sidebars.py')
+    path = Path(path)
+    if content is None or path.name in ('requirements-home.html', 'onboarding-home.html'):
+        return content
+    sidebar = module.REQUIREMENTS_SIDEBAR if path.parent.name == REQUIREMENTS_DIR.name else module.ONBOARDING_SIDEBAR
+    return module.replace_sidebar(content, sidebar)
+
+
+def transform_requirements_sidebar(path, content):
+    if content is None:
+        return content
+    return load_script('fix-requirements-sidebar-final.py').fix_requirements_content(content)
+
+
+def transform_copilot_prompts(path, content):
+    module = load_script('add-copilot-prompts.py')
+    prompts = module.load_prompts().get(Path(path).stem)
+    if content is None or not prompts:
+        return content
+    return module.insert_prompts(content, prompts)
+
+
+def transform_task_status(path, content):
+    module = load_script('update-task-completion-status.py')
+    parsed = _parse_day_page(path)
+    status = module.TASK_STATUS.get(parsed[0], {}).get(parsed[1]) if parsed else None
+    if content is None or not status:
+        return content
+    updated = module.apply_status_badge(content, status)
+    return content if updated is None else updated
+
+
+def transform_css_double_semicolon(path, content):
+    if content is None:
+        return content
+    return load_script('fix-css-double-semicolon.py').fix_css_content(content)
+
+
+def transform_search_box(path, content):
+    if content is None:
+        return content
+    return load_script('build_search_index.py').add_search_box(path, content, DOCS_DIR)
+
+
+# ---------------------------------------------------------------------------
+# Report and publish stages. These never rewrite pages.
+# ---------------------------------------------------------------------------
+
+def run_audit_onboarding(pages=None):
+    module = load_script('audit-onboarding.py')
+    if pages is None:
+        module.print_report()
+        return []
+
+    results = []
+    for path in pages:
+        page = docs_pages.day_page(path)
+        if not page or page.day < 6 or not page.path.exists():
+            continue
+        results.append((
+            module.check_navigation_structure(page),
+            module.check_task_content(page),
+            module.check_tech_alignment(page),
+        ))
+    docs_content.save()
+
+    for nav, content, tech in results[:5]:
+        print(f"    🔍 {nav['file']}: nav {nav['status']}, "
+              f"quality {content['quality_score']}/100, tech {tech['alignment_percent']:.0f}%")
+        for issue in nav['issues']:
+            print(f"       - {issue}")
+    if len(results) > 5:
+        nav_pass = sum(1 for nav, _, _ in results if not nav['issues'])
+        print(f"    🔍 ... {len(results) - 5} more audited, "
+              f"{nav_pass}/{len(results)} pass navigation checks")
+    return []
+
+
+def run_search_index(pages=None):
+    module = load_script('build_search_index.py')
+    stats, written = module.build_index(DOCS_DIR, paths=pages)
+    print(f"    🔎 {stats['reindexed']} page(s) re-indexed, {stats['shards_written']} of "
+          f"{stats['shards']} shards rewritten ({stats['bytes'] / 1024:.0f} KB index)")
+    return written
+
+
+def run_extract_content(pages=None):
+    day_pages = docs_pages.find_day_pages() if pages is None else [
+        page for page in map(docs_pages.day_page, pages) if page and page.path.exists()]
+    cache = docs_content.cache()
+    extracted = cache.extracted
+    for page in day_pages:
+        docs_content.record_for(page)
+    docs_content.save()
+    print(f"    🧩 {len(day_pages)} content record(s), {cache.extracted - extracted} re-extracted")
+    return []
+
+
+def run_comprehensive_audit(pages=None):
+    module = load_script('comprehensive-audit.py')
+    module.generate_report()
+    docs_content.save()
+    return []
+
+
+SEARCHABLE_PAGES = ['docs/Onboarding/*.html', 'docs/Onboarding/*/*.html', 'docs/RevNovaRequirements/*.html']
+
+# Stage keys:
+#   sources   - files whose change reruns the whole stage
+#   pages     - globs of the pages the stage works on
+#   per_page  - whether editing one of those pages reruns the stage for it
+#   transform - (path, content) -> content, for stages that rewrite pages
+#   targets   - optional callable listing every page for a full run
+#   run       - pages -> written paths, for report-only stages
+# Stage order matters: pages written by one stage flow into the later ones.
+STAGES = [
+    {
+        'name': 'regenerate',
+        'script': 'regenerate_all_pages.py',
+        'sources': ['scripts/regenerate_all_pages.py', 'scripts/data/onboarding-cohorts.json',
+                    'docs/Onboarding/dev1-day07.html'],
+        'pages': ['docs/Onboarding/dev*-day*.html', 'docs/Onboarding/*/dev*-day*.html'],
+        'per_page': False,
+        'transform': transform_regenerate,
+        'targets': regenerate_targets,
+    },
+    {
+        'name': 'update-sidebars',
+        'script': 'update-sidebars.py',
+        'sources': ['scripts/update-sidebars.py'],
+        'pages': ['docs/RevNovaRequirements/*.html', 'docs/Onboarding/*.html'],
+        'per_page': True,
+        'transform': transform_update_sidebars,
+    },
+    {
+        'name': 'requirements-sidebar',
+        'script': 'fix-requirements-sidebar-final.py',
+        'sources': ['scripts/fix-requirements-sidebar-final.py'],
+        'pages': ['docs/RevNovaRequirements/*.html'],
+        'per_page': True,
+        'transform': transform_requirements_sidebar,
+    },
+    {
+        'name': 'copilot-prompts',
+        'script': 'add-copilot-prompts.py',
+        'sources': ['scripts/add-copilot-prompts.py', 'scripts/data/copilot-prompts.json'],
+        'pages': ['docs/Onboarding/dev*-day*.html'],
+        'per_page': True,
+        'transform': transform_copilot_prompts,
+    },
+    {
+        'name': 'task-status',
+        'script': 'update-task-completion-status.py',
+        'sources': ['scripts/update-task-completion-status.py'],
+        'pages': ['docs/Onboarding/dev*-day*.html'],
+        'per_page': True,
+        'transform': transform_task_status,
+    },
+    {
+        'name': 'fix-css',
+        'script': 'fix-css-double-semicolon.py',
+        'sources': ['scripts/fix-css-double-semicolon.py'],
+        'pages': ['docs/Onboarding/dev*-day*.html'],
+        'per_page': True,
+        'transform': transform_css_double_semicolon,
+    },
+    {
+        'name': 'search-box',
+        'script': 'build_search_index.py',
+        'sources': ['scripts/build_search_index.py'],
+        'pages': SEARCHABLE_PAGES,
+        'per_page': True,
+        'transform': transform_search_box,
+    },
+    {
+        'name': 'search-index',
+        'script': 'build_search_index.py',
+        'sources': ['scripts/build_search_index.py'],
+        'pages': SEARCHABLE_PAGES,
+        'per_page': True,
+        'run': run_search_index,
+    },
+    {
+        'name': 'extract-content',
+        'script': 'docs_content.py',
+        'sources': ['scripts/docs_content.py'],
+        'pages': ['docs/Onboarding/dev*-day*.html'],
+        'per_page': True,
+        'run': run_extract_content,
+    },
+    {
+        'name': 'audit-onboarding',
+        'script': 'audit-onboarding.py',
+        'sources': ['scripts/audit-onboarding.py'],
+        'pages': ['docs/Onboarding/dev*-day*.html'],
+        'per_page': True,
+        'run': run_audit_onboarding,
+    },
+    {
+        'name': 'comprehensive-audit',
+        'script': 'comprehensive-audit.py',
+        'sources': ['scripts/comprehensive-audit.py'],
+        'pages': [],
+        'per_page': False,
+        'run': run_comprehensive_audit,
+    },
+]
+
+STAGES_BY_NAME = {stage['name']: stage for stage in STAGES}
+
+DEFAULT_STAGES = ['regenerate', 'copilot-prompts', 'task-status', 'fix-css', 'search-box', 'search-index',
+                  'extract-content', 'audit-onboarding']
+
+
+def relative_path(path):
+    try:
+        return Path(path).resolve().relative_to(REPO_ROOT.resolve()).as_posix()
+    except ValueError:
+        return Path(path).as_posix()
+
+
+def _matches(relative, patterns):
+    return any(Path(relative).match(pattern) and
+               relative.count('/') == pattern.count('/') for pattern in patterns)
+
+
+def select_stages(names=None):
+    """Return stage dicts for the given names (in pipeline order)."""
+    names = names or DEFAULT_STAGES
+    unknown = [name for name in names if name not in STAGES_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)}. "
+                         f"Available: {', '.join(STAGES_BY_NAME)}")
+    return [stage for stage in STAGES if stage['name'] in names]
+
+
+def stage_targets(stage):
+    """Every page a full run of the stage covers."""
+    if stage.get('targets'):
+        return stage['targets']()
+    pages = set()
+    for pattern in stage['pages']:
+        pages.update(REPO_ROOT.glob(pattern))
+    return sorted(pages)
+
+
+def stage_applies(stage, path):
+    return _matches(relative_path(path), stage['pages'])
+
+
+def run_stage(stage, pages=None, tx=None):
+    """Run one stage over `pages` (all targets if None). Returns written paths.
+
+    Transform stages stage their pages in `tx` (see docs_writer.py) and read
+    pages through it, so they see what earlier stages in the same transaction
+    wrote. Without a transaction the stage commits its own, so either every
+    page of the stage is written or none is.
+    """
+    if 'run' in stage:
+        return stage['run'](pages)
+    if tx is None:
+        with docs_writer.transaction() as own_tx:
+            return run_stage(stage, pages, own_tx)
+
+    pages = stage_targets(stage) if pages is None else [Path(p) for p in pages]
+    updates = []
+    for page in pages:
+        with docs_profile.span(page.name, 'file', stage=stage['name']):
+            content = tx.read(page)
+            new_content = stage['transform'](page, content)
+        if new_content is not None and new_content != content:
+            updates.append((page, new_content))
+
+    with docs_profile.span(f"stage {len(updates)} pages", 'io'):
+        for page, new_content in updates:
+            tx.write(page, new_content)
+    return [page for page, _ in updates]
+
+
+def render_page(path, stage_names=None):
+    """Render a page in memory through every transform stage that applies to it.
+
+    Returns None if the page neither exists nor is produced by any stage.
+    """
+    content = _read_text(path)
+    for stage in select_stages(stage_names):
+        if 'transform' in stage and stage_applies(stage, path):
+            content = stage['transform'](Path(path), content)
+    return content
+
+
+def run_pipeline(changed_paths=None, stage_names=None, log=print):
+    """Rerun the stages affected by changed_paths (everything if None).
+
+    Consecutive rewriting stages share one transaction, committed before the
+    next report/publish stage runs (those read docs/ from disk) and at the end;
+    if any stage fails, none of the pages staged since the last commit are
+    written.
+
+    Returns (written_paths, timings) where timings is a list of
+    (stage name, page count or 'all', seconds).
+    """
+    stages = select_stages(stage_names)
+    changed = None if changed_paths is None else {relative_path(p) for p in changed_paths}
+    written_all = []
+    timings = []
+    tx = None
+
+    try:
+        for stage in stages:
+            if changed is None or any(source in changed for source in stage['sources']):
+                pages = None
+            elif stage['per_page']:
+                pages = sorted(p for p in changed if _matches(p, stage['pages']))
+                if not pages:
+                    continue
+            else:
+                continue
+
+            if 'run' in stage and docs_writer.dry_run_active():
+                log(f"  ⏭ {stage['name']}: skipped in a dry run")
+                continue
+            if 'run' in stage and tx is not None:
+                # Report/publish stages read docs/ from disk
+                with docs_profile.span(f"commit {len(tx)} pages", 'io'):
+                    tx.commit()
+                tx = None
+            elif 'transform' in stage and tx is None:
+                tx = docs_writer.Transaction()
+
+            start = time.perf_counter()
+            with docs_profile.span(stage['name'], 'stage', pages='all' if pages is None else len(pages)):
+                written = run_stage(stage, None if pages is None else [REPO_ROOT / p for p in pages], tx)
+            elapsed = time.perf_counter() - start
+
+            timings.append((stage['name'], 'all' if pages is None else len(pages), elapsed))
+            log(f"  ▶ {stage['name']}: {'all pages' if pages is None else f'{len(pages)} page(s)'}"
+                f" → {len(written)} written ({elapsed * 1000:.0f} ms)")
+
+            written_all.extend(written)
+            if changed is not None:
+                changed.update(relative_path(p) for p in written)
+
+        if tx is not None:
+            with docs_profile.span(f"commit {len(tx)} pages", 'io'):
+                tx.commit()
+    except BaseException:
+        if tx is not None and not tx.committed:
+            tx.close()
+            log(f"  ❌ Aborted: {len(tx)} staged page(s) not written")
+        raise
+
+    return written_all, timings
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run the docs build pipeline once')
+    parser.add_argument('--stages', help=f"Comma-separated stages (default: {','.join(DEFAULT_STAGES)})")
+    parser.add_argument('--list', action='store_true', help='List available stages')
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            marker = '*' if stage['name'] in DEFAULT_STAGES else ' '
+            print(f" {marker} {stage['name']:<22} {stage['script']}")
+        return
+
+    os.chdir(REPO_ROOT)
+    start = time.perf_counter()
+    written, _ = run_pipeline(stage_names=args.stages.split(',') if args.stages else None)
+    verb = 'staged (dry run)' if docs_writer.dry_run_active() else 'written'
+    print(f"\n✅ Build complete: {len(written)} files {verb} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    with docs_profile.profile_from_argv(auto_file_spans=False), docs_writer.dry_run_from_argv():
+        main()
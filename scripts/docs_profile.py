@@ -0,0 +1,494 @@
+"""
+Profiling and tracing hooks for the docs scripts.
+
+Any script whose entry point runs inside profile_from_argv() accepts:
+
+    --profile[=PATH]      record a trace (default: build/profiles/<script>.trace.json)
+    --profile-cprofile    also run cProfile (PATH.pstats, top functions printed)
+    --profile-memory      also run tracemalloc (memory counters + top allocations)
+
+The flags are removed from sys.argv before the script parses its own
+arguments. While profiling is on:
+
+  - every file opened gets an "io" span (open to close) and its bytes are
+    counted; time between reading one input file and the next is attributed
+    to that file as a "file" span, which matches the read-process-write loop
+    every docs script uses
+  - calls into the re module and into compiled patterns made from scripts/
+    are counted per pattern (calls, matches, seconds)
+  - code can add its own spans with docs_profile.span(name, cat), which is a
+    no-op when profiling is off (docs_pipeline uses it per stage and page)
+
+The trace is Chrome trace-event JSON: open it in https://ui.perfetto.dev or
+chrome://tracing. A summary of the slowest stages, files and patterns is
+printed at exit.
+
+Usage:
+    python scripts/regenerate_all_pages.py --profile
+    python scripts/docs_pipeline.py --profile=/tmp/build.json --profile-memory
+"""
+
+import builtins
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+PROFILES_DIR = SCRIPTS_DIR.parent / 'build' / 'profiles'
+
+REGEX_FUNCTIONS = ('search', 'match', 'fullmatch', 'sub', 'subn', 'findall', 'finditer', 'split')
+
+ACTIVE = None
+
+
+def _pattern_key(pattern):
+    text = pattern.pattern if hasattr(pattern, 'pattern') else pattern
+    if isinstance(text, bytes):
+        text = text.decode('latin-1')
+    text = str(text).replace('\n', '\\n')
+    return text if len(text) <= 70 else text[:67] + '...'
+
+
+def _byte_length(data):
+    if isinstance(data, str):
+        return len(data.encode('utf-8', 'surrogatepass'))
+    return len(data)
+
+
+class _CountingFile:
+    """File wrapper that counts bytes and emits an io span when closed."""
+
+    def __init__(self, file, profiler, path, writing):
+        self._file = file
+        self._profiler = profiler
+        self._path = path
+        self._writing = writing
+        self._start = profiler.now_us()
+        self._bytes = 0
+        self._closed = False
+
+    def _count(self, data):
+        size = _byte_length(data) if not isinstance(data, list) else sum(map(_byte_length, data))
+        self._bytes += size
+        return data
+
+    def read(self, *args):
+        return self._count(self._file.read(*args))
+
+    def readline(self, *args):
+        return self._count(self._file.readline(*args))
+
+    def readlines(self, *args):
+        return self._count(self._file.readlines(*args))
+
+    def write(self, data):
+        self._count(data)
+        return self._file.write(data)
+
+    def writelines(self, lines):
+        lines = list(lines)
+        self._count(lines)
+        return self._file.writelines(lines)
+
+    def __iter__(self):
+        for line in self._file:
+            yield self._count(line)
+
+    def __next__(self):
+        return self._count(next(self._file))
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._profiler.file_closed(self._path, self._writing, self._bytes, self._start)
+        return self._file.close()
+
+    def __enter__(self):
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class _CountingPattern:
+    """Proxy for a compiled pattern that records calls, matches and time."""
+
+    def __init__(self, compiled, profiler):
+        self._compiled = compiled
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        attribute = getattr(self._compiled, name)
+        if name in REGEX_FUNCTIONS:
+            return self._profiler.wrap_regex_call(name, attribute, self._compiled)
+        return attribute
+
+    def __repr__(self):
+        return repr(self._compiled)
+
+
+def _unwrap(pattern):
+    return pattern._compiled if isinstance(pattern, _CountingPattern) else pattern
+
+
+class Profiler:
+    """Collects trace events, I/O and regex counters for one run."""
+
+    def __init__(self, name, auto_file_spans=True, use_cprofile=False, use_tracemalloc=False):
+        self.name = name
+        self.auto_file_spans = auto_file_spans
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.events = []
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files_read = set()
+        self.files_written = set()
+        self.file_seconds = {}
+        self.stage_seconds = {}
+        self.regex_stats = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._current_file = None
+        self._saved = {}
+        self._proxied_globals = []
+        self._in_scripts = {}
+        self._cprofile = None
+
+    # -- clock and events -------------------------------------------------
+
+    def now_us(self):
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def _event(self, name, cat, start_us, end_us, args=None):
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': round(start_us, 1),
+                 'dur': round(end_us - start_us, 1), 'pid': self._pid, 'tid': threading.get_ident()}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def counter(self, name, values):
+        self.events.append({'name': name, 'ph': 'C', 'ts': round(self.now_us(), 1),
+                            'pid': self._pid, 'args': values})
+
+    def _memory_counter(self):
+        if self.use_tracemalloc:
+            import tracemalloc
+            current, peak = tracemalloc.get_traced_memory()
+            self.counter('tracemalloc MB', {'current': round(current / 1048576, 2),
+                                            'peak': round(peak / 1048576, 2)})
+
+    @contextlib.contextmanager
+    def span(self, name, cat='stage', **args):
+        start = self.now_us()
+        try:
+            yield
+        finally:
+            end = self.now_us()
+            self._event(name, cat, start, end, args)
+            if cat == 'stage':
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0) + (end - start) / 1e6
+                self._memory_counter()
+            elif cat == 'file':
+                self.file_seconds[name] = self.file_seconds.get(name, 0) + (end - start) / 1e6
+
+    # -- file hooks -------------------------------------------------------
+
+    def _open(self, file, mode='r', *args, **kwargs):
+        handle = self._saved['open'](file, mode, *args, **kwargs)
+        if not isinstance(file, (str, bytes, os.PathLike)):
+            return handle
+        path = os.path.abspath(os.fsdecode(file))
+        writing = any(flag in mode for flag in 'wax+')
+        if not writing and self.auto_file_spans and not path.endswith('.py'):
+            self._switch_file(path)
+        return _CountingFile(handle, self, path, writing)
+
+    def _relative(self, path):
+        try:
+            return Path(path).relative_to(Path.cwd()).as_posix()
+        except ValueError:
+            return path
+
+    def _switch_file(self, path):
+        now = self.now_us()
+        if self._current_file:
+            name, start = self._current_file
+            self._event(name, 'file', start, now)
+            self.file_seconds[name] = self.file_seconds.get(name, 0) + (now - start) / 1e6
+            self._memory_counter()
+        self._current_file = (self._relative(path), now) if path else None
+
+    def file_closed(self, path, writing, size, start_us):
+        relative = self._relative(path)
+        if writing:
+            self.bytes_written += size
+            self.files_written.add(relative)
+        else:
+            self.bytes_read += size
+            self.files_read.add(relative)
+        self._event(('write ' if writing else 'read ') + Path(path).name, 'io', start_us, self.now_us(),
+                    {'path': relative, 'bytes': size})
+        self.counter('bytes', {'read': self.bytes_read, 'written': self.bytes_written})
+
+    # -- regex hooks ------------------------------------------------------
+
+    def _called_from_scripts(self, depth=2):
+        filename = sys._getframe(depth).f_code.co_filename
+        inside = self._in_scripts.get(filename)
+        if inside is None:
+            inside = os.path.abspath(filename).startswith(str(SCRIPTS_DIR) + os.sep)
+            self._in_scripts[filename] = inside
+        return inside
+
+    def _record(self, pattern, matches, seconds):
+        stats = self.regex_stats.setdefault(_pattern_key(pattern), [0, 0, 0.0])
+        stats[0] += 1
+        stats[1] += matches
+        stats[2] += seconds
+
+    def wrap_regex_call(self, name, function, pattern):
+        """Wrap a re function or compiled-pattern method so it records stats."""
+        if name == 'finditer':
+            def counting_finditer(*args, **kwargs):
+                start = time.perf_counter()
+                matches = 0
+                for match in function(*args, **kwargs):
+                    matches += 1
+                    yield match
+                self._record(pattern if pattern is not None else args[0], matches, time.perf_counter() - start)
+            return counting_finditer
+
+        def counting_call(*args, **kwargs):
+            target = pattern if pattern is not None else args[0]
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if name in ('search', 'match', 'fullmatch'):
+                matches = 1 if result is not None else 0
+            elif name == 'findall':
+                matches = len(result)
+            elif name == 'split':
+                matches = len(result) - 1
+            elif name == 'subn':
+                matches = result[1]
+            else:
+                matches = -1  # sub: counted below without re-running the regex
+            if matches >= 0:
+                self._record(target, matches, elapsed)
+            return result
+
+        if name != 'sub':
+            return counting_call
+
+        subn = getattr(pattern, 'subn') if pattern is not None else self._saved['re.subn']
+
+        def counting_sub(*args, **kwargs):
+            target = pattern if pattern is not None else args[0]
+            start = time.perf_counter()
+            result, matches = subn(*args, **kwargs)
+            self._record(target, matches, time.perf_counter() - start)
+            return result
+        return counting_sub
+
+    def _module_function(self, name):
+        original = self._saved['re.' + name]
+        wrapped = self.wrap_regex_call(name, original, None)
+
+        def hook(pattern, *args, **kwargs):
+            pattern = _unwrap(pattern)
+            if not self._called_from_scripts():
+                return original(pattern, *args, **kwargs)
+            return wrapped(pattern, *args, **kwargs)
+        return hook
+
+    def _compile(self, pattern, flags=0):
+        compiled = self._saved['re.compile'](_unwrap(pattern), flags)
+        return _CountingPattern(compiled, self) if self._called_from_scripts() else compiled
+
+    def _proxy_loaded_patterns(self):
+        """Swap module-level compiled patterns in already imported scripts."""
+        for module in list(sys.modules.values()):
+            filename = getattr(module, '__file__', None)
+            if not filename or not os.path.abspath(filename).startswith(str(SCRIPTS_DIR) + os.sep):
+                continue
+            for attribute, value in list(vars(module).items()):
+                if isinstance(value, re.Pattern):
+                    setattr(module, attribute, _CountingPattern(value, self))
+                    self._proxied_globals.append((module, attribute, value))
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self):
+        self._saved['open'] = io.open
+        for name in REGEX_FUNCTIONS + ('compile',):
+            self._saved['re.' + name] = getattr(re, name)
+        builtins.open = io.open = self._open
+        for name in REGEX_FUNCTIONS:
+            setattr(re, name, self._module_function(name))
+        re.compile = self._compile
+        self._proxy_loaded_patterns()
+
+        if self.use_tracemalloc:
+            import tracemalloc
+            tracemalloc.start()
+        if self.use_cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._script_start = self.now_us()
+        return self
+
+    def stop(self):
+        if self._cprofile:
+            self._cprofile.disable()
+        self._switch_file(None)
+        self._event(self.name, 'script', self._script_start, self.now_us(),
+                    {'bytes_read': self.bytes_read, 'bytes_written': self.bytes_written})
+        self._memory_counter()
+
+        builtins.open = io.open = self._saved['open']
+        for name in REGEX_FUNCTIONS + ('compile',):
+            setattr(re, name, self._saved['re.' + name])
+        for module, attribute, value in self._proxied_globals:
+            setattr(module, attribute, value)
+
+        self.top_allocations = []
+        if self.use_tracemalloc:
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            for stat in snapshot.statistics('lineno')[:10]:
+                frame = stat.traceback[0]
+                self.top_allocations.append({'where': f'{Path(frame.filename).name}:{frame.lineno}',
+                                             'kb': round(stat.size / 1024, 1), 'count': stat.count})
+
+    # -- output -----------------------------------------------------------
+
+    def trace(self):
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self._pid, 'args': {'name': self.name}}]
+        return {
+            'traceEvents': metadata + self.events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'script': self.name,
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+                'files_read': len(self.files_read),
+                'files_written': len(self.files_written),
+                'regex': {key: {'calls': calls, 'matches': matches, 'seconds': round(seconds, 6)}
+                          for key, (calls, matches, seconds) in self.regex_stats.items()},
+                'top_allocations': self.top_allocations,
+            },
+        }
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.trace(), f)
+        if self._cprofile:
+            self._cprofile.dump_stats(str(path.with_suffix('.pstats')))
+
+    def summary(self, out=print, limit=8):
+        out(f"\n⏱️  Profile: {self.name}")
+        out(f"   {len(self.files_read)} files read ({self.bytes_read / 1024:.0f} KB), "
+            f"{len(self.files_written)} written ({self.bytes_written / 1024:.0f} KB)")
+        if self.stage_seconds:
+            out("   Slowest stages:")
+            for name, seconds in sorted(self.stage_seconds.items(), key=lambda item: -item[1])[:limit]:
+                out(f"     {seconds * 1000:9.1f} ms  {name}")
+        if self.file_seconds:
+            out("   Slowest files:")
+            for name, seconds in sorted(self.file_seconds.items(), key=lambda item: -item[1])[:limit]:
+                out(f"     {seconds * 1000:9.1f} ms  {name}")
+        if self.regex_stats:
+            out("   Regex patterns (by time):")
+            ranked = sorted(self.regex_stats.items(), key=lambda item: -item[1][2])[:limit]
+            for key, (calls, matches, seconds) in ranked:
+                out(f"     {seconds * 1000:9.1f} ms  {calls:>6} calls {matches:>7} matches  {key}")
+        for allocation in self.top_allocations[:5]:
+            out(f"     {allocation['kb']:9.1f} KB  {allocation['where']} ({allocation['count']} blocks)")
+        if self._cprofile:
+            import pstats
+            out("   cProfile (cumulative):")
+            stream = io.StringIO()
+            pstats.Stats(self._cprofile, stream=stream).sort_stats('cumulative').print_stats(limit)
+            for line in stream.getvalue().splitlines():
+                if line.strip() and not line.lstrip().startswith(('Ordered by', 'List reduced')):
+                    out('     ' + line.strip())
+
+
+def span(name, cat='stage', **args):
+    """Trace a block when profiling is on; a no-op context otherwise."""
+    if ACTIVE is None:
+        return contextlib.nullcontext()
+    return ACTIVE.span(name, cat, **args)
+
+
+def start(name, **options):
+    global ACTIVE
+    ACTIVE = Profiler(name, **options).start()
+    return ACTIVE
+
+
+def stop():
+    global ACTIVE
+    profiler, ACTIVE = ACTIVE, None
+    if profiler:
+        profiler.stop()
+    return profiler
+
+
+def _pop_profile_flags(argv):
+    """Remove --profile* flags from argv. Returns (trace path or None, cprofile, tracemalloc)."""
+    trace_path = None
+    use_cprofile = use_tracemalloc = False
+    remaining = [argv[0]]
+    for arg in argv[1:]:
+        if arg == '--profile':
+            trace_path = ''
+        elif arg.startswith('--profile='):
+            trace_path = arg.split('=', 1)[1]
+        elif arg == '--profile-cprofile':
+            use_cprofile = True
+        elif arg == '--profile-memory':
+            use_tracemalloc = True
+        else:
+            remaining.append(arg)
+    argv[:] = remaining
+    if trace_path is None and (use_cprofile or use_tracemalloc):
+        trace_path = ''
+    return trace_path, use_cprofile, use_tracemalloc
+
+
+@contextlib.contextmanager
+def profile_from_argv(auto_file_spans=True):
+    """Profile the enclosed block if --profile flags are on the command line."""
+    trace_path, use_cprofile, use_tracemalloc = _pop_profile_flags(sys.argv)
+    if trace_path is None:
+        yield None
+        return
+
+    name = Path(sys.argv[0]).stem
+    trace_path = Path(trace_path) if trace_path else PROFILES_DIR / f'{name}.trace.json'
+    profiler = start(name, auto_file_spans=auto_file_spans,
+                     use_cprofile=use_cprofile, use_tracemalloc=use_tracemalloc)
+    try:
+        yield profiler
+    finally:
+        stop()
+        profiler.write(trace_path)
+        profiler.summary()
+        print(f"   Trace: {trace_path} (open in https://ui.perfetto.dev)")
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Transactional, crash-safe batch writes for the docs scripts.
+
+Rewriting scripts used to write pages in place one at a time, so an error
+halfway through left docs/ half-migrated. A transaction instead stages every
+output in a hidden directory at the repository root (same filesystem, so
+renames are atomic) and touches nothing until commit:
+
+    with docs_writer.transaction() as tx:
+        for path in pages:
+            tx.write(path, fix(tx.read(path)))
+
+If the block raises, the staging directory is discarded and docs/ is left
+exactly as it was. On commit the staged files are fsynced in one batch, the
+current version of every target is hard-linked into a backup directory and
+recorded in a journal, and then each staged file is renamed over its target.
+The journal is deleted once all renames are done; a run that dies in between
+leaves the journal behind, and the next transaction (or `--recover`) restores
+every target from it.
+
+Scripts whose entry point runs inside dry_run_from_argv() accept --dry-run,
+--diff and --diff-report[=PATH]: commits are recorded instead of written, and
+at exit the unified diffs of every affected file are computed (in parallel
+worker processes for large batches) and summarized as files, hunks and bytes
+changed, optionally as an HTML report.
+
+Usage:
+    python scripts/docs_writer.py                 # roll back an interrupted commit
+    python scripts/docs_writer.py --bench 500     # overhead vs plain in-place writes
+"""
+
+import argparse
+import difflib
+import html
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+STAGING_PREFIX = '.docs-txn-'
+JOURNAL_NAME = 'journal.json'
+# Below this many changed files, diffing in-process beats starting workers
+DIFF_PARALLEL_THRESHOLD = 16
+
+
+def _fsync_path(path, directory=False):
+    flags = os.O_RDONLY | (getattr(os, 'O_DIRECTORY', 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return  # Directories cannot be opened on Windows; rename durability is the OS's job there
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def _rollback(entries):
+    """Put every journaled target back the way it was before the commit."""
+    for target, backup in reversed(entries):
+        if backup is not None:
+            if os.path.exists(backup):
+                os.replace(backup, target)
+        elif os.path.exists(target):
+            os.remove(target)
+
+
+def recover(root=REPO_ROOT):
+    """Roll back commits interrupted by a crash and delete abandoned staging dirs.
+
+    Staging dirs of transactions still running in another process are left
+    alone. Returns the number of targets restored.
+    """
+    restored = 0
+    for staging in sorted(Path(root).glob(STAGING_PREFIX + '*')):
+        try:
+            pid = int(staging.name[len(STAGING_PREFIX):].split('-', 1)[0])
+        except ValueError:
+            continue
+        if _pid_alive(pid):
+            continue
+        journal = staging / JOURNAL_NAME
+        if journal.exists():
+            with open(journal, 'r', encoding='utf-8') as f:
+                entries = json.load(f)['entries']
+            _rollback(entries)
+            restored += len(entries)
+        shutil.rmtree(staging, ignore_errors=True)
+    return restored
+
+
+def _same_content(staged, target):
+    try:
+        if os.path.getsize(staged) != os.path.getsize(target):
+            return False
+        with open(staged, 'rb') as a, open(target, 'rb') as b:
+            return a.read() == b.read()
+    except OSError:
+        return False
+
+
+class Transaction:
+    """A batch of file writes that lands all at once or not at all."""
+
+    def __init__(self, root=REPO_ROOT, durable=True):
+        self.root = Path(root)
+        self.durable = durable
+        recovered = 0 if _dry_run else recover(self.root)
+        if recovered:
+            print(f"↩️  Rolled back {recovered} file(s) from an interrupted commit")
+        self.staging = Path(tempfile.mkdtemp(prefix=f'{STAGING_PREFIX}{os.getpid()}-', dir=self.root))
+        self._staged = {}  # absolute target -> staged file
+        self.committed = False
+
+    def __len__(self):
+        return len(self._staged)
+
+    @property
+    def paths(self):
+        """Targets written so far, in write order."""
+        return [Path(target) for target in self._staged]
+
+    def write(self, path, content, encoding='utf-8'):
+        """Stage `content` (str or bytes) as the new content of `path`."""
+        target = os.path.abspath(path)
+        staged = self._staged.get(target)
+        if staged is None:
+            staged = os.path.join(self.staging, f'{len(self._staged):06d}')
+            self._staged[target] = staged
+        data = content.encode(encoding) if isinstance(content, str) else content
+        with open(staged, 'wb') as f:
+            f.write(data)
+
+    def read(self, path, encoding='utf-8'):
+        """Current content of `path` as this transaction would leave it, or None if missing."""
+        target = os.path.abspath(path)
+        staged = self._staged.get(target)
+        if staged is None and _dry_run is not None and _dry_run.pending(target) is not None:
+            return _dry_run.pending(target).decode(encoding)
+        try:
+            with open(staged or path, 'r', encoding=encoding) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def commit(self):
+        """Atomically replace every target with its staged content."""
+        if self.committed:
+            return
+        if _dry_run is not None:
+            for target, staged in self._staged.items():
+                with open(staged, 'rb') as f:
+                    _dry_run.record(target, f.read())
+            self.committed = True
+            self.close()
+            return
+        # Targets rewritten with the bytes they already hold keep their inode
+        # and mtime, so a rerun that changes nothing costs no renames and
+        # looks unchanged to anything watching the tree
+        for target in [t for t, staged in self._staged.items() if _same_content(staged, t)]:
+            os.remove(self._staged.pop(target))
+        if self.durable:
+            for staged in self._staged.values():
+                _fsync_path(staged)
+
+        backups = os.path.join(self.staging, 'backup')
+        os.mkdir(backups)
+        entries = []
+        for index, (target, staged) in enumerate(self._staged.items()):
+            backup = None
+            if os.path.exists(target):
+                backup = os.path.join(backups, f'{index:06d}')
+                try:
+                    os.link(target, backup)
+                except OSError:
+                    shutil.copy2(target, backup)
+                shutil.copymode(target, staged)
+            entries.append([target, backup])
+
+        journal = os.path.join(self.staging, JOURNAL_NAME)
+        with open(journal, 'w', encoding='utf-8') as f:
+            json.dump({'pid': os.getpid(), 'entries': entries}, f)
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+        if self.durable:
+            _fsync_path(self.staging, directory=True)
+
+        done = []
+        try:
+            for target, backup in entries:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(self._staged[target], target)
+                done.append((target, backup))
+        except BaseException:
+            _rollback(done)
+            raise
+
+        if self.durable:
+            for directory in {os.path.dirname(target) for target, _ in entries}:
+                _fsync_path(directory, directory=True)
+        os.remove(journal)
+        self.committed = True
+        self.close()
+
+    def close(self):
+        """Discard the staging directory (and with it anything not committed)."""
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+@contextmanager
+def transaction(root=REPO_ROOT, durable=True):
+    """Stage writes for the duration of the block; commit only if it completes."""
+    tx = Transaction(root, durable=durable)
+    try:
+        yield tx
+    except BaseException:
+        tx.close()
+        if tx._staged:
+            print(f"❌ Aborted: none of the {len(tx._staged)} staged file(s) were written")
+        raise
+    tx.commit()
+
+
+# ---------------------------------------------------------------------------
+# Dry runs. While one is active, commits record (old, new) content instead of
+# touching disk, and later transactions read the recorded content, so a run
+# made of several transactions previews as a whole.
+# ---------------------------------------------------------------------------
+
+_dry_run = None
+
+
+class DryRun:
+    """Changes a dry run would have written, keyed by absolute target path."""
+
+    def __init__(self):
+        self.changes = {}  # target -> [content on disk (bytes or None), new content (bytes)]
+
+    def record(self, target, new):
+        if target in self.changes:
+            self.changes[target][1] = new
+            return
+        try:
+            with open(target, 'rb') as f:
+                old = f.read()
+        except FileNotFoundError:
+            old = None
+        self.changes[target] = [old, new]
+
+    def pending(self, target):
+        change = self.changes.get(target)
+        return None if change is None else change[1]
+
+    def diffs(self, workers=None):
+        """Unified diff of every changed file, computed in parallel for large batches."""
+        jobs = [(_display_path(target), old, new) for target, (old, new) in sorted(self.changes.items())
+                if old != new]
+        if len(jobs) < DIFF_PARALLEL_THRESHOLD or (os.cpu_count() or 1) == 1:
+            return [diff_file(job) for job in jobs]
+        workers = workers or min(os.cpu_count(), 8)
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(diff_file, jobs, chunksize=chunksize))
+
+
+def _display_path(target):
+    try:
+        return Path(target).relative_to(REPO_ROOT.resolve()).as_posix()
+    except ValueError:
+        return Path(target).as_posix()
+
+
+def _decode(content):
+    return '' if content is None else content.decode('utf-8', errors='replace')
+
+
+def diff_file(job):
+    """Return {path, diff, hunks, added, removed} for one (path, old bytes, new bytes) job."""
+    path, old, new = job
+    diff = list(difflib.unified_diff(
+        _decode(old).splitlines(keepends=True), _decode(new).splitlines(keepends=True),
+        fromfile='/dev/null' if old is None else f'a/{path}', tofile=f'b/{path}'))
+    hunks = added = removed = 0
+    for line in diff[2:]:
+        if line.startswith('@@'):
+            hunks += 1
+        elif line.startswith('+'):
+            added += len(line.encode('utf-8')) - 1
+        elif line.startswith('-'):
+            removed += len(line.encode('utf-8')) - 1
+    return {'path': path, 'diff': diff, 'hunks': hunks, 'added': added, 'removed': removed,
+            'new_file': old is None}
+
+
+def print_summary(results, show_diff=False, out=None):
+    out = out or sys.stdout
+    if show_diff:
+        for result in results:
+            for line in result['diff']:
+                out.write(line if line.endswith('\n') else line + '\n\\ No newline at end of file\n')
+    out.write(f"\n🔍 Dry run: nothing was written. {len(results)} file(s) would change:\n")
+    for result in results:
+        marker = ' (new)' if result['new_file'] else ''
+        out.write(f"   {result['path']}{marker}: {result['hunks']} hunk(s), "
+                  f"+{result['added']:,} -{result['removed']:,} bytes\n")
+    out.write(f"   Total: {len(results)} file(s), {sum(r['hunks'] for r in results)} hunk(s), "
+              f"+{sum(r['added'] for r in results):,} -{sum(r['removed'] for r in results):,} bytes\n")
+
+
+REPORT_STYLE = """
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 2rem; color: #16325c; }
+table { border-collapse: collapse; margin-bottom: 2rem; }
+td, th { padding: 0.3rem 0.8rem; border-bottom: 1px solid #dddbda; text-align: left; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+h2 { font-size: 1rem; margin: 2rem 0 0.5rem; }
+pre { background: #f4f6f9; border: 1px solid #dddbda; border-radius: 4px; padding: 0.5rem 0; overflow-x: auto; font-size: 12px; }
+pre span { display: block; padding: 0 0.8rem; white-space: pre; }
+.add { background: #e6ffed; } .del { background: #ffeef0; } .hunk { color: #0070d2; background: #eef4ff; } .meta { color: #54698d; }
+"""
+
+
+def render_report(results, title):
+    """A self-contained HTML page with the summary table and every diff."""
+    rows = []
+    sections = []
+    for index, result in enumerate(results):
+        path = html.escape(result['path'])
+        rows.append(f'<tr><td><a href="#f{index}">{path}</a></td><td class="num">{result["hunks"]}</td>'
+                    f'<td class="num">+{result["added"]:,}</td><td class="num">-{result["removed"]:,}</td></tr>')
+        lines = []
+        for line in result['diff']:
+            kind = ('meta' if line.startswith(('---', '+++')) else 'hunk' if line.startswith('@@')
+                    else 'add' if line.startswith('+') else 'del' if line.startswith('-') else '')
+            lines.append(f'<span class="{kind}">{html.escape(line.rstrip(chr(10)))}</span>')
+        sections.append(f'<h2 id="f{index}">{path}</h2>\n<pre>{"".join(lines)}</pre>')
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n'
+            f'<title>{html.escape(title)}</title>\n<style>{REPORT_STYLE}</style>\n</head>\n<body>\n'
+            f'<h1>{html.escape(title)}</h1>\n<p>{len(results)} file(s), '
+            f'{sum(r["hunks"] for r in results)} hunk(s). Nothing was written.</p>\n'
+            f'<table>\n<tr><th>File</th><th>Hunks</th><th>Added</th><th>Removed</th></tr>\n'
+            + '\n'.join(rows) + '\n</table>\n' + '\n'.join(sections) + '\n</body>\n</html>\n')
+
+
+def _pop_dry_run_flags(argv):
+    """Remove the dry-run flags from argv. Returns (dry run, show diff, report path or None)."""
+    dry_run = show_diff = False
+    report_path = None
+    remaining = [argv[0]]
+    for arg in argv[1:]:
+        if arg == '--dry-run':
+            dry_run = True
+        elif arg == '--diff':
+            show_diff = True
+        elif arg == '--diff-report':
+            report_path = ''
+        elif arg.startswith('--diff-report='):
+            report_path = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+    argv[:] = remaining
+    return dry_run or show_diff or report_path is not None, show_diff, report_path
+
+
+@contextmanager
+def dry_run_from_argv():
+    """Preview the enclosed block's writes if dry-run flags are on the command line.
+
+        --dry-run              summarize files, hunks and bytes that would change
+        --diff                 also print the unified diffs (implies --dry-run)
+        --diff-report[=PATH]   also write an HTML diff report (implies --dry-run;
+                               default: build/diffs/<script>.html)
+    """
+    global _dry_run
+    enabled, show_diff, report_path = _pop_dry_run_flags(sys.argv)
+    if not enabled:
+        yield None
+        return
+
+    _dry_run = preview = DryRun()
+    try:
+        yield preview
+    finally:
+        _dry_run = None
+    results = preview.diffs()
+    print_summary(results, show_diff)
+    if report_path is not None:
+        name = Path(sys.argv[0]).stem
+        report_path = Path(report_path) if report_path else REPO_ROOT / 'build' / 'diffs' / f'{name}.html'
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(render_report(results, f'Dry run: {name}'))
+        print(f"   Report: {report_path}")
+
+
+def dry_run_active():
+    return _dry_run is not None
+
+
+def benchmark(count, size=40_000):
+    """Time plain in-place writes against a transaction for `count` files."""
+    content = ('<p>RevNova onboarding page</p>\n' * (size // 32 + 1))[:size]
+    results = {}
+    with tempfile.TemporaryDirectory(dir=REPO_ROOT) as scratch:
+        paths = [os.path.join(scratch, f'page{i:05d}.html') for i in range(count)]
+        for path in paths:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+        start = time.perf_counter()
+        for path in paths:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content + 'x')
+        results['in place'] = time.perf_counter() - start
+
+        for label, durable in (('transaction', True), ('transaction, no fsync', False)):
+            start = time.perf_counter()
+            with transaction(scratch, durable=durable) as tx:
+                for path in paths:
+                    tx.write(path, content + label)
+            results[label] = time.perf_counter() - start
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Crash-safe batch writes for the docs scripts')
+    parser.add_argument('--recover', action='store_true',
+                        help='Roll back commits interrupted by a crash (the default action)')
+    parser.add_argument('--bench', type=int, metavar='FILES', help='Compare overhead against in-place writes')
+    args = parser.parse_args(argv)
+
+    if args.recover or not args.bench:
+        restored = recover()
+        print(f"↩️  Restored {restored} file(s)" if restored else "✅ Nothing to recover")
+    if args.bench:
+        results = benchmark(args.bench)
+        baseline = results['in place']
+        print(f"Writing {args.bench} files of 40 KB:")
+        for label, seconds in results.items():
+            print(f"  {label:<24} {seconds * 1000:8.1f} ms  ({seconds / baseline:.2f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
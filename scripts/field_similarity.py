@@ -0,0 +1,976 @@
+#!/usr/bin/env python3
+"""
+Precompute field mapping suggestions for two field catalogs.
+
+Scores every source x target field pair the way the backend's
+ConfidenceScoringService does for name, label and type, and writes the top-k
+targets for each source field. The backend then only has to look suggestions
+up, and the AI mapping call is left to break ties, instead of scoring pairs
+one at a time per request.
+
+    name   exact 1.0, one contains the other 0.85, else 0.6 x (1 - Levenshtein /
+           longer length) + 0.4 x word Jaccard, on lowercased names without __c
+    label  exact 1.0, contains 0.8, else word Jaccard; 0 when either is empty
+    type   the service's compatibility table (1.0 / 0.75 / 0.7 / 0.2)
+    score  100 x (0.30 name + 0.25 type + 0.15 label) / 0.70, the service's
+           weights for these three factors
+
+Pairs are scored with NumPy, a chunk at a time: Levenshtein distance with the
+bit-parallel Myers/Hyyro algorithm (one pass per target character, over every
+pair in the chunk at once), containment with Shift-And, word Jaccard from
+padded word ids and types from a lookup matrix. Strings longer than 64
+characters (beyond any Salesforce API name or label) fall back to plain
+Python for their pairs. score_pair() is the plain Python reference; --check
+compares the two on a sample and checks the recall counting on hand-made
+candidate lists (including short and empty ones).
+
+Large catalogs would still mean S x T pairs, so above AUTO_INDEX_PAIRS a
+CandidateIndex (trigrams and words of the target names and labels) first
+picks DEFAULT_CANDIDATES likely targets per source field and only those are
+scored. The output then records the index's recall against exhaustive
+scoring and its speedup, measured on a sample of source fields.
+
+Catalogs are JSON (a list of fields, a describeSObject result with "fields",
+or {"objects": [...]}) or CSV with name/label/type columns; schema_catalog
+export columns (object_name, field_name, field_label, data_type) work too.
+
+Usage:
+    python scripts/field_similarity.py source.json target.csv -k 5 -o suggestions.json
+    python scripts/field_similarity.py source.json target.json --search index --candidates 200
+    python scripts/field_similarity.py --bench 1000,10000,100000 --check
+
+Dependencies: numpy >= 2
+    pip install 'numpy>=2'
+"""
+
+import argparse
+import csv
+import json
+import math
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import docs_profile
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+WEIGHTS = {'name': 0.30, 'type': 0.25, 'label': 0.15}
+DEFAULT_TOP_K = 5
+# Pairs scored per chunk; keeps the working arrays small enough to stay in cache
+CHUNK_PAIRS = 250_000
+BIT_WIDTH = 64
+
+# Candidate index: targets kept per source field, features looked up per
+# source field, and the share of targets above which a feature is skipped
+DEFAULT_CANDIDATES = 100
+DEFAULT_PROBES = 16
+MAX_DF = 0.05
+# ... though never below this many targets, so small catalogs keep every feature
+MIN_POSTINGS_LIMIT = 256
+# Rows x targets accumulated at once by a query
+QUERY_CELLS = 4_000_000
+# --search auto indexes catalogs with more pairs than this
+AUTO_INDEX_PAIRS = 10_000_000
+DEFAULT_RECALL_SAMPLE = 200
+# The service's medium confidence level
+STRONG_SCORE = 60
+
+NUMERIC_TYPES = ['integer', 'number', 'double', 'decimal', 'currency', 'percent']
+COMPATIBLE_TYPES = {
+    'string': ['text', 'textarea', 'email', 'phone', 'url', 'picklist'],
+    'text': ['string', 'textarea', 'email', 'phone', 'url'],
+    'integer': ['number', 'double', 'decimal', 'currency', 'percent'],
+    'number': ['integer', 'double', 'decimal', 'currency', 'percent'],
+    'double': ['number', 'integer', 'decimal', 'currency', 'percent'],
+    'decimal': ['number', 'integer', 'double', 'currency', 'percent'],
+    'currency': ['number', 'integer', 'double', 'decimal', 'percent'],
+    'boolean': ['checkbox'],
+    'checkbox': ['boolean'],
+    'date': ['datetime'],
+    'datetime': ['date'],
+    'reference': ['lookup', 'masterdetail'],
+    'lookup': ['reference', 'masterdetail'],
+    'masterdetail': ['reference', 'lookup'],
+}
+
+FIELD_KEYS = {
+    'object': ('object', 'object_name', 'sobject'),
+    'name': ('name', 'field_name', 'api_name'),
+    'label': ('label', 'field_label'),
+    'type': ('type', 'data_type', 'field_type'),
+}
+
+
+def require_numpy():
+    # np.bitwise_count arrived in NumPy 2.0
+    if np is None or not hasattr(np, 'bitwise_count'):
+        print("ERROR: numpy 2 is required: pip install 'numpy>=2'")
+        sys.exit(4)
+
+
+# ---------------------------------------------------------------------------
+# Catalogs
+# ---------------------------------------------------------------------------
+
+def _field(row, object_name=None):
+    def pick(key):
+        for name in FIELD_KEYS[key]:
+            value = row.get(name)
+            if value not in (None, ''):
+                return str(value)
+        return ''
+    field = {key: pick(key) for key in ('name', 'label', 'type')}
+    field['object'] = pick('object') or object_name or ''
+    return field
+
+
+def load_catalog(path):
+    """Read a field catalog into [{'object', 'name', 'label', 'type'}, ...]."""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            fields = [_field(row) for row in csv.DictReader(f)]
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and 'fields' in data:
+            fields = [_field(row, data.get('name')) for row in data['fields']]
+        elif isinstance(data, dict):
+            objects = data.get('objects') or data.get('sobjects') or []
+            fields = [_field(row, obj.get('name')) for obj in objects for row in obj.get('fields', [])]
+        else:
+            fields = [_field(row) for row in data]
+    return [field for field in fields if field['name']]
+
+
+def field_id(field):
+    return f"{field['object']}.{field['name']}" if field['object'] else field['name']
+
+
+# ---------------------------------------------------------------------------
+# Plain Python reference (ConfidenceScoringService semantics)
+# ---------------------------------------------------------------------------
+
+def normalize_name(name):
+    return re.sub(r'__c$', '', name.lower()).replace('_', ' ').strip()
+
+
+def normalize_label(label):
+    return label.lower().strip()
+
+
+def levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _jaccard(words_a, words_b):
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+def name_similarity(a, b):
+    a, b = normalize_name(a), normalize_name(b)
+    if a == b:
+        return 1.0
+    if a in b or b in a:
+        return 0.85
+    distance = levenshtein(a, b) / max(len(a), len(b))
+    return (1 - distance) * 0.6 + _jaccard(set(a.split()), set(b.split())) * 0.4
+
+
+def label_similarity(a, b):
+    if not a or not b:
+        return 0.0
+    a, b = normalize_label(a), normalize_label(b)
+    if a == b:
+        return 1.0
+    if a in b or b in a:
+        return 0.8
+    return _jaccard(set(a.split()), set(b.split()))
+
+
+def type_compatibility(a, b):
+    a, b = a.lower(), b.lower()
+    if a == b:
+        return 1.0
+    if b in COMPATIBLE_TYPES.get(a, []) or a in COMPATIBLE_TYPES.get(b, []):
+        return 0.75
+    if ('text' in a or 'string' in a) and ('text' in b or 'string' in b):
+        return 0.7
+    if a in NUMERIC_TYPES and b in NUMERIC_TYPES:
+        return 0.7
+    return 0.2
+
+
+def combine(name, label, type_):
+    return 100 * (WEIGHTS['name'] * name + WEIGHTS['type'] * type_ + WEIGHTS['label'] * label) / sum(WEIGHTS.values())
+
+
+def score_pair(source, target):
+    """(score, name, label, type) for one field pair."""
+    name = name_similarity(source['name'], target['name'])
+    label = label_similarity(source['label'], target['label'])
+    type_ = type_compatibility(source['type'], target['type'])
+    return combine(name, label, type_), name, label, type_
+
+
+# ---------------------------------------------------------------------------
+# Vectorized engine
+# ---------------------------------------------------------------------------
+
+class _Strings:
+    """The distinct strings of one side as NumPy arrays: char ids, lengths, bit masks and word ids.
+
+    index maps each field to its string, so fields sharing a name (Id, Name,
+    CreatedDate in every object) are scored once.
+    """
+
+    def __init__(self, values, alphabet, vocabulary):
+        self.strings = list(dict.fromkeys(values))
+        position = {s: i for i, s in enumerate(self.strings)}
+        self.index = np.array([position[v] for v in values], dtype=np.int64)
+        count = len(self.strings)
+        self.lengths = np.array([len(s) for s in self.strings], dtype=np.int64)
+        width = max(1, int(self.lengths.max()) if count else 1)
+        self.chars = np.zeros((count, width), dtype=np.int32)
+        for i, s in enumerate(self.strings):
+            self.chars[i, :len(s)] = [alphabet[c] for c in s]
+        # Character j of every string, contiguous, for the kernels' per-position gathers
+        self.columns = np.ascontiguousarray(self.chars.T)
+        # Peq[i, c]: bit k set when strings[i][k] == c (first 64 characters)
+        self.peq = np.zeros((count, len(alphabet)), dtype=np.uint64)
+        rows, cols = np.nonzero(np.arange(min(width, BIT_WIDTH))[None, :] < self.lengths[:, None])
+        np.bitwise_or.at(self.peq, (rows, self.chars[rows, cols]), np.left_shift(np.uint64(1), cols.astype(np.uint64)))
+        # Distinct words of each string as vocabulary ids, padded with -1
+        words = [[vocabulary.setdefault(w, len(vocabulary)) for w in dict.fromkeys(s.split())] for s in self.strings]
+        self.word_counts = np.array([len(w) for w in words], dtype=np.float32)
+        self.word_ids = np.full((count, max([len(w) for w in words], default=0) or 1), -1, dtype=np.int64)
+        for i, ids in enumerate(words):
+            self.word_ids[i, :len(ids)] = ids
+        self.order = np.argsort(-self.lengths, kind='stable')
+
+    def pattern_masks(self, rows):
+        """(all-ones mask, highest bit) per pattern row, lengths clamped to 1..64."""
+        m = np.clip(self.lengths[rows], 1, BIT_WIDTH).astype(np.uint64)
+        high = np.left_shift(np.uint64(1), m - np.uint64(1))
+        return (high - np.uint64(1)) | high, high
+
+
+def _bit_parallel(strings, rows=slice(None)):
+    """Whether the kernels can take strings[rows] as patterns (64 characters at most)."""
+    return not (strings.lengths[rows] > BIT_WIDTH).any()
+
+
+def _alphabet(*string_lists):
+    chars = sorted({c for strings in string_lists for s in strings for c in s})
+    return {c: i for i, c in enumerate(chars)}
+
+
+def _by_text_length(lengths):
+    """Permutation putting pairs longest text first (None when they already are), and
+    how many pairs are still active at each character position."""
+    order = None
+    if len(lengths) > 1 and (lengths[1:] > lengths[:-1]).any():
+        order = np.argsort(-lengths, kind='stable')
+        lengths = lengths[order]
+    active = np.searchsorted(-lengths, -np.arange(int(lengths[0]) if len(lengths) else 0), side='left')
+    return order, active
+
+
+def _unsorted(values, order):
+    if order is None:
+        return values
+    result = np.empty_like(values)
+    result[order] = values
+    return result
+
+
+def _myers(eq_at, mask, active, shape):
+    """Bit-parallel Levenshtein (Myers/Hyyro) over the text positions: each pattern's net vertical delta.
+
+    Arrays are text-major and pairs run longest text first, so step j only
+    touches the first `count` pairs, those whose text is that long, and each
+    pair is left holding its last column: the distance is the text length
+    plus the +1/-1 vertical deltas in it.
+    """
+    pv = np.broadcast_to(mask, shape).copy()
+    mv = np.zeros(shape, dtype=np.uint64)
+    one = np.uint64(1)
+    for j, count in enumerate(active):
+        eq = eq_at(j, count)
+        v, m = pv[:count], mv[:count]
+        xv = eq | m
+        xh = (((eq & v) + v) ^ v) | eq
+        ph = (m | ~(xh | v)) << one | one
+        mh = (v & xh) << one
+        pv[:count] = mh | ~(xv | ph)
+        mv[:count] = ph & xv
+    return np.bitwise_count(pv & mask).astype(np.int64) - np.bitwise_count(mv & mask)
+
+
+def _shift_and(eq_at, high, active, shape):
+    """Shift-And over the text positions: whether each pattern occurred. Same layout as _myers()."""
+    state = np.zeros(shape, dtype=np.uint64)
+    # OR of every state: the pattern's high bit is set once it has matched
+    seen = np.zeros(shape, dtype=np.uint64)
+    one = np.uint64(1)
+    for j, count in enumerate(active):
+        d = ((state[:count] << one) | one) & eq_at(j, count)
+        state[:count] = d
+        seen[:count] |= d
+    return (seen & high) != 0
+
+
+def _pair_gather(patterns, p, texts, t):
+    """eq_at() for string pairs (patterns[p], texts[t]): one Peq word per pair."""
+    peq, base = patterns.peq.ravel(), p * patterns.peq.shape[1]
+    return lambda j, count: peq.take(base[:count] + texts.columns[j].take(t[:count]))
+
+
+def _block_gather(patterns, rows, texts, t):
+    """eq_at() for texts[t] x patterns[rows]: a row of Peq words per text."""
+    peq = np.ascontiguousarray(patterns.peq[rows].T)
+    return lambda j, count: peq[texts.columns[j].take(t[:count])]
+
+
+def _levenshtein_pairs(patterns, p, texts, t):
+    """Levenshtein distances of string pairs (patterns[p], texts[t]), patterns <= 64 chars."""
+    order, active = _by_text_length(texts.lengths[t])
+    if order is not None:
+        p, t = p[order], t[order]
+    mask, _ = patterns.pattern_masks(p)
+    lengths = texts.lengths[t]
+    distance = lengths + _myers(_pair_gather(patterns, p, texts, t), mask, active, len(p))
+    # Empty patterns: the distance is the text length
+    empty = patterns.lengths[p] == 0
+    distance[empty] = lengths[empty]
+    return _unsorted(distance, order)
+
+
+def _levenshtein_block(patterns, rows, texts, t):
+    """Levenshtein distances of texts[t] x patterns[rows] as a matrix, patterns <= 64 chars."""
+    order, active = _by_text_length(texts.lengths[t])
+    if order is not None:
+        t = t[order]
+    mask, _ = patterns.pattern_masks(rows)
+    lengths = texts.lengths[t][:, None]
+    distance = lengths + _myers(_block_gather(patterns, rows, texts, t), mask, active, (len(t), len(rows)))
+    empty = patterns.lengths[rows] == 0
+    distance[:, empty] = lengths
+    return _unsorted(distance, order)
+
+
+def _contains_pairs(patterns, p, texts, t):
+    """Whether patterns[p] occurs in texts[t] for string pairs, patterns <= 64 chars."""
+    order, active = _by_text_length(texts.lengths[t])
+    if order is not None:
+        p, t = p[order], t[order]
+    _, high = patterns.pattern_masks(p)
+    found = _shift_and(_pair_gather(patterns, p, texts, t), high, active, len(p)) | (patterns.lengths[p] == 0)
+    return _unsorted(found, order)
+
+
+def _contains_block(patterns, rows, texts, t):
+    """Whether patterns[rows] occur in texts[t], as a texts x patterns matrix, patterns <= 64 chars."""
+    order, active = _by_text_length(texts.lengths[t])
+    if order is not None:
+        t = t[order]
+    _, high = patterns.pattern_masks(rows)
+    found = _shift_and(_block_gather(patterns, rows, texts, t), high, active, (len(t), len(rows)))
+    found[:, patterns.lengths[rows] == 0] = True
+    return _unsorted(found, order)
+
+
+def _word_jaccard(source, p, target, t):
+    """Word Jaccard of string pairs (source[p], target[t])."""
+    words = target.word_ids[t]
+    shared = np.zeros(len(p), dtype=np.float32)
+    for column in source.word_ids[p].T:
+        shared += ((words == column[:, None]) & (column >= 0)[:, None]).any(axis=1)
+    union = source.word_counts[p] + target.word_counts[t] - shared
+    return np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+
+class SimilarityEngine:
+    """Score source x target field pairs, all of them or the candidates of a CandidateIndex."""
+
+    def __init__(self, sources, targets):
+        require_numpy()
+        self.sources, self.targets = sources, targets
+        names_s = [normalize_name(f['name']) for f in sources]
+        names_t = [normalize_name(f['name']) for f in targets]
+        labels_s = [normalize_label(f['label']) for f in sources]
+        labels_t = [normalize_label(f['label']) for f in targets]
+        alphabet = _alphabet(names_s, names_t, labels_s, labels_t)
+        vocabulary = {}
+        self.names = (_Strings(names_s, alphabet, vocabulary), _Strings(names_t, alphabet, vocabulary))
+        self.labels = (_Strings(labels_s, alphabet, vocabulary), _Strings(labels_t, alphabet, vocabulary))
+        for source, target in (self.names, self.labels):
+            # Shared ids for equality tests across the two sides
+            ids = {s: i for i, s in enumerate(dict.fromkeys(source.strings + target.strings))}
+            source.ids = np.array([ids[s] for s in source.strings], dtype=np.int64)
+            target.ids = np.array([ids[s] for s in target.strings], dtype=np.int64)
+
+        types = sorted({f['type'].lower() for f in sources + targets})
+        type_index = {t: i for i, t in enumerate(types)}
+        self.type_matrix = np.array([[type_compatibility(a, b) for b in types] for a in types], dtype=np.float32)
+        self.types_s = np.array([type_index[f['type'].lower()] for f in sources], dtype=np.int64)
+        self.types_t = np.array([type_index[f['type'].lower()] for f in targets], dtype=np.int64)
+
+    @staticmethod
+    def _distance(source, p, target, t, block=None):
+        if block is not None and _bit_parallel(source, block):
+            return _levenshtein_block(source, block, target, target.order).ravel()
+        long = np.flatnonzero(source.lengths[p] > BIT_WIDTH)
+        if not len(long):
+            return _levenshtein_pairs(source, p, target, t)
+        distance = np.empty(len(p), dtype=np.int64)
+        short = np.flatnonzero(source.lengths[p] <= BIT_WIDTH)
+        distance[short] = _levenshtein_pairs(source, p[short], target, t[short])
+        distance[long] = [levenshtein(source.strings[p[i]], target.strings[t[i]]) for i in long]
+        return distance
+
+    @staticmethod
+    def _contains(patterns, p, texts, t):
+        long = np.flatnonzero(patterns.lengths[p] > BIT_WIDTH)
+        if not len(long):
+            return _contains_pairs(patterns, p, texts, t)
+        found = np.empty(len(p), dtype=bool)
+        short = np.flatnonzero(patterns.lengths[p] <= BIT_WIDTH)
+        found[short] = _contains_pairs(patterns, p[short], texts, t[short])
+        found[long] = [patterns.strings[p[i]] in texts.strings[t[i]] for i in long]
+        return found
+
+    def _name_similarity(self, p, t, block=None):
+        """Name similarity of string pairs (p, t).
+
+        block is set by _matrix(): the distinct source strings, when the pairs
+        are each of them against every target, longest target first; the
+        kernels then run on (target, source) matrices, which gather faster.
+        """
+        source, target = self.names
+        equal = source.ids[p] == target.ids[t]
+        distance = self._distance(source, p, target, t, block)
+        lengths_s, lengths_t = source.lengths[p], target.lengths[t]
+        # One string can only contain the other when the distance is the length difference
+        contains = np.zeros(len(p), dtype=bool)
+        for i in np.flatnonzero((distance == np.abs(lengths_s - lengths_t)) & ~equal):
+            a, b = source.strings[p[i]], target.strings[t[i]]
+            contains[i] = a in b or b in a
+        longer = np.maximum(lengths_s, lengths_t).astype(np.float32)
+        edit = 1 - np.divide(distance, longer, out=np.zeros(len(p), dtype=np.float32), where=longer > 0)
+        jaccard = _word_jaccard(source, p, target, t)
+        return np.where(equal, 1.0, np.where(contains, 0.85, edit * 0.6 + jaccard * 0.4))
+
+    def _label_similarity(self, p, t, block=None):
+        """Label similarity of string pairs (p, t); block as for _name_similarity()."""
+        source, target = self.labels
+        equal = source.ids[p] == target.ids[t]
+        if block is not None and _bit_parallel(source, block) and _bit_parallel(target):
+            contains = (_contains_block(source, block, target, target.order)
+                        | _contains_block(target, target.order, source, block).T).ravel()
+        else:
+            contains = self._contains(source, p, target, t) | self._contains(target, t, source, p)
+        similarity = np.where(equal, 1.0, np.where(contains, 0.8, _word_jaccard(source, p, target, t)))
+        return np.where((source.lengths[p] == 0) | (target.lengths[t] == 0), 0.0, similarity)
+
+    @staticmethod
+    def _matrix(strings, rows, similarity):
+        """similarity() of source fields rows x every target field, computed once per distinct string pair."""
+        source, target = strings
+        distinct, back = np.unique(source.index[rows], return_inverse=True)
+        count = len(target.strings)
+        # Pairs ordered longest target first, the layout of the kernels' block mode
+        values = similarity(np.tile(distinct, count), np.repeat(target.order, len(distinct)), distinct)
+        matrix = np.empty((len(distinct), count), dtype=np.float32)
+        matrix[:, target.order] = values.reshape(count, len(distinct)).T
+        return matrix[back][:, target.index]
+
+    @staticmethod
+    def _pairs(strings, rows, cols, similarity):
+        """similarity() of field pairs (rows[i], cols[i]), computed once per distinct string pair."""
+        source, target = strings
+        count = len(target.strings)
+        keys, back = np.unique(source.index[rows] * count + target.index[cols], return_inverse=True)
+        return similarity(keys // count, keys % count).astype(np.float32)[back]
+
+    def score_rows(self, rows):
+        """(score, name, label, type) matrices for source rows against every target."""
+        rows = np.asarray(rows)
+        name = self._matrix(self.names, rows, self._name_similarity)
+        label = self._matrix(self.labels, rows, self._label_similarity)
+        type_ = self.type_matrix[self.types_s[rows][:, None], self.types_t[None, :]]
+        return combine(name, label, type_), name, label, type_
+
+    def score_pairs(self, rows, cols):
+        """(score, name, label, type) arrays for the field pairs (rows[i], cols[i])."""
+        name = self._pairs(self.names, rows, cols, self._name_similarity)
+        label = self._pairs(self.labels, rows, cols, self._label_similarity)
+        type_ = self.type_matrix[self.types_s[rows], self.types_t[cols]]
+        return combine(name, label, type_), name, label, type_
+
+    def top_k(self, k=DEFAULT_TOP_K, min_score=0.0, index=None, rows=None, chunk_pairs=CHUNK_PAIRS):
+        """Yield (source index, [(target index, score, name, label, type), ...]) best first.
+
+        With a CandidateIndex only its candidates for each source field are
+        scored. Equal scores rank by target order, so the output is deterministic.
+        """
+        rows = np.arange(len(self.sources)) if rows is None else np.unique(rows)
+        if not len(self.targets):
+            for row in rows:
+                yield int(row), []
+            return
+        chunk = max(1, chunk_pairs // (index.candidates if index else len(self.targets)))
+        for start in range(0, len(rows), chunk):
+            chunk_rows = rows[start:start + chunk]
+            if index is None:
+                yield from self._best_of_matrix(chunk_rows, k, min_score)
+                continue
+            pair_rows, cols = index.query(self.sources, chunk_rows)
+            values = self.score_pairs(pair_rows, cols)
+            # Grouped by source row, best score first, then target order
+            order = np.lexsort((cols, -values[0], pair_rows))
+            sorted_rows = pair_rows[order]
+            starts = np.searchsorted(sorted_rows, chunk_rows, side='left')
+            ends = np.searchsorted(sorted_rows, chunk_rows, side='right')
+            for row, first, last in zip(chunk_rows, starts, ends):
+                yield int(row), [(int(cols[i]), *(float(v[i]) for v in values))
+                                 for i in order[first:min(last, first + k)] if values[0][i] >= min_score]
+
+    def _best_of_matrix(self, rows, k, min_score):
+        score, name, label, type_ = self.score_rows(rows)
+        k = min(k, len(self.targets))
+        kth = -np.partition(-score, k - 1, axis=1)[:, k - 1]
+        for r, row in enumerate(rows):
+            candidates = np.flatnonzero(score[r] >= kth[r])
+            best = candidates[np.lexsort((candidates, -score[r, candidates]))][:k]
+            yield int(row), [(int(t), float(score[r, t]), float(name[r, t]), float(label[r, t]), float(type_[r, t]))
+                             for t in best if score[r, t] >= min_score]
+
+
+def field_features(field):
+    """Index features of a field: its name and label words, and the trigrams of both with spaces removed.
+
+    Words keep a leading space, which no trigram has.
+    """
+    features = set()
+    for text in (normalize_name(field['name']), normalize_label(field['label'])):
+        words = text.split()
+        features.update(' ' + word for word in words)
+        compact = '^' + ''.join(words) + '$'
+        features.update(compact[i:i + 3] for i in range(len(compact) - 2))
+    return features
+
+
+class CandidateIndex:
+    """Trigram and word inverted index over the target fields' names and labels.
+
+    query() looks up each source field's rarest few features, skipping those
+    on more than max_df of the targets, so it reads short postings lists
+    however large the catalog. The targets found are ranked by an estimate of
+    the score: the share of the looked-up feature weight (IDF) they match
+    stands in for name and label similarity, next to the exact type
+    compatibility, and the best `candidates` are kept for exact scoring.
+    """
+
+    def __init__(self, targets, candidates=DEFAULT_CANDIDATES, probes=DEFAULT_PROBES, max_df=MAX_DF):
+        require_numpy()
+        postings = {}
+        for i, field in enumerate(targets):
+            for feature in field_features(field):
+                postings.setdefault(feature, []).append(i)
+        self.count = len(targets)
+        self.postings = {feature: np.array(columns, dtype=np.int64) for feature, columns in postings.items()}
+        # Total feature weight of each target
+        self.weights = np.zeros(self.count)
+        for columns in self.postings.values():
+            self.weights[columns] += self._weight(columns)
+        self.candidates = max(1, min(candidates, self.count))
+        self.probes = probes
+        self.limit = max(MIN_POSTINGS_LIMIT, int(max_df * self.count))
+        self.types = sorted({f['type'].lower() for f in targets})
+        type_index = {t: i for i, t in enumerate(self.types)}
+        self.target_types = np.array([type_index[f['type'].lower()] for f in targets], dtype=np.int64)
+        self._compatibility = {}
+
+    def _weight(self, postings):
+        return math.log(1 + self.count / len(postings))
+
+    def _type_row(self, type_):
+        """Compatibility of one source type with every target type."""
+        row = self._compatibility.get(type_)
+        if row is None:
+            row = self._compatibility[type_] = np.array([type_compatibility(type_, t) for t in self.types],
+                                                        dtype=np.float32)
+        return row
+
+    def query(self, fields, rows):
+        """(rows, target columns) of the candidate pairs for fields[rows], up to `candidates` per row."""
+        rows = np.asarray(rows)
+        block = max(1, QUERY_CELLS // max(1, self.count))
+        found = [self._query_block(fields, rows[start:start + block]) for start in range(0, len(rows), block)]
+        return np.concatenate([f[0] for f in found]), np.concatenate([f[1] for f in found])
+
+    def _query_block(self, fields, rows):
+        lists, probed, field_weights = [], [], []
+        for row in rows.tolist():
+            postings = sorted((p for p in map(self.postings.get, field_features(fields[row])) if p is not None), key=len)
+            field_weights.append(sum(map(self._weight, postings)))
+            # The rarest few; when even the rarest is common, that one alone
+            postings = [p for p in postings[:self.probes] if len(p) <= self.limit] or postings[:1]
+            lists.append(postings)
+            probed.append(sum(map(self._weight, postings)) or 1.0)
+        lengths = [len(p) for postings in lists for p in postings]
+        if not lengths:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        local = np.repeat(np.repeat(np.arange(len(rows)), [len(postings) for postings in lists]), lengths)
+        columns = np.concatenate([p for postings in lists for p in postings])
+        weights = np.repeat([self._weight(p) for postings in lists for p in postings], lengths)
+        # Matched weight per (row, target), accumulated densely over this block of rows
+        matched = np.bincount(local * self.count + columns, weights=weights, minlength=len(rows) * self.count)
+        pairs = np.flatnonzero(matched)
+        local, columns = pairs // self.count, pairs % self.count
+        # Cosine-like: the share of the looked-up weight matched, scaled by the size ratio
+        shared = matched[pairs] / np.array(probed)[local]
+        shared = np.minimum(1.0, shared * np.sqrt(np.array(field_weights)[local] / self.weights[columns]))
+        types = np.stack([self._type_row(fields[row]['type'].lower()) for row in rows.tolist()])
+        estimate = ((WEIGHTS['name'] + WEIGHTS['label']) * shared
+                    + WEIGHTS['type'] * types[local, self.target_types[columns]])
+
+        # The best `candidates` of each row; pairs are grouped by row with targets ascending,
+        # so ties at the cut keep the first targets
+        bounds = np.searchsorted(local, np.arange(len(rows) + 1))
+        keep = []
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            if last - first <= self.candidates:
+                keep.append(np.arange(first, last))
+                continue
+            segment = estimate[first:last]
+            cut = np.partition(segment, len(segment) - self.candidates)[len(segment) - self.candidates]
+            above = np.flatnonzero(segment > cut)
+            tied = np.flatnonzero(segment == cut)[:self.candidates - len(above)]
+            keep.append(first + np.sort(np.concatenate((above, tied))))
+        keep = np.concatenate(keep)
+        return rows[local[keep]], columns[keep]
+
+
+def index_hits(best, got):
+    """For each exhaustive candidate in `best`, whether the indexed list `got` found it.
+
+    A candidate missing from `got` still counts when `got` is as long as
+    `best` and its last score ties or beats the candidate's, since equal
+    scores may rank either way. A shorter `got` means the index pruned
+    candidates, so only the targets it actually holds count.
+    """
+    targets = {candidate[0] for candidate in got}
+    floor = got[-1][1] if got and len(got) >= len(best) else float('-inf')
+    return [target in targets or score <= floor + 1e-4 for target, score, *_ in best]
+
+
+def evaluate_index(engine, index, k=DEFAULT_TOP_K, sample=DEFAULT_RECALL_SAMPLE, seed=1):
+    """Recall and speedup of the index against exhaustive scoring, on a sample of source fields.
+
+    An exhaustive top-k candidate counts as found when the indexed top-k holds
+    it or an equally scored target, since equal scores may rank either way.
+    strong_recall only counts candidates scoring STRONG_SCORE or more.
+    """
+    rng = random.Random(seed)
+    rows = np.array(sorted(rng.sample(range(len(engine.sources)), min(sample, len(engine.sources)))), dtype=np.int64)
+    start = time.perf_counter()
+    exhaustive = dict(engine.top_k(k, rows=rows))
+    exhaustive_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = dict(engine.top_k(k, index=index, rows=rows))
+    indexed_seconds = time.perf_counter() - start
+
+    found = total = strong_found = strong_total = 0
+    for row, best in exhaustive.items():
+        for (_, score, *_), hit in zip(best, index_hits(best, indexed[row])):
+            found += hit
+            total += 1
+            if score >= STRONG_SCORE:
+                strong_found += hit
+                strong_total += 1
+    return {
+        'sampled_sources': len(rows),
+        'recall': round(found / total, 4) if total else 1.0,
+        'strong_recall': round(strong_found / strong_total, 4) if strong_total else 1.0,
+        'exhaustive_ms_per_source': round(exhaustive_seconds * 1000 / max(1, len(rows)), 3),
+        'indexed_ms_per_source': round(indexed_seconds * 1000 / max(1, len(rows)), 3),
+        'speedup': round(exhaustive_seconds / indexed_seconds, 1) if indexed_seconds else None,
+    }
+
+
+def suggest(engine, k=DEFAULT_TOP_K, min_score=0.0, index=None):
+    """Top-k suggestions per source field as JSON-ready dicts."""
+    sources, targets = engine.sources, engine.targets
+    suggestions = []
+    for row, best in engine.top_k(k, min_score, index):
+        source = sources[row]
+        suggestions.append({
+            'source': field_id(source), 'label': source['label'], 'type': source['type'],
+            'candidates': [{'target': field_id(targets[t]), 'score': round(score, 1),
+                            'name': round(name, 3), 'label': round(label, 3), 'type': round(type_, 3)}
+                           for t, score, name, label, type_ in best],
+        })
+    return suggestions
+
+
+def write_suggestions(suggestions, output, k, search=None):
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if output.suffix.lower() == '.csv':
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['source', 'rank', 'target', 'score', 'name_similarity', 'label_similarity',
+                             'type_compatibility'])
+            for entry in suggestions:
+                for rank, candidate in enumerate(entry['candidates'], 1):
+                    writer.writerow([entry['source'], rank, candidate['target'], candidate['score'],
+                                     candidate['name'], candidate['label'], candidate['type']])
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'k': k, 'weights': WEIGHTS, 'search': search, 'suggestions': suggestions}, f, indent=1,
+                      ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic catalogs and benchmark
+# ---------------------------------------------------------------------------
+
+NAME_WORDS = ('quote line product price list net discount start end date term subscription bundle option '
+              'quantity amount total partner customer regional markup uplift renewal contract account owner '
+              'status type code family unit cost billing frequency segment proration effective block tier '
+              'volume schedule charge usage rate plan asset order invoice tax region channel approval '
+              'reason category group component feature constraint rule condition lookup summary variable '
+              'template document section primary expiration payment method margin special required hidden '
+              'optional default minimum maximum original prior upgraded source target pricing dimension'.split())
+FIELD_TYPES = ['string', 'textarea', 'picklist', 'currency', 'double', 'percent', 'integer', 'date', 'datetime',
+               'boolean', 'reference', 'email', 'url']
+STANDARD_FIELDS = [('Id', 'Record ID', 'id'), ('Name', 'Name', 'string'), ('OwnerId', 'Owner ID', 'reference'),
+                   ('CreatedDate', 'Created Date', 'datetime'), ('LastModifiedDate', 'Last Modified Date', 'datetime'),
+                   ('CurrencyIsoCode', 'Currency ISO Code', 'picklist')]
+SOURCE_OBJECTS = ['SBQQ__Quote__c', 'SBQQ__QuoteLine__c', 'Product2', 'SBQQ__Subscription__c', 'SBQQ__PriceRule__c',
+                  'SBQQ__DiscountSchedule__c', 'SBQQ__ProductOption__c', 'SBQQ__QuoteTemplate__c']
+TARGET_OBJECTS = ['Quote', 'QuoteLineItem', 'Product2', 'Asset', 'PriceAdjustmentSchedule', 'ProductSellingModel',
+                  'ProductRelatedComponent', 'DocumentTemplate']
+FIELDS_PER_OBJECT = 400
+# Target-side spellings of the same concept
+VARIANTS = {'quantity': 'qty', 'amount': 'amt', 'discount': 'disc', 'customer': 'cust', 'product': 'prod',
+            'subscription': 'sub', 'contract': 'cntrct', 'total': 'ttl', 'maximum': 'max', 'minimum': 'min'}
+
+
+def _objects(names, count):
+    """Object names for count fields; numbered copies once the list runs out."""
+    objects = -(-count // FIELDS_PER_OBJECT)
+    return [names[i % len(names)] + (f'{i // len(names)}' if i >= len(names) else '') for i in range(objects)]
+
+
+def synthetic_catalogs(sources, targets, seed=1):
+    """(source fields, target fields, {source index: planted target index}), CPQ-like source, RCA-like target.
+
+    Every object carries the standard fields; targets include a renamed
+    counterpart for most source custom fields, plus unrelated fields.
+    """
+    rng = random.Random(seed)
+
+    def custom_fields(object_name, count, seen):
+        fields = []
+        while len(fields) < count:
+            words = rng.sample(NAME_WORDS, rng.randint(1, 3))
+            key = (object_name, tuple(words))
+            if key not in seen:
+                seen.add(key)
+                fields.append(words)
+        return fields
+
+    source_fields, custom = [], []
+    seen = set()
+    for object_name in _objects(SOURCE_OBJECTS, sources):
+        for name, label, type_ in STANDARD_FIELDS:
+            source_fields.append({'object': object_name, 'name': name, 'label': label, 'type': type_})
+        for words in custom_fields(object_name, FIELDS_PER_OBJECT - len(STANDARD_FIELDS), seen):
+            custom.append(len(source_fields))
+            source_fields.append({'object': object_name, 'name': 'SBQQ__' + '_'.join(w.title() for w in words) + '__c',
+                                  'label': ' '.join(w.title() for w in words), 'type': rng.choice(FIELD_TYPES)})
+    source_fields = source_fields[:sources]
+
+    target_objects = _objects(TARGET_OBJECTS, targets)
+    target_fields, planted = [], {}
+    for object_name in target_objects:
+        for name, label, type_ in STANDARD_FIELDS:
+            target_fields.append({'object': object_name, 'name': name, 'label': label, 'type': type_})
+    for index in custom:
+        if index >= len(source_fields) or len(target_fields) >= targets or rng.random() > 0.8:
+            continue
+        source = source_fields[index]
+        renamed = [VARIANTS.get(w, w) if rng.random() < 0.5 else w for w in source['label'].lower().split()]
+        if rng.random() < 0.3:
+            renamed.append(rng.choice(NAME_WORDS))
+        planted[index] = len(target_fields)
+        target_fields.append({'object': target_objects[index * len(target_objects) // len(source_fields)],
+                              'name': ''.join(w.title() for w in renamed) + '__c',
+                              'label': ' '.join(renamed).title(), 'type': source['type']})
+    filler = custom_fields('', max(0, targets - len(target_fields)), seen)
+    for words in filler:
+        target_fields.append({'object': rng.choice(target_objects), 'name': ''.join(w.title() for w in words) + '__c',
+                              'label': ' '.join(w.title() for w in words), 'type': rng.choice(FIELD_TYPES)})
+    order = list(range(len(target_fields)))
+    rng.shuffle(order)
+    position = {old: new for new, old in enumerate(order)}
+    target_fields = [target_fields[old] for old in order]
+    return source_fields, target_fields, {s: position[t] for s, t in planted.items()}
+
+
+def check(engine, samples=200, seed=1):
+    """Largest difference between the engine and score_pair() over sampled sources."""
+    rng = random.Random(seed)
+    rows = sorted(rng.sample(range(len(engine.sources)), min(samples, len(engine.sources))))
+    worst = 0.0
+    for start in range(0, len(rows), 64):
+        chunk = rows[start:start + 64]
+        matrices = engine.score_rows(chunk)
+        for r, row in enumerate(chunk):
+            for t in rng.sample(range(len(engine.targets)), min(200, len(engine.targets))):
+                reference = score_pair(engine.sources[row], engine.targets[t])
+                worst = max(worst, max(abs(float(m[r, t]) - ref) for m, ref in zip(matrices, reference)))
+    return worst
+
+
+def check_index_hits():
+    """Recall counting on hand-made lists. Returns the names of the cases that fail."""
+    best = [(1, 0.9), (2, 0.8), (3, 0.8)]
+    cases = {
+        'full list': ([(1, 0.9), (2, 0.8), (3, 0.8)], [True, True, True]),
+        'tie ranked differently': ([(1, 0.9), (2, 0.8), (4, 0.8)], [True, True, True]),
+        'short list': ([(1, 0.9)], [True, False, False]),
+        'short list, lower scores': ([(4, 0.5), (2, 0.4)], [False, True, False]),
+        'empty list': ([], [False, False, False]),
+    }
+    failed = [name for name, (got, expected) in cases.items() if index_hits(best, got) != expected]
+    if index_hits([], []) != []:
+        failed.append('empty target catalog')
+    return failed
+
+
+def reference_seconds(sources, targets, budget=200_000):
+    """Plain Python score_pair() time for every pair, extrapolated from a sample of sources."""
+    sample = sources[:max(1, min(len(sources), budget // max(1, len(targets))))]
+    start = time.perf_counter()
+    for source in sample:
+        for target in targets:
+            score_pair(source, target)
+    return (time.perf_counter() - start) * len(sources) / len(sample)
+
+
+def benchmark(sizes, k=DEFAULT_TOP_K, candidates=DEFAULT_CANDIDATES, sample=DEFAULT_RECALL_SAMPLE, run_check=False,
+              report=print):
+    """Indexed vs exhaustive scoring on synthetic catalogs of each size; exhaustive time is
+    extrapolated from the sampled sources."""
+    results = []
+    for size in sizes:
+        sources, targets, planted = synthetic_catalogs(size, size)
+        start = time.perf_counter()
+        engine = SimilarityEngine(sources, targets)
+        index = CandidateIndex(targets, candidates)
+        build_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        suggestions = dict(engine.top_k(k, index=index))
+        indexed_seconds = time.perf_counter() - start
+        evaluation = evaluate_index(engine, index, k, sample)
+        exhaustive_seconds = evaluation['exhaustive_ms_per_source'] * len(sources) / 1000
+        planted_found = sum(1 for s, t in planted.items() if any(c[0] == t for c in suggestions[s]))
+        result = {
+            'sources': len(sources), 'targets': len(targets), 'k': k, 'candidates': index.candidates,
+            'build_seconds': round(build_seconds, 3), 'indexed_seconds': round(indexed_seconds, 3),
+            'exhaustive_seconds': round(exhaustive_seconds, 3),
+            'speedup': round(exhaustive_seconds / (build_seconds + indexed_seconds), 1),
+            'recall': evaluation['recall'], 'strong_recall': evaluation['strong_recall'],
+            'sampled_sources': evaluation['sampled_sources'],
+            'planted_in_top_k': round(planted_found / len(planted), 4) if planted else None,
+        }
+        report(f"{size:>7} x {size:<7} indexed {indexed_seconds:7.2f}s (+{build_seconds:.2f}s setup)  "
+               f"exhaustive ~{exhaustive_seconds:8.2f}s  {result['speedup']:6.1f}x  "
+               f"recall@{k} {result['recall']:.1%}  score>={STRONG_SCORE} {result['strong_recall']:.1%}  "
+               f"({result['sampled_sources']} sources sampled)")
+        if run_check:
+            ref_seconds = reference_seconds(sources, targets)
+            result['reference_seconds'] = round(ref_seconds, 1)
+            report(f"        plain Python ~{ref_seconds:,.0f}s ({ref_seconds / exhaustive_seconds:,.0f}x exhaustive); "
+                   f"max |engine - reference| = {check(engine):.2e}")
+    if run_check:
+        failed = check_index_hits()
+        report(f"recall counting: {'ok' if not failed else 'FAILED ' + ', '.join(failed)}")
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Precompute top-k field mapping suggestions for two catalogs')
+    parser.add_argument('source', nargs='?', help='Source field catalog (.json or .csv)')
+    parser.add_argument('target', nargs='?', help='Target field catalog (.json or .csv)')
+    parser.add_argument('-k', type=int, default=DEFAULT_TOP_K, help=f'Candidates per source field (default: {DEFAULT_TOP_K})')
+    parser.add_argument('-o', '--output', help='Output .json or .csv (default: print JSON)')
+    parser.add_argument('--min-score', type=float, default=0.0, help='Drop candidates scoring below this (0-100)')
+    parser.add_argument('--search', choices=('auto', 'index', 'exhaustive'), default='auto',
+                        help=f'Score index candidates or every pair (auto: index above {AUTO_INDEX_PAIRS:,} pairs)')
+    parser.add_argument('--candidates', type=int, default=DEFAULT_CANDIDATES,
+                        help=f'Index candidates scored per source field (default: {DEFAULT_CANDIDATES})')
+    parser.add_argument('--recall-sample', type=int, default=DEFAULT_RECALL_SAMPLE,
+                        help='Source fields scored exhaustively to report index recall (0: skip)')
+    parser.add_argument('--bench', help='Comma-separated synthetic catalog sizes to benchmark, e.g. 1000,10000,100000')
+    parser.add_argument('--check', action='store_true', help='With --bench, compare against the plain Python scorer')
+    args = parser.parse_args(argv)
+
+    require_numpy()
+    if args.bench:
+        results = benchmark([int(size) for size in args.bench.split(',')], args.k, args.candidates,
+                            args.recall_sample or DEFAULT_RECALL_SAMPLE, args.check)
+        if args.output:
+            Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump({'benchmark': results}, f, indent=1)
+            print(f"📄 Results written to {args.output}")
+        return
+    if not args.source or not args.target:
+        parser.error('source and target catalogs are required (or use --bench)')
+
+    sources, targets = load_catalog(args.source), load_catalog(args.target)
+    start = time.perf_counter()
+    engine = SimilarityEngine(sources, targets)
+    use_index = args.search == 'index' or (args.search == 'auto' and len(sources) * len(targets) > AUTO_INDEX_PAIRS)
+    index = CandidateIndex(targets, args.candidates) if use_index else None
+    suggestions = suggest(engine, args.k, args.min_score, index)
+    seconds = time.perf_counter() - start
+
+    search = {'mode': 'index' if index else 'exhaustive', 'seconds': round(seconds, 3)}
+    if index:
+        search['candidates'] = index.candidates
+        if args.recall_sample:
+            search.update(evaluate_index(engine, index, args.k, args.recall_sample))
+    if args.output:
+        write_suggestions(suggestions, args.output, args.k, search)
+        print(f"✅ {len(sources)} x {len(targets)} fields scored in {seconds:.2f}s ({search['mode']}); "
+              f"top-{args.k} suggestions written to {args.output}")
+        if 'recall' in search:
+            print(f"   index recall@{args.k} {search['recall']:.1%} (score>={STRONG_SCORE}: {search['strong_recall']:.1%}), "
+                  f"{search['speedup']}x faster than exhaustive on {search['sampled_sources']} sampled fields")
+    else:
+        print(json.dumps({'k': args.k, 'weights': WEIGHTS, 'search': search, 'suggestions': suggestions},
+                         indent=1, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    with docs_profile.profile_from_argv():
+        main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Fingerprint static assets in the publish directory for cache-forever hosting.
+
+Every CSS/JS/image/font asset gets a content-hashed copy next to it
+(styles.css -> styles.3f2a9c1b7e.css), and every reference to it from HTML
+(src/href) and CSS (url(...)) is rewritten to the hashed name through
+asset-manifest.json. Names are derived from content, so only assets that
+changed get new names; the previous generation of hashed files is kept so
+pages still cached in browsers keep working for one more publish.
+
+Assets that are already hashed by their own build (the Vite output in
+app/assets/) are left as they are. The original files stay in place for
+anything that references them by a fixed name.
+
+It also writes build/nginx/revnova-docs-cache.conf with the matching cache
+rules: hashed assets are immutable for a year, HTML is always revalidated.
+Deploy it to /etc/nginx/snippets/, where the docs location in
+backend/nginx-config.conf includes it.
+
+Runs in place on the publish directory, never on docs/:
+    python scripts/minify_html.py
+    python scripts/fingerprint_assets.py
+    python scripts/compress_assets.py --root build/docs
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DIR = REPO_ROOT / 'docs'
+PUBLISH_DIR = REPO_ROOT / 'build' / 'docs'
+NGINX_SNIPPET = REPO_ROOT / 'build' / 'nginx' / 'revnova-docs-cache.conf'
+MANIFEST_NAME = 'asset-manifest.json'
+
+ASSET_SUFFIXES = {'.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.webp',
+                  '.woff', '.woff2', '.ttf', '.eot'}
+HASH_LENGTH = 10
+# Directories whose files are already content-hashed by their own build
+PREHASHED_DIRS = ['app/assets']
+FINGERPRINTED_PATTERN = re.compile(r'\.[0-9a-f]{%d}\.[A-Za-z0-9]+$' % HASH_LENGTH)
+
+HTML_REFERENCE_PATTERN = re.compile(r'''(\b(?:src|href)\s*=\s*)(["'])([^"']+)\2''', re.IGNORECASE)
+CSS_URL_PATTERN = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''', re.IGNORECASE)
+
+
+def _is_prehashed(relative):
+    return any(relative == d or relative.startswith(d + '/') for d in PREHASHED_DIRS)
+
+
+def find_assets(root):
+    """Fingerprintable assets under root (relative posix paths), CSS last."""
+    assets = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            relative = path.relative_to(root).as_posix()
+            if (path.suffix.lower() in ASSET_SUFFIXES and not filename.startswith('.')
+                    and not FINGERPRINTED_PATTERN.search(filename) and not _is_prehashed(relative)):
+                assets.append(relative)
+    # CSS can reference the other assets, so it is hashed after them
+    return sorted(assets, key=lambda relative: (relative.endswith('.css'), relative))
+
+
+def hashed_name(relative, data):
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    path = Path(relative)
+    return path.with_name(f'{path.stem}.{digest}{path.suffix}').as_posix()
+
+
+def _resolve(reference, base_dir, root):
+    """Return the root-relative path a reference points at, or None if it leaves root or is external."""
+    if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*:|^//|^#|^data:', reference) or reference.startswith('/'):
+        return None
+    path = reference.split('#', 1)[0].split('?', 1)[0]
+    if not path:
+        return None
+    target = os.path.normpath(os.path.join(base_dir, path)).replace(os.sep, '/')
+    if target.startswith('../') or target == '..':
+        return None
+    return target
+
+
+def rewrite_reference(reference, base_dir, root, manifest):
+    """Point reference at the hashed asset if it names one, keeping ?query and #fragment."""
+    target = _resolve(reference, base_dir, root)
+    if target is not None and FINGERPRINTED_PATTERN.search(target):
+        # Already fingerprinted by an earlier run: point it at the current hash
+        target = FINGERPRINTED_PATTERN.sub(lambda m: m.group(0)[HASH_LENGTH + 1:], target)
+    if target is None or target not in manifest:
+        return reference
+    path = reference.split('#', 1)[0].split('?', 1)[0]
+    suffix = reference[len(path):]
+    hashed = os.path.relpath(manifest[target], base_dir or '.').replace(os.sep, '/')
+    return hashed + suffix
+
+
+def rewrite_html(html, base_dir, root, manifest):
+    return HTML_REFERENCE_PATTERN.sub(
+        lambda m: m.group(1) + m.group(2) + rewrite_reference(m.group(3), base_dir, root, manifest) + m.group(2),
+        html)
+
+
+def rewrite_css(css, base_dir, root, manifest):
+    return CSS_URL_PATTERN.sub(
+        lambda m: f'url({m.group(1)}{rewrite_reference(m.group(2), base_dir, root, manifest)}{m.group(1)})',
+        css)
+
+
+def load_manifest(root):
+    try:
+        with open(root / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def fingerprint_tree(root=PUBLISH_DIR):
+    """Fingerprint assets and rewrite references under root.
+
+    Returns (manifest, created, unchanged, removed, pages_rewritten).
+    """
+    root = Path(root)
+    previous = load_manifest(root)
+    last_assets = previous.get('assets', {})
+    last_previous = previous.get('previous', {})
+    manifest = {}
+    # The hash each asset had before its last change, kept for one generation
+    generation = {}
+    created = unchanged = 0
+
+    for relative in find_assets(root):
+        path = root / relative
+        with open(path, 'rb') as f:
+            data = f.read()
+        if relative.endswith('.css'):
+            base_dir = os.path.dirname(relative)
+            data = rewrite_css(data.decode('utf-8'), base_dir, root, manifest).encode('utf-8')
+        hashed = hashed_name(relative, data)
+        hashed_path = root / hashed
+        if hashed_path.exists():
+            unchanged += 1
+        else:
+            with open(hashed_path, 'wb') as f:
+                f.write(data)
+            shutil.copystat(path, hashed_path)
+            created += 1
+        manifest[relative] = hashed
+        if last_assets.get(relative, hashed) != hashed:
+            generation[relative] = last_assets[relative]
+        elif relative in last_previous:
+            generation[relative] = last_previous[relative]
+
+    # Keep the current and previous generation; anything older is unreferenced
+    keep = set(manifest.values()) | set(generation.values())
+    removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            if FINGERPRINTED_PATTERN.search(filename):
+                relative = (Path(dirpath) / filename).relative_to(root).as_posix()
+                if relative not in keep and not _is_prehashed(relative):
+                    os.remove(root / relative)
+                    removed += 1
+
+    pages_rewritten = 0
+    for page in sorted(root.rglob('*.html')):
+        with open(page, 'r', encoding='utf-8') as f:
+            html = f.read()
+        base_dir = os.path.dirname(page.relative_to(root).as_posix())
+        new_html = rewrite_html(html, base_dir, root, manifest)
+        if new_html != html:
+            with open(page, 'w', encoding='utf-8') as f:
+                f.write(new_html)
+            pages_rewritten += 1
+
+    with open(root / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'assets': manifest, 'previous': generation}, f, indent=1, sort_keys=True)
+        f.write('\n')
+    return manifest, created, unchanged, removed, pages_rewritten
+
+
+def render_nginx_rules():
+    """Cache rules to nest inside the docs location block (see backend/nginx-config.conf)."""
+    suffixes = '|'.join(sorted(suffix[1:] for suffix in ASSET_SUFFIXES))
+    prehashed = '|'.join(re.escape(d) for d in PREHASHED_DIRS)
+    headers = ('            gzip_static on;\n'
+               '            add_header Vary Accept-Encoding;\n'
+               '            add_header Cache-Control "public, max-age=31536000, immutable";\n')
+    return (f'# Generated by scripts/fingerprint_assets.py. Do not edit.\n'
+            f'# Nest inside the docs location; assets with a content hash in their name never change.\n'
+            f'        location ~* \\.[0-9a-f]{{{HASH_LENGTH}}}\\.(?:{suffixes})$ {{\n'
+            f'{headers}'
+            f'        }}\n'
+            f'        location ~* /(?:{prehashed})/ {{\n'
+            f'{headers}'
+            f'        }}\n'
+            f'        # Pages and unhashed files: always revalidate (cheap 304s via ETag)\n'
+            f'        location ~* \\.html$ {{\n'
+            f'            gzip_static on;\n'
+            f'            add_header Vary Accept-Encoding;\n'
+            f'            add_header Cache-Control "no-cache";\n'
+            f'        }}\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fingerprint static assets in the publish directory')
+    parser.add_argument('--root', default=str(PUBLISH_DIR), help='Publish directory (default: build/docs)')
+    parser.add_argument('--nginx', default=str(NGINX_SNIPPET),
+                        help='Where to write the nginx cache rules (default: build/nginx/revnova-docs-cache.conf)')
+    args = parser.parse_args(argv)
+
+    root = Path(args.root)
+    if root.resolve() == DOCS_DIR.resolve():
+        print("❌ Refusing to fingerprint docs/ in place; run minify_html.py and fingerprint build/docs")
+        return 2
+    if not root.is_dir():
+        print(f"❌ Not a directory: {root} (run scripts/minify_html.py first)")
+        return 1
+
+    manifest, created, unchanged, removed, pages = fingerprint_tree(root)
+    nginx_path = Path(args.nginx)
+    nginx_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(nginx_path, 'w', encoding='utf-8') as f:
+        f.write(render_nginx_rules())
+
+    print(f"🔖 {len(manifest)} assets: {created} new fingerprints, {unchanged} unchanged, "
+          f"{removed} stale removed; {pages} page(s) rewritten")
+    print(f"   Manifest: {root / MANIFEST_NAME}")
+    print(f"   nginx rules: {nginx_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
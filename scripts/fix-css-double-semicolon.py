@@ -14,21 +14,25 @@ import os
 import re
 from pathlib import Path
 
-def fix_css_double_semicolon(file_path):
-    """Fix double semicolon in CSS style attributes."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
+import docs_profile
+import docs_writer
+
+def fix_css_content(content):
+    """Return content with the #333;;cursor double semicolon collapsed."""
     # Replace double semicolons with single semicolon
     # Pattern: #333;;cursor -> #333;cursor
-    content = re.sub(r'#333;;cursor', r'#333;cursor', content)
+    return re.sub(r'#333;;cursor', r'#333;cursor', content)
+
+def fix_css_double_semicolon(file_path, tx):
+    """Fix double semicolon in CSS style attributes (staged in tx)."""
+    content = tx.read(file_path)
+    
+    original_content = content
+    content = fix_css_content(content)
     
     # Check if any changes were made
     if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        tx.write(file_path, content)
         return True
     return False
 
@@ -51,19 +55,21 @@ def main():
     print(f"🔧 Fixing CSS double semicolon bug in {len(affected_files)} files...\n")
     
     fixed_count = 0
-    for filename in affected_files:
-        file_path = docs_dir / filename
-        if file_path.exists():
-            if fix_css_double_semicolon(file_path):
-                print(f"✅ Fixed: {filename}")
-                fixed_count += 1
+    with docs_writer.transaction() as tx:
+        for filename in affected_files:
+            file_path = docs_dir / filename
+            if file_path.exists():
+                if fix_css_double_semicolon(file_path, tx):
+                    print(f"✅ Fixed: {filename}")
+                    fixed_count += 1
+                else:
+                    print(f"⚠️  No changes: {filename}")
             else:
-                print(f"⚠️  No changes: {filename}")
-        else:
-            print(f"❌ Not found: {filename}")
+                print(f"❌ Not found: {filename}")
     
     print(f"\n✨ Complete! Fixed {fixed_count} out of {len(affected_files)} files.")
     print(f"📝 Bug: color:#333;;cursor -> color:#333;cursor")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -4,49 +4,35 @@ Adds cursor:default style to week headers to prevent accidental clicks.
 """
 
 import re
-from pathlib import Path
 
-def fix_week_header_styles(file_path):
-    """Add cursor:default to week headers that are missing it"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+import docs_pages
+import docs_profile
+import docs_writer
+
+def fix_week_header_styles(file_path, tx):
+    """Add cursor:default to week headers that are missing it (staged in tx)"""
+    content = tx.read(file_path)
     
     original_content = content
     
-    # Pattern 1: <span style="font-weight:600;color:#333;"> without cursor
+    # Pattern 1: <span style="font-weight:600;color:#333;"> without cursor.
+    # The style must end right after color, so headers that already have
+    # cursor:default never match and a rerun changes nothing.
     pattern1 = r'(<li class="has-children"><span style="font-weight:600;color:#333;)(">[^<]+</span>)'
-    replacement1 = r'\1;cursor:default;display:block;padding:0.6rem 0;\2'
-    
-    # Only replace if cursor:default is not already present
-    if 'cursor:default' not in content or 'cursor: default' not in content:
-        content = re.sub(pattern1, replacement1, content)
-    
-    # Pattern 2: <span style="font-weight:600;color:#333;cursor:default;"> but missing display and padding
-    pattern2 = r'(<li class="has-children"><span style="font-weight:600;color:#333;cursor:default;)(">[^<]+</span>)'
-    replacement2 = r'\1;display:block;padding:0.6rem 0.\2'
+    replacement1 = r'\1cursor:default;display:block;padding:0.6rem 0;\2'
+    content = re.sub(pattern1, replacement1, content)
     
     # Check if changes were made
     if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        tx.write(file_path, content)
         return True
     
     return False
 
 def main():
     """Fix all dev files from Days 6-25"""
-    docs_dir = Path(__file__).parent.parent / "docs" / "Onboarding"
-    
-    pattern = re.compile(r"dev(\d+)-day(\d+)\.html")
-    files_to_fix = []
-    
-    for file in docs_dir.glob("dev*-day*.html"):
-        match = pattern.match(file.name)
-        if match:
-            dev = int(match.group(1))
-            day = int(match.group(2))
-            if day >= 6:  # Week 2+ only
-                files_to_fix.append(file)
+    # Week 2+ only
+    files_to_fix = [page.path for page in docs_pages.find_day_pages(min_day=6)]
     
     print("=" * 80)
     print("FIXING NAVIGATION CONSISTENCY")
@@ -54,15 +40,17 @@ def main():
     print(f"\nProcessing {len(files_to_fix)} files...\n")
     
     fixed_count = 0
-    for file_path in sorted(files_to_fix):
-        was_fixed = fix_week_header_styles(file_path)
-        if was_fixed:
-            print(f"✅ Fixed: {file_path.name}")
-            fixed_count += 1
+    with docs_writer.transaction() as tx:
+        for file_path in sorted(files_to_fix):
+            was_fixed = fix_week_header_styles(file_path, tx)
+            if was_fixed:
+                print(f"✅ Fixed: {file_path.name}")
+                fixed_count += 1
     
     print("\n" + "=" * 80)
     print(f"✅ Complete! Fixed {fixed_count}/{len(files_to_fix)} files")
     print("=" * 80)
 
 if __name__ == "__main__":
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
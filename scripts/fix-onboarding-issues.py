@@ -10,13 +10,16 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Get the docs/Onboarding directory
 onboarding_dir = Path(__file__).parent.parent / 'docs' / 'Onboarding'
 
-def fix_onboarding_file(file_path):
+def fix_onboarding_file(file_path, tx):
     """Fix issues in a single onboarding HTML file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = tx.read(file_path)
     
     original_content = content
     
@@ -112,12 +115,11 @@ def fix_onboarding_file(file_path):
         });
     </script>"""
     
-    content = re.sub(script_pattern, fixed_script, content, flags=re.DOTALL)
+    content = docs_pages.sub_indented(script_pattern, fixed_script, content)
     
     # Only write if changes were made
     if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        tx.write(file_path, content)
         return True
     return False
 
@@ -128,7 +130,7 @@ def main():
         return
     
     # Find all HTML files in onboarding directory
-    html_files = sorted(onboarding_dir.glob('dev*.html'))
+    html_files = [path for path in docs_pages.list_pages(onboarding_dir) if path.name.startswith('dev')]
     
     if not html_files:
         print(f"❌ No HTML files found in {onboarding_dir}")
@@ -137,17 +139,17 @@ def main():
     print(f"🔧 Processing {len(html_files)} onboarding files...\n")
     
     updated_count = 0
-    for file_path in html_files:
-        try:
-            if fix_onboarding_file(file_path):
+    # An error in any file aborts the run with no file written
+    with docs_writer.transaction() as tx:
+        for file_path in html_files:
+            if fix_onboarding_file(file_path, tx):
                 print(f"✅ Fixed: {file_path.name}")
                 updated_count += 1
             else:
                 print(f"⏭  No changes: {file_path.name}")
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
     
     print(f"\n📊 Summary: {updated_count} files updated, {len(html_files) - updated_count} files unchanged")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -11,6 +11,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # CSS to add for copilot prompts
 COPILOT_CSS = """
         /* GitHub Copilot Prompt Box */
@@ -50,19 +54,17 @@ def add_copilot_css(content):
     replacement = r'\1\n' + COPILOT_CSS + '\n'
     return re.sub(pattern, replacement, content, count=1)
 
-def process_file(filepath):
+def process_file(filepath, tx):
     """Process a single onboarding file"""
     print(f"Processing: {filepath}")
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = tx.read(filepath)
     
     # Add CSS
     content = add_copilot_css(content)
     
     # Write back
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    tx.write(filepath, content)
     
     print(f"✅ Fixed: {filepath}")
 
@@ -71,13 +73,13 @@ def main():
     docs_dir = Path(__file__).parent.parent / 'docs' / 'Onboarding'
     
     # Process all dev*-day*.html files
-    for html_file in sorted(docs_dir.glob('dev*-day*.html')):
-        try:
-            process_file(html_file)
-        except Exception as e:
-            print(f"❌ Error processing {html_file}: {e}")
+    # An error in any file aborts the run with no file written
+    with docs_writer.transaction() as tx:
+        for page in docs_pages.find_day_pages(docs_dir):
+            process_file(page.path, tx)
     
     print("\n✅ All files processed!")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -8,6 +8,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Standard Salesforce-style CSS for requirements pages
 STANDARD_SIDEBAR_CSS = """    <style>
         body { margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif; }
@@ -241,6 +245,7 @@ STANDARD_SIDEBAR_HTML = """        <aside class="sidebar">
                         </div>
                         
                         <a href="requirements-mapping.html" class="nav-link">Complete Field Mapping</a>
+                        <a href="requirements-relationships.html" class="nav-link">Object Relationships &amp; Load Order</a>
                     </div>
                 </div>
                 
@@ -391,52 +396,54 @@ COLLAPSIBLE_SCRIPT = """
     </script>"""
 
 
-def fix_requirements_file(file_path):
-    """Fix a single requirements HTML file with proper CSS and HTML replacement."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Step 1: Replace everything from <style> to .main-content{...} with standard CSS
-        # Then preserve everything after .main-content style
-        style_pattern = r'(<style>.*?)(\.main-content\s*\{[^}]*\})(.*?)(</style>)'
-        match = re.search(style_pattern, content, re.DOTALL)
-        
-        if match:
-            # Get the page-specific styles that come after .main-content
-            page_specific_styles = match.group(3)
-            closing_tag = match.group(4)
-            
-            # Replace with standard sidebar CSS + page-specific styles
-            new_style_block = STANDARD_SIDEBAR_CSS + page_specific_styles + closing_tag
-            content = re.sub(style_pattern, new_style_block, content, flags=re.DOTALL)
-        
-        # Step 2: Replace sidebar HTML (from <aside class="sidebar"> to </aside>)
-        sidebar_pattern = r'<aside class="sidebar">.*?</aside>'
-        content = re.sub(sidebar_pattern, STANDARD_SIDEBAR_HTML, content, flags=re.DOTALL)
-        
-        # Step 3: Ensure collapsible script exists before </body>
-        if COLLAPSIBLE_SCRIPT.strip() not in content:
-            # Remove any old script
-            old_script_pattern = r'<script>.*?DOMContentLoaded.*?</script>'
-            content = re.sub(old_script_pattern, '', content, flags=re.DOTALL)
-            
-            # Add new script before </body>
-            if '</body>' in content:
-                content = content.replace('</body>', f'{COLLAPSIBLE_SCRIPT}\n</body>')
-        
-        # Only write if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
-        
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return False
+def fix_requirements_content(content):
+    """Return requirements page content with the standard sidebar CSS, HTML and script."""
+    # Step 1: Replace everything from <style> to .main-content{...} with standard CSS
+    # Then preserve everything after .main-content style
+    style_pattern = r'(<style>.*?)(\.main-content\s*\{[^}]*\}\n?)(.*?)(</style>)'
+    match = re.search(style_pattern, content, re.DOTALL)
+    
+    if match:
+        # Get the page-specific styles that come after .main-content
+        page_specific_styles = match.group(3)
+        closing_tag = match.group(4)
+        
+        # Replace with standard sidebar CSS + page-specific styles
+        new_style_block = STANDARD_SIDEBAR_CSS + page_specific_styles + closing_tag
+        content = docs_pages.sub_indented(style_pattern, new_style_block, content)
+    
+    # Step 2: Replace sidebar HTML (from <aside class="sidebar"> to </aside>)
+    sidebar_pattern = r'<aside class="sidebar">.*?</aside>'
+    content = docs_pages.sub_indented(sidebar_pattern, STANDARD_SIDEBAR_HTML, content)
+    
+    # Step 3: Ensure collapsible script exists before </body>
+    if COLLAPSIBLE_SCRIPT.strip() not in content:
+        # Remove any old script
+        old_script_pattern = r'<script>.*?DOMContentLoaded.*?</script>'
+        content = re.sub(old_script_pattern, '', content, flags=re.DOTALL)
+        
+        # Add new script before </body>
+        if '</body>' in content:
+            content = content.replace('</body>', f'{COLLAPSIBLE_SCRIPT}\n</body>')
+    
+    return content
+
+
+def fix_requirements_file(file_path, tx):
+    """Fix a single requirements HTML file with proper CSS and HTML replacement.
+
+    The result is staged in `tx`; an error aborts the whole run instead of
+    leaving some pages fixed and others not.
+    """
+    content = tx.read(file_path)
+    original_content = content
+    content = fix_requirements_content(content)
+
+    # Only write if changes were made
+    if content != original_content:
+        tx.write(file_path, content)
+        return True
+    return False
 
 
 def main():
@@ -447,7 +454,7 @@ def main():
         print(f"Requirements directory not found: {requirements_dir}")
         return
     
-    html_files = sorted(requirements_dir.glob('*.html'))
+    html_files = docs_pages.list_pages(requirements_dir)
     
     if not html_files:
         print("No HTML files found in requirements directory")
@@ -459,17 +466,19 @@ def main():
     fixed_count = 0
     unchanged_count = 0
     
-    for html_file in html_files:
-        if fix_requirements_file(html_file):
-            print(f"✅ Fixed: {html_file.name}")
-            fixed_count += 1
-        else:
-            print(f"⏭  No changes: {html_file.name}")
-            unchanged_count += 1
+    with docs_writer.transaction() as tx:
+        for html_file in html_files:
+            if fix_requirements_file(html_file, tx):
+                print(f"✅ Fixed: {html_file.name}")
+                fixed_count += 1
+            else:
+                print(f"⏭  No changes: {html_file.name}")
+                unchanged_count += 1
     
     print("-" * 60)
     print(f"📊 Summary: {fixed_count} files updated, {unchanged_count} files unchanged")
 
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -9,6 +9,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Get the docs/RevNovaRequirements directory
 requirements_dir = Path(__file__).parent.parent / 'docs' / 'RevNovaRequirements'
 
@@ -114,6 +118,7 @@ NEW_SIDEBAR_HTML = """    <aside class="sidebar">
                     </div>
                     
                     <a href="requirements-mapping.html" class="nav-link">Complete Field Mapping</a>
+                    <a href="requirements-relationships.html" class="nav-link">Object Relationships &amp; Load Order</a>
                 </div>
             </div>
             
@@ -252,10 +257,9 @@ COLLAPSIBLE_SCRIPT = """    <script>
         });
     </script>"""
 
-def fix_requirements_file(file_path):
-    """Fix issues in a single requirements HTML file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def fix_requirements_file(file_path, tx):
+    """Fix issues in a single requirements HTML file, staging the result in tx."""
+    content = tx.read(file_path)
     
     original_content = content
     
@@ -268,8 +272,7 @@ def fix_requirements_file(file_path):
     
     # Issue 2: Replace old sidebar HTML with new collapsible structure
     sidebar_pattern = r'<aside class="sidebar">.*?</aside>'
-    if re.search(sidebar_pattern, content, re.DOTALL):
-        content = re.sub(sidebar_pattern, NEW_SIDEBAR_HTML, content, flags=re.DOTALL)
+    content = docs_pages.sub_indented(sidebar_pattern, NEW_SIDEBAR_HTML, content)
     
     # Issue 3: Add collapsible JavaScript if not present
     if '<script>' not in content or 'Collapsible navigation' not in content:
@@ -278,8 +281,7 @@ def fix_requirements_file(file_path):
     
     # Only write if changes were made
     if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        tx.write(file_path, content)
         return True
     return False
 
@@ -290,7 +292,7 @@ def main():
         return
     
     # Find all HTML files in requirements directory
-    html_files = sorted(requirements_dir.glob('*.html'))
+    html_files = docs_pages.list_pages(requirements_dir)
     
     if not html_files:
         print(f"❌ No HTML files found in {requirements_dir}")
@@ -299,17 +301,17 @@ def main():
     print(f"🔧 Processing {len(html_files)} requirements files...\n")
     
     updated_count = 0
-    for file_path in html_files:
-        try:
-            if fix_requirements_file(file_path):
+    # An error in any file aborts the run with no file written
+    with docs_writer.transaction() as tx:
+        for file_path in html_files:
+            if fix_requirements_file(file_path, tx):
                 print(f"✅ Fixed: {file_path.name}")
                 updated_count += 1
             else:
                 print(f"⏭  No changes: {file_path.name}")
-        except Exception as e:
-            print(f"❌ Error processing {file_path.name}: {e}")
     
     print(f"\n📊 Summary: {updated_count} files updated, {len(html_files) - updated_count} files unchanged")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
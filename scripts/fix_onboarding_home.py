@@ -3,24 +3,16 @@ Fix onboarding-home.html to have Salesforce-style sidebar
 """
 from pathlib import Path
 
-# Read the template (dev1-day01.html has the correct structure)
-template_path = Path('docs/Onboarding/dev1-day01.html')
-with open(template_path, 'r', encoding='utf-8') as f:
-    template = f.read()
-
-# Extract header and sidebar from template
-# Find where main content starts
-main_content_marker = '<main class="main-content">'
-header_and_sidebar = template.split(main_content_marker)[0] + main_content_marker
-
-# Update title in header
-header_and_sidebar = header_and_sidebar.replace(
-    '<title>Day 1: Workstation Setup - RevNova Developer Onboarding</title>',
-    '<title>RevNova Developer Onboarding - Home</title>'
-)
-
-# Create the main content for onboarding home
-main_content = '''
+import docs_profile
+import docs_writer
+
+ONBOARDING_DIR = Path(__file__).parent.parent / 'docs' / 'Onboarding'
+TEMPLATE_PATH = ONBOARDING_DIR / 'dev1-day01.html'  # has the correct structure
+OUTPUT_PATH = ONBOARDING_DIR / 'onboarding-home.html'
+MAIN_CONTENT_MARKER = '<main class="main-content">'
+
+# Main content for onboarding home
+MAIN_CONTENT = '''
             <div class="breadcrumb">
                 <a href="../index.html">Home</a> › <a href="onboarding-home.html">Onboarding</a>
             </div>
@@ -155,13 +147,35 @@ main_content = '''
 </html>
 '''
 
-# Combine
-full_html = header_and_sidebar + main_content
 
-# Write the new onboarding-home.html
-output_path = Path('docs/Onboarding/onboarding-home.html')
-with open(output_path, 'w', encoding='utf-8') as f:
-    f.write(full_html)
+def build_home_page(template):
+    """Return onboarding-home.html built from a day page's header and sidebar"""
+    # Extract header and sidebar from template
+    # Find where main content starts
+    header_and_sidebar = template.split(MAIN_CONTENT_MARKER)[0] + MAIN_CONTENT_MARKER
+
+    # Update title in header
+    header_and_sidebar = header_and_sidebar.replace(
+        '<title>Day 1: Workstation Setup - RevNova Developer Onboarding</title>',
+        '<title>RevNova Developer Onboarding - Home</title>'
+    )
+
+    # Combine
+    return header_and_sidebar + MAIN_CONTENT
+
+
+def main():
+    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+        template = f.read()
+
+    # Write the new onboarding-home.html (atomically: a crash never leaves it truncated)
+    with docs_writer.transaction() as tx:
+        tx.write(OUTPUT_PATH, build_home_page(template))
+
+    print("✅ onboarding-home.html updated with Salesforce-style sidebar!")
+    print(f"   File: {OUTPUT_PATH}")
+
 
-print("✅ onboarding-home.html updated with Salesforce-style sidebar!")
-print(f"   File: {output_path}")
+if __name__ == '__main__':
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -21,9 +21,12 @@ This script is intentionally simple and produces a single static HTML file.
 from pathlib import Path
 import argparse
 import sys
-import pandas as pd
 import shutil
 
+import docs_profile
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / 'docs' / 'RevNovaRequirements' / 'requirements-mapping.html'
+
 
 HTML_TEMPLATE = """
 <!doctype html>
@@ -55,7 +58,7 @@ HTML_TEMPLATE = """
 """
 
 
-def sheet_to_html(df: pd.DataFrame, name: str) -> str:
+def sheet_to_html(df: 'pd.DataFrame', name: str) -> str:
     # sanitize column names and convert DataFrame to HTML
     df = df.fillna("")
     table_html = df.to_html(classes='mapping-table', index=False, escape=False)
@@ -65,7 +68,7 @@ def sheet_to_html(df: pd.DataFrame, name: str) -> str:
 def main(argv):
     parser = argparse.ArgumentParser(description='Convert mapping Excel workbook to HTML')
     parser.add_argument('-i', '--input', required=True, help='Path to RevNova_Mapping_Full.xlsx')
-    parser.add_argument('-o', '--output', default='docs/RevNovaRequirements/requirements-mapping.html', help='Output HTML path')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT), help='Output HTML path')
     parser.add_argument('-d', '--diagrams', help='Optional path to diagrams folder to copy into docs/RevNovaRequirements/images')
     args = parser.parse_args(argv)
 
@@ -79,6 +82,13 @@ def main(argv):
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # pandas is heavy: import it only once there is a workbook to read
+    try:
+        import pandas as pd
+    except ImportError:
+        print("ERROR: pandas and openpyxl are required: pip install pandas openpyxl")
+        sys.exit(4)
+
     # read all sheets
     try:
         xls = pd.read_excel(input_path, sheet_name=None, engine='openpyxl')
@@ -121,4 +131,5 @@ def main(argv):
 
 
 if __name__ == '__main__':
-    main(sys.argv[1:])
+    with docs_profile.profile_from_argv():
+        main(sys.argv[1:])
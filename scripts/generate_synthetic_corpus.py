@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic docs corpus for scale-testing the docs scripts.
+
+Every script in scripts/ was written against 3 developers x 25 days and a few
+dozen requirements pages. This generator writes a repo-shaped tree with as
+many developers, days and requirements pages as you ask for:
+
+    <out>/corpus.json                        scale, seed and developer layout
+    <out>/docs/styles.css
+    <out>/docs/Onboarding/devN-dayNN.html     day pages
+    <out>/docs/Onboarding/onboarding-*.html   home and per-developer overviews
+    <out>/docs/RevNovaRequirements/*.html     requirements pages
+    <out>/scripts/data/copilot-prompts.json   prompt catalog for the day pages
+    <out>/scripts/data/onboarding-cohorts.json  cohort config matching the developer layout
+
+The pages reproduce the markup variants found in docs/ today:
+  - current day pages: <aside class="sidebar"> with collapsible nav-section /
+    nav-subsection week headers, status-banner, content-section steps with
+    copilot-prompt blocks (some steps left without one, so the prompt script
+    has work to do)
+  - legacy day pages: has-children week headers, day-header and step-card
+    blocks, like dev1-day19-OLD.html
+  - requirements pages: nav-section sidebar and section-box content
+  - a small share of pages carry the malformed markup real pages have
+    (orphaned </code></pre>, a duplicated <main>)
+
+Page chrome (inline CSS, header, scripts) is copied from the real templates in
+docs/ when they exist, so synthetic pages have realistic sizes. Output is
+deterministic for a given seed.
+
+Sidebars list only the page's own developer (and, on requirements pages, only
+the page's own phase in full) by default; real pages list everything, which
+grows quadratically with the corpus (use --sidebar all for that).
+
+Usage:
+    python scripts/generate_synthetic_corpus.py --preset 10x
+    python scripts/generate_synthetic_corpus.py --developers 50 --days 200 --requirements 2000
+    python scripts/generate_synthetic_corpus.py --preset 100x --out /tmp/corpus --force
+"""
+
+import argparse
+import json
+import random
+import re
+import shutil
+from pathlib import Path
+
+import docs_pipeline
+
+DEFAULT_OUT_DIR = docs_pipeline.REPO_ROOT / 'build' / 'synthetic'
+
+# (developers, days per developer, requirements pages)
+PRESETS = {
+    '1x': (3, 25, 37),
+    '10x': (10, 75, 370),
+    '100x': (50, 150, 3700),
+}
+
+DAYS_PER_WEEK = 5
+
+TRACKS = [
+    ('Backend & Database', ['Database Tables', 'API Endpoint', 'Schema Analysis', 'Metadata Extraction',
+                            'Relationship Detection', 'Field Mapping API', 'Confidence Scoring',
+                            'Transformation Engine', 'Queue System', 'Job Management', 'Error Handling',
+                            'Migration Execution', 'Validation & Rollback', 'Performance Optimization']),
+    ('Frontend & React', ['Project Structure', 'Routing & Navigation', 'State Management', 'Dashboard Page',
+                          'Connection Setup UI', 'Schema Analysis UI', 'Field Mapping UI', 'Drag & Drop Interface',
+                          'AI Suggestions UI', 'Preview & Validation', 'Queue Status Dashboard',
+                          'Results & Reports', 'Responsive Design']),
+    ('DevOps & QA', ['Docker Setup', 'CI/CD Pipeline', 'Monitoring Setup', 'Security Configuration',
+                     'Unit Testing Setup', 'Integration Tests', 'API Tests', 'E2E Test Setup', 'Load Testing',
+                     'Database Optimization', 'Caching Strategy', 'Load Balancing', 'Backup & Recovery']),
+]
+
+WEEK_THEMES = ['Setup', 'Core APIs', 'Mapping & AI', 'Transformation', 'Execution', 'Testing',
+               'Hardening', 'Performance', 'Integrations', 'Release']
+
+STEP_EMOJIS = ['📊', '📝', '🔗', '🚀', '🧪', '⚙️', '🔍', '🛠️']
+
+WORDS = ('migration schema field mapping object record quote line product pricebook entry '
+         'contract subscription target source connection validation transform queue job '
+         'endpoint response request table index query cache retry error status report '
+         'revenue cloud salesforce cpq analysis metadata relationship confidence score '
+         'batch worker pipeline component state route test coverage deploy monitor').split()
+
+PHASES = [
+    ('Phase 1 - SFDC CPQ → RCA Migration (MVP)', ['connect', 'analyze', 'mapping', 'transform', 'validate',
+                                                  'execute', 'test', 'quotes', 'contracts', 'subscriptions',
+                                                  'inflight', 'technical']),
+    ('Phase 2 - AI-Powered Configuration', ['functional', 'technical', 'planning', 'impact', 'budget',
+                                            'generate', 'modify', 'adopt']),
+    ('Phase 3 - Multi-CPQ Support', ['functional', 'technical']),
+    ('Phase 4 - CRM Integration', ['functional', 'technical']),
+    ('Phase 5 - ERP Connector', ['functional', 'technical']),
+]
+
+ICON = '''<svg class="{kind}-icon" fill="currentColor" viewBox="0 0 20 20">
+{indent}    <path d="M6 6L14 10L6 14V6Z"/>
+{indent}</svg>'''
+
+FALLBACK_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="../styles.css">
+</head>
+<body>
+    <header>
+        <h1>RevNova</h1>
+    </header>
+
+    <div class="page-container">
+        '''
+
+FALLBACK_TAIL = '''
+    </div>
+</body>
+</html>
+'''
+
+
+def _load_chrome(template_path):
+    """Split a real page into (before the sidebar, after </main>), or None."""
+    try:
+        with open(template_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    start = content.find('<aside class="sidebar">')
+    end = content.rfind('</main>')
+    if start < 0 or end < 0:
+        return None
+    before = re.sub(r'\s*<div class="status-banner".*?</div>', '', content[:start], flags=re.DOTALL)
+    return before, content[end + len('</main>'):]
+
+
+def _with_title(before, title):
+    return re.sub(r'<title>.*?</title>', lambda m: f'<title>{title}</title>', before, count=1)
+
+
+class Chrome:
+    """Page chrome for each page kind, taken from the real docs when present."""
+
+    def __init__(self, docs_dir):
+        fallback = (FALLBACK_HEAD, FALLBACK_TAIL)
+        self.day = _load_chrome(docs_dir / 'Onboarding' / 'dev1-day07.html') or fallback
+        self.legacy = _load_chrome(docs_dir / 'Onboarding' / 'dev1-day19-OLD.html') or fallback
+        self.requirements = (_load_chrome(docs_dir / 'RevNovaRequirements' / 'requirements-phase1-connect.html')
+                             or fallback)
+
+    @staticmethod
+    def wrap(chrome, title, body):
+        before, after = chrome
+        if '{title}' in before:
+            before = before.format(title=title)
+        return _with_title(before, title) + body + after
+
+
+def _sentence(rng, words=12):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _paragraph(rng, sentences=3):
+    return ' '.join(_sentence(rng, rng.randint(8, 16)) for _ in range(sentences))
+
+
+def _code_block(rng):
+    table = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}s"
+    if rng.random() < 0.5:
+        columns = ',\n'.join(f"  {rng.choice(WORDS)}_{n} {rng.choice(['VARCHAR(255)', 'INTEGER', 'TEXT', 'BOOLEAN DEFAULT false'])}"
+                             for n in range(rng.randint(4, 10)))
+        return (f"-- {_sentence(rng, 6)}\nCREATE TABLE {table} (\n  id SERIAL PRIMARY KEY,\n{columns},\n"
+                f"  created_at TIMESTAMP NOT NULL DEFAULT NOW()\n);\n\n"
+                f"CREATE INDEX idx_{table}_id ON {table}(id);")
+    name = rng.choice(WORDS)
+    return (f"import {{ Router }} from 'express';\n\nconst router = Router();\n\n"
+            f"router.get('/api/v1/{name}s', async (req, res) => {{\n"
+            f"  const rows = await db.query('SELECT * FROM {table} WHERE status = $1', [req.query.status]);\n"
+            f"  res.json({{ data: rows, count: rows.length }});\n}});\n\nexport default router;")
+
+
+def build_developers(count, days, rng):
+    """Developer layout: name, prefix and weeks of (day, title) pairs per developer."""
+    developers = []
+    for number in range(1, count + 1):
+        track, topics = TRACKS[(number - 1) % len(TRACKS)]
+        weeks = []
+        for week_index in range(0, days, DAYS_PER_WEEK):
+            week_num = week_index // DAYS_PER_WEEK + 1
+            theme = WEEK_THEMES[(week_num - 1) % len(WEEK_THEMES)]
+            week_days = []
+            for day_num in range(week_index + 1, min(week_index + DAYS_PER_WEEK, days) + 1):
+                if day_num % DAYS_PER_WEEK == 0:
+                    title = f'Week {week_num} Testing & PR'
+                else:
+                    title = rng.choice(topics) + rng.choice(['', ' (Part 1)', ' (Part 2)'])
+                week_days.append((day_num, title))
+            weeks.append({'title': f'Week {week_num}: {track.split(" & ")[0]} {theme}', 'days': week_days})
+        developers.append({'name': f'Developer {number}: {track}', 'prefix': f'dev{number}', 'weeks': weeks})
+    return developers
+
+
+def _day_file(prefix, day_num):
+    return f'{prefix}-day{day_num:02d}.html'
+
+
+def _short_name(dev):
+    return dev['name'].split(':')[0]
+
+
+def _nav_section(title, links, expanded=False, comment=None):
+    state = ' expanded' if expanded else ''
+    return f'''                <!-- {comment or title} Section -->
+                <div class="nav-section">
+                    <button class="nav-section-header{state}">
+                        {ICON.format(kind='nav-section', indent='                        ')}
+                        {title}
+                    </button>
+                    <div class="nav-section-content"{state}>
+{links}
+                    </div>
+                </div>
+                '''
+
+
+def _daily_tasks_section(dev, active_file=None, active_week=None):
+    weeks_html = []
+    for week_num, week in enumerate(dev['weeks'], 1):
+        expanded = ' expanded' if week_num == active_week else ''
+        links = '\n'.join(
+            f'                                <a href="{_day_file(dev["prefix"], day_num)}" class="nav-subsection-link'
+            f'{" active" if _day_file(dev["prefix"], day_num) == active_file else ""}">Day {day_num}: {title}</a>'
+            for day_num, title in week['days'])
+        weeks_html.append(f'''                        <!-- Week {week_num} Subsection -->
+                        <div class="nav-subsection">
+                            <button class="nav-subsection-header{expanded}">
+                                {ICON.format(kind='nav-subsection', indent='                                ')}
+                                {week['title']}
+                            </button>
+                            <div class="nav-subsection-content"{expanded}>
+{links}
+                            </div>
+                        </div>
+                        ''')
+    return _nav_section(f'{_short_name(dev)}: Daily Tasks', '\n'.join(weeks_html),
+                        expanded=active_week is not None)
+
+
+def render_sidebar(developers, dev, active_file, active_week, scope='own'):
+    """Current-style <aside class="sidebar"> for an onboarding page."""
+    getting_started = '\n'.join(
+        f'                        <a href="{href}" class="nav-link">{label}</a>'
+        for href, label in [('onboarding-home.html', 'Onboarding Home'),
+                            ('onboarding-overview.html', 'Project Overview'),
+                            ('manual-repo-setup.html', 'Manual Repository Setup'),
+                            ('repo-setup-guide.html', 'Automated Setup Guide')])
+    guides = '\n'.join(
+        f'                        <a href="onboarding-{other["prefix"]}.html" class="nav-link">{other["name"]}</a>'
+        for other in developers)
+    listed = developers if scope == 'all' else [dev]
+    tasks = [_daily_tasks_section(other, active_file if other is dev else None,
+                                  active_week if other is dev else None) for other in listed]
+    return ('<aside class="sidebar">\n            <nav class="sidebar-nav">\n'
+            + _nav_section('Getting Started', getting_started)
+            + '\n' + _nav_section('Developer Guides', guides) + '\n'
+            + '\n'.join(tasks)
+            + '\n            </nav>\n        </aside>\n        ')
+
+
+def render_legacy_sidebar(dev):
+    """Legacy <aside class="sidebar"> with has-children week headers."""
+    weeks = []
+    for week in dev['weeks']:
+        days = '\n'.join(f'                        <li><a href="{_day_file(dev["prefix"], day_num)}">Day {day_num}</a></li>'
+                         for day_num, _ in week['days'])
+        weeks.append(f'''                <li class="has-children"><span style="font-weight:600;color:#333;cursor:default;display:block;padding:0.6rem 0;">{week['title']}</span>
+                    <ul>
+{days}
+                    </ul>
+                </li>''')
+    return f'''<aside class="sidebar">
+            <h3>Getting Started</h3>
+            <ul>
+                <li><a href="onboarding-home.html">Onboarding Home</a></li>
+                <li><a href="onboarding-overview.html">Project Overview</a></li>
+            </ul>
+
+            <h3>{_short_name(dev)}: Daily Tasks</h3>
+            <ul>
+{chr(10).join(weeks)}
+            </ul>
+        </aside>
+
+        '''
+
+
+def _steps(rng, day_title):
+    count = rng.randint(3, 6)
+    return [(f'Step {n}', f'{rng.choice(["Create", "Build", "Implement", "Test", "Wire up", "Review"])} '
+                          f'{day_title.split(" (")[0]} {rng.choice(WORDS).title()}',
+             f'# {_sentence(rng, 8)}\n# {_sentence(rng, 10)}\n# {_sentence(rng, 7)}')
+            for n in range(1, count + 1)]
+
+
+def render_day_page(developers, dev, week_num, day_num, day_title, status_badges, options, rng):
+    """Current-style day page. Returns (html, catalog entries for its steps)."""
+    prefix = dev['prefix']
+    day_file = _day_file(prefix, day_num)
+    last_day = dev['weeks'][-1]['days'][-1][0]
+
+    banner = ''
+    if rng.random() < options['banner_ratio']:
+        banner = status_badges[rng.choice(list(status_badges))]
+
+    sections = [f'''            <div class="content-section">
+                <h2>📋 Objective</h2>
+                <p>{_paragraph(rng)}</p>
+            </div>
+''']
+    catalog = []
+    for step, title, prompt in _steps(rng, day_title):
+        catalog.append({'step': step, 'prompt': prompt})
+        prompt_html = ''
+        if rng.random() < options['prompt_ratio']:
+            prompt_html = f'''
+                <div class="copilot-prompt">
+                    <h3>💬 GitHub Copilot Prompt:</h3>
+                    <pre><code>{prompt}</code></pre>
+                </div>'''
+        quirk = ''
+        if rng.random() < options['quirk_ratio']:
+            quirk = f"\n  {rng.choice(WORDS)}Client.connect();</code></pre>"
+        sections.append(f'''            <div class="content-section">
+                <h2>{rng.choice(STEP_EMOJIS)} {step}: {title}</h2>{prompt_html}
+                <p>{_paragraph(rng, rng.randint(2, 4))}</p>
+                <pre><code>{_code_block(rng)}</code></pre>
+
+                <p><strong>✅ Checkpoint:</strong> {_sentence(rng, 6)}</p>
+            </div>{quirk}
+''')
+    checklist = '\n'.join(f'                    <li>☐ {_sentence(rng, 5)}</li>' for _ in range(rng.randint(4, 8)))
+    sections.append(f'''            <div class="content-section">
+                <h2>🎯 End of Day Checklist</h2>
+                <ul style="list-style: none; padding-left: 0;">
+{checklist}
+                </ul>
+            </div>
+''')
+
+    prev_file = _day_file(prefix, day_num - 1) if day_num > 1 else f'onboarding-{prefix}.html'
+    next_file = _day_file(prefix, day_num + 1) if day_num < last_day else 'onboarding-home.html'
+    body = (render_sidebar(developers, dev, day_file, week_num, options['sidebar'])
+            + f'''<main class="main-content">
+            <div class="breadcrumb">
+                <a href="onboarding-home.html">Home</a> ›
+                <a href="onboarding-{prefix}.html">{_short_name(dev)}</a> › Week {week_num} › Day {day_num}
+            </div>
+
+            <h1 class="page-title">Day {day_num}: {day_title}</h1>
+            <p class="page-subtitle">{dev['name']} | Duration: ~6-8 hours</p>
+
+{chr(10).join(sections)}
+            <div class="nav-buttons">
+                <a href="{prev_file}" class="btn btn-secondary">{"Previous: Day " + str(day_num - 1) if day_num > 1 else "Back to Overview"}</a>
+                <a href="{next_file}" class="btn">{"Next: Day " + str(day_num + 1) if day_num < last_day else "Back to Home"}</a>
+            </div>
+        </main>''')
+
+    html = Chrome.wrap(options['chrome'].day, f'Day {day_num}: {day_title} - RevNova Developer Onboarding', body)
+    if banner:
+        html = html.replace('</header>', banner + '\n    </header>', 1)
+    return html, catalog
+
+
+def render_legacy_day_page(dev, day_num, day_title, options, rng):
+    """Legacy day page with has-children sidebar and step-card blocks."""
+    track = dev['name'].split(': ', 1)[1]
+    cards = [f'''        <div class="step-card" style="background:#e0f2fe;border-left:4px solid #0284c7;">
+            <h2>🤖 Copy This Prompt for Your GitHub Copilot</h2>
+            <div style="background:#2d2d2d;color:#f8f8f2;padding:1rem;border-radius:6px;font-family:monospace;margin:1rem 0;">
+I'm working on Day {day_num} of the RevNova migration platform - {track} track.<br><br>
+{_paragraph(rng, 4)}
+            </div>
+        </div>
+''']
+    for n in range(1, rng.randint(3, 5) + 1):
+        cards.append(f'''<div class="step-card">
+            <h3>Step {n}: {rng.choice(WORDS).title()} {rng.choice(WORDS)}</h3>
+            <p>{_paragraph(rng, 2)}</p>
+            <pre><code>{_code_block(rng)}</code></pre>
+        </div>
+''')
+    body = (render_legacy_sidebar(dev)
+            + f'''<main class="main-content">
+        <div class="day-header">
+            <h1>❌ Day {day_num}: {day_title} - NOT STARTED</h1>
+            <p>{_short_name(dev)} — {track}</p>
+        </div>
+
+{chr(10).join(cards)}
+    </main>''')
+    return Chrome.wrap(options['chrome'].legacy, f'{_short_name(dev)} Day {day_num}: {day_title} - RevNova Onboarding', body)
+
+
+def render_overview_pages(developers, options):
+    """onboarding-home.html and onboarding-devN.html."""
+    pages = {}
+    cards = '\n'.join(f'                <li><a href="onboarding-{dev["prefix"]}.html">{dev["name"]}</a></li>'
+                      for dev in developers)
+    first = developers[0]
+    pages['onboarding-home.html'] = Chrome.wrap(options['chrome'].day, 'RevNova Developer Onboarding', (
+        render_sidebar(developers, first, None, None, options['sidebar'])
+        + f'''<main class="main-content">
+            <h1 class="page-title">RevNova Developer Onboarding</h1>
+            <ul>
+{cards}
+            </ul>
+        </main>'''))
+    for dev in developers:
+        weeks = '\n'.join(f'                <li><a href="{_day_file(dev["prefix"], week["days"][0][0])}">{week["title"]}</a></li>'
+                          for week in dev['weeks'])
+        pages[f'onboarding-{dev["prefix"]}.html'] = Chrome.wrap(
+            options['chrome'].day, f'{dev["name"]} - RevNova Developer Onboarding', (
+                render_sidebar(developers, dev, None, None, options['sidebar'])
+                + f'''<main class="main-content">
+            <h1 class="page-title">{dev['name']}</h1>
+            <ul>
+{weeks}
+            </ul>
+        </main>'''))
+    return pages
+
+
+def build_requirements(count):
+    """Requirements pages as dicts: file, title, phase index."""
+    pages = [{'file': 'requirements-home.html', 'title': 'RevNova Vision & Strategy', 'phase': None},
+             {'file': 'requirements-index.html', 'title': 'Requirements Index', 'phase': None}]
+    n = 0
+    while len(pages) < count:
+        phase_index = n % len(PHASES)
+        topics = PHASES[phase_index][1]
+        topic = topics[(n // len(PHASES)) % len(topics)]
+        copy = n // (len(PHASES) * len(topics))
+        suffix = f'-{copy + 1}' if copy else ''
+        pages.append({'file': f'requirements-phase{phase_index + 1}-{topic}{suffix}.html',
+                      'title': f'{topic.title()}{" " + str(copy + 1) if copy else ""}',
+                      'phase': phase_index})
+        n += 1
+    return pages[:count]
+
+
+def render_requirements_sidebar(pages, active, scope='own'):
+    sections = [_nav_section('Platform Vision', '\n'.join(
+        f'                        <a href="{page["file"]}" class="nav-link">{page["title"]}</a>'
+        for page in pages if page['phase'] is None))]
+    for phase_index, (phase_title, _) in enumerate(PHASES):
+        phase_pages = [page for page in pages if page['phase'] == phase_index]
+        if scope != 'all' and active['phase'] != phase_index:
+            phase_pages = phase_pages[:2]
+        links = '\n'.join(
+            f'                        <a href="{page["file"]}" class="nav-link">{page["title"]}</a>'
+            for page in phase_pages)
+        sections.append(_nav_section(phase_title, links, expanded=active['phase'] == phase_index,
+                                     comment=f'Phase {phase_index + 1}'))
+    return ('<aside class="sidebar">\n            <nav class="sidebar-nav">\n'
+            + '\n'.join(sections) + '\n            </nav>\n        </aside>\n\n        ')
+
+
+def render_requirements_page(pages, page, options, rng):
+    sections = []
+    for _ in range(rng.randint(3, 6)):
+        rows = '\n'.join(f'''                    <tr>
+                        <td>FR-{page["file"][13:17].upper()}-{rng.randint(1, 999):03d}.{n}</td>
+                        <td>{_sentence(rng, 10)}</td>
+                        <td>{_sentence(rng, 8)}</td>
+                    </tr>''' for n in range(1, rng.randint(2, 6) + 1))
+        sections.append(f'''            <section class="section-box">
+                <h3><span class="badge badge-functional">Functional</span> {rng.choice(WORDS).title()} Requirements</h3>
+                <p>{_paragraph(rng, 3)}</p>
+                <table>
+                    <tr><th>Requirement ID</th><th>Description</th><th>Acceptance Criteria</th></tr>
+{rows}
+                </table>
+            </section>
+''')
+    main_open = '<main class="main-content">'
+    if rng.random() < options['quirk_ratio']:
+        main_open += '\n        <main class="main-content">'
+    body = (render_requirements_sidebar(pages, page, options['sidebar'])
+            + f'''{main_open}
+            <div class="page-header">
+                <h1>{page['title']}</h1>
+                <p>{_sentence(rng, 12)}</p>
+            </div>
+
+{chr(10).join(sections)}
+        </main>''')
+    return Chrome.wrap(options['chrome'].requirements, f'{page["title"]} | RevNova Requirements', body)
+
+
+def _write(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return len(content.encode('utf-8'))
+
+
+def generate_corpus(out_dir, developers=3, days=25, requirements=37, seed=1, legacy_ratio=0.15,
+                    prompt_ratio=0.6, banner_ratio=0.8, quirk_ratio=0.05, sidebar='own', report=print):
+    """Write a synthetic corpus under out_dir and return its stats."""
+    out_dir = Path(out_dir)
+    rng = random.Random(seed)
+    onboarding_dir = out_dir / 'docs' / 'Onboarding'
+    requirements_dir = out_dir / 'docs' / 'RevNovaRequirements'
+    data_dir = out_dir / 'scripts' / 'data'
+    for directory in (onboarding_dir, requirements_dir, data_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    styles = docs_pipeline.DOCS_DIR / 'styles.css'
+    if styles.exists():
+        shutil.copyfile(styles, out_dir / 'docs' / 'styles.css')
+
+    status_badges = docs_pipeline.load_script('update-task-completion-status.py').STATUS_BADGES
+    options = {'chrome': Chrome(docs_pipeline.DOCS_DIR), 'prompt_ratio': prompt_ratio,
+               'banner_ratio': banner_ratio, 'quirk_ratio': quirk_ratio, 'sidebar': sidebar}
+    layout = build_developers(developers, days, rng)
+    stats = {'day_pages': 0, 'legacy_pages': 0, 'overview_pages': 0, 'requirements_pages': 0, 'bytes': 0}
+    catalog = {}
+
+    for dev in layout:
+        for week_num, week in enumerate(dev['weeks'], 1):
+            for day_num, day_title in week['days']:
+                path = onboarding_dir / _day_file(dev['prefix'], day_num)
+                if rng.random() < legacy_ratio:
+                    html = render_legacy_day_page(dev, day_num, day_title, options, rng)
+                    stats['legacy_pages'] += 1
+                else:
+                    html, steps = render_day_page(layout, dev, week_num, day_num, day_title,
+                                                  status_badges, options, rng)
+                    catalog[path.stem] = steps
+                    stats['day_pages'] += 1
+                stats['bytes'] += _write(path, html)
+        if report:
+            report(f"  ✓ {dev['prefix']}: {days} days")
+
+    for filename, html in render_overview_pages(layout, options).items():
+        stats['bytes'] += _write(onboarding_dir / filename, html)
+        stats['overview_pages'] += 1
+
+    pages = build_requirements(requirements)
+    for page in pages:
+        stats['bytes'] += _write(requirements_dir / page['file'], render_requirements_page(pages, page, options, rng))
+        stats['requirements_pages'] += 1
+    if report:
+        report(f"  ✓ {len(pages)} requirements pages")
+
+    with open(data_dir / 'copilot-prompts.json', 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'pages': catalog}, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    # One track per developer, so regenerate_all_pages.py rebuilds every synthetic day page
+    cohorts = {
+        'version': 1,
+        'tracks': {dev['prefix']: {'title': dev['name'].split(': ', 1)[1],
+                                   'weeks': [{'title': week['title'], 'days': [list(day) for day in week['days']]}
+                                             for week in dev['weeks']]}
+                   for dev in layout},
+        'cohorts': [{'id': 'synthetic', 'name': 'Synthetic Team', 'dir': 'docs/Onboarding',
+                     'developers': [{'prefix': dev['prefix'], 'track': dev['prefix']} for dev in layout]}],
+    }
+    with open(data_dir / 'onboarding-cohorts.json', 'w', encoding='utf-8') as f:
+        json.dump(cohorts, f, indent=1, ensure_ascii=False)
+        f.write('\n')
+
+    with open(out_dir / 'corpus.json', 'w', encoding='utf-8') as f:
+        json.dump({'seed': seed, 'developers': developers, 'days': days, 'requirements': requirements,
+                   'legacy_ratio': legacy_ratio, 'sidebar': sidebar, 'stats': stats, 'layout': layout},
+                  f, indent=1, ensure_ascii=False)
+        f.write('\n')
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic docs corpus for scale testing')
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='1x',
+                        help='Scale preset: developers x days, requirements pages (default: 1x)')
+    parser.add_argument('--developers', type=int, help='Number of developers (overrides the preset)')
+    parser.add_argument('--days', type=int, help='Days per developer (overrides the preset)')
+    parser.add_argument('--requirements', type=int, help='Requirements pages (overrides the preset)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed (default: 1)')
+    parser.add_argument('--legacy-ratio', type=float, default=0.15, help='Share of legacy has-children/step-card day pages')
+    parser.add_argument('--sidebar', choices=['own', 'all'], default='own',
+                        help="Developers listed in each sidebar (real pages use 'all')")
+    parser.add_argument('--out', help='Output directory (default: build/synthetic/<preset>)')
+    parser.add_argument('--force', action='store_true', help='Replace the output directory if it exists')
+    args = parser.parse_args(argv)
+
+    developers, days, requirements = PRESETS[args.preset]
+    developers = args.developers or developers
+    days = args.days or days
+    requirements = args.requirements or requirements
+
+    out_dir = Path(args.out) if args.out else DEFAULT_OUT_DIR / args.preset
+    resolved = out_dir.resolve()
+    if resolved == docs_pipeline.REPO_ROOT.resolve() or docs_pipeline.DOCS_DIR.resolve() in (resolved, *resolved.parents):
+        print("❌ --out must be outside the repository root and docs/")
+        return 2
+    if out_dir.exists() and any(out_dir.iterdir()):
+        if not args.force:
+            print(f"❌ {out_dir} is not empty (use --force to replace it)")
+            return 1
+        shutil.rmtree(out_dir)
+
+    print(f"🏭 Generating {developers} developers x {days} days, {requirements} requirements pages → {out_dir}")
+    stats = generate_corpus(out_dir, developers, days, requirements, seed=args.seed,
+                            legacy_ratio=args.legacy_ratio, sidebar=args.sidebar)
+    total = stats['day_pages'] + stats['legacy_pages'] + stats['overview_pages'] + stats['requirements_pages']
+    print(f"\n✅ {total} pages ({stats['legacy_pages']} legacy), {stats['bytes'] / 1024 / 1024:.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic Salesforce CPQ dataset for load and migration benchmarks.
+
+Writes the objects of the analyze flow (backend/__tests__/analyze-test.http)
+and the quotes that use them, as sharded record exports:
+
+    Product2            products with family, code and CPQ pricing fields
+    Pricebook2          the standard price book and --pricebooks custom ones
+    PricebookEntry      one entry per product per price book
+    SBQQ__Quote__c      quotes referencing an account and a price book
+    SBQQ__QuoteLine__c  1-MAX_LINES lines per quote, referencing the quote,
+                        a product and that product's entry in the quote's
+                        price book
+
+    <out>/<Object>-NNNNN[-P].ndjson[.gz] or .parquet   shards of at most --shard-rows records
+    <out>/manifest.json                            counts, seed, shards, analyze request body
+
+IDs are real-looking 18-character Salesforce IDs (key prefix, base62 counter,
+case-safe suffix) computed from each record's index, so any shard can compute
+the IDs it references without seeing the others. Prices are a hash of the
+product and price book rather than RNG state for the same reason, and quote
+amounts are the sums of their lines. Each shard has its own seed derived from
+--seed, so output is byte-for-byte the same for a seed whatever --workers is,
+and memory stays flat: NDJSON is written a record at a time and Parquet a
+row group (PARQUET_ROW_GROUP records) at a time.
+
+Records carry attributes.type and file names start with the object, so
+load_staging.py loads NDJSON output directly.
+
+Usage:
+    python scripts/generate_synthetic_cpq.py --preset medium
+    python scripts/generate_synthetic_cpq.py --quotes 2000000 --products 50000 --workers 8 --format ndjson.gz
+    python scripts/generate_synthetic_cpq.py --preset xlarge --format parquet --out /data/cpq
+
+Dependencies: pyarrow, for --format parquet only
+    pip install pyarrow
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import docs_pipeline
+
+DEFAULT_OUT_DIR = docs_pipeline.REPO_ROOT / 'build' / 'synthetic-cpq'
+
+# (quotes, products, custom price books, accounts); quotes average ~8.5 lines
+PRESETS = {
+    'small': (1_000, 200, 2, 100),
+    'medium': (100_000, 5_000, 5, 10_000),
+    'large': (1_000_000, 20_000, 10, 100_000),
+    'xlarge': (4_000_000, 50_000, 20, 400_000),
+}
+
+MAX_LINES = 16
+# Records buffered per Parquet row group
+PARQUET_ROW_GROUP = 100_000
+# Records per shard file
+DEFAULT_SHARD_ROWS = 1_000_000
+FORMATS = ('ndjson', 'ndjson.gz', 'parquet')
+ANALYZE_OBJECTS = ['Product2', 'Pricebook2', 'PricebookEntry']
+OBJECTS = ANALYZE_OBJECTS + ['SBQQ__Quote__c', 'SBQQ__QuoteLine__c']
+
+# Salesforce key prefixes; the custom objects get typical managed-package ones
+KEY_PREFIXES = {'Account': '001', 'Product2': '01t', 'Pricebook2': '01s', 'PricebookEntry': '01u',
+                'SBQQ__Quote__c': 'a0x', 'SBQQ__QuoteLine__c': 'a0w'}
+BASE62 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+SUFFIX_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ012345'
+
+FAMILIES = ['Hardware', 'Software', 'Services', 'Support', 'Training', 'Subscription']
+CHARGE_TYPES = ['One-Time', 'Recurring', 'Usage']
+BILLING_FREQUENCIES = ['Monthly', 'Quarterly', 'Semiannual', 'Annual']
+PRICING_METHODS = ['List', 'Cost', 'Block', 'Percent Of Total']
+QUOTE_STATUSES = ['Draft', 'In Review', 'Approved', 'Denied', 'Presented', 'Accepted', 'Rejected']
+QUOTE_TYPES = ['Quote', 'Renewal', 'Amendment']
+REGIONS = ['NA', 'EMEA', 'APAC', 'LATAM']
+START = date(2022, 1, 1)
+CREATED_DAYS = 1095
+# ISO dates from START on, covering every start, end and expiration date
+DATES = [(START + timedelta(days=i)).isoformat() for i in range(CREATED_DAYS + 60 + 3 * 365)]
+ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+# Base62 digit pairs with their uppercase bits, for the low five digits of an ID
+PAIRS = [a + b for a in BASE62 for b in BASE62]
+PAIR_BITS = [a.isupper() | b.isupper() << 1 for a in BASE62 for b in BASE62]
+
+
+@lru_cache(maxsize=1024)
+def _id_head(prefix, high):
+    """First ten characters of an ID and their two suffix characters."""
+    digits = ''
+    for _ in range(6):
+        high, r = divmod(high, 62)
+        digits = BASE62[r] + digits
+    head = prefix + '0' + digits
+    suffix = ''
+    for start in (0, 5):
+        suffix += SUFFIX_CHARS[sum(1 << i for i, c in enumerate(head[start:start + 5]) if c.isupper())]
+    return head, suffix
+
+
+def salesforce_id(object_name, index):
+    """18-character ID: key prefix, pod '0', zero-padded base62 index + 1, case-safe suffix.
+
+    IDs are generated by the million, so the low five digits come from a
+    table of digit pairs and the rest is cached.
+    """
+    high, low = divmod(index + 1, 62 ** 5)
+    head, suffix = _id_head(KEY_PREFIXES[object_name], high)
+    a, rest = divmod(low, 3844 * 3844)
+    b, c = divmod(rest, 3844)
+    bits = BASE62[a].isupper() | PAIR_BITS[b] << 1 | PAIR_BITS[c] << 3
+    return head + BASE62[a] + PAIRS[b] + PAIRS[c] + suffix + SUFFIX_CHARS[bits]
+
+
+def _hash(*keys):
+    """Deterministic value in [0, 1) from integer keys (splitmix64)."""
+    x = 0x9E3779B97F4A7C15
+    for key in keys:
+        x = (x ^ key) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+        x = (x ^ (x >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+        x ^= x >> 31
+    return x / 2 ** 64
+
+
+def list_price(seed, product):
+    return round(10 + 4990 * _hash(seed, product) ** 3, 2)
+
+
+@lru_cache(maxsize=1 << 16)
+def entry_price(seed, product, pricebook):
+    """The standard price book (0) uses the list price; custom ones adjust it by -20%..+10%."""
+    price = list_price(seed, product)
+    return price if pricebook == 0 else round(price * (0.8 + 0.3 * _hash(seed, product, pricebook + 1)), 2)
+
+
+def custom_field_specs(count):
+    """(name, kind) of the --custom-fields extra fields every object gets."""
+    kinds = ['text', 'number', 'date', 'boolean', 'picklist']
+    return [(f'Custom_{kinds[i % len(kinds)].title()}_{i + 1:02d}__c', kinds[i % len(kinds)]) for i in range(count)]
+
+
+def _custom_values(rng, specs):
+    values = {}
+    for name, kind in specs:
+        if rng.random() < 0.15:
+            values[name] = None
+        elif kind == 'text':
+            values[name] = f'{rng.choice(REGIONS)}-{rng.randrange(100000):05d}'
+        elif kind == 'number':
+            values[name] = round(rng.random() * 1000, 2)
+        elif kind == 'date':
+            values[name] = DATES[rng.randrange(CREATED_DAYS)]
+        elif kind == 'boolean':
+            values[name] = rng.random() < 0.5
+        else:
+            values[name] = rng.choice(REGIONS)
+    return values
+
+
+def _created(rng):
+    """(day offset from START, CreatedDate)."""
+    day = rng.randrange(CREATED_DAYS)
+    return day, f'{DATES[day]}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}.000+0000'
+
+
+# ---------------------------------------------------------------------------
+# Records
+# ---------------------------------------------------------------------------
+
+def products(spec, first, last, rng):
+    fields = custom_field_specs(spec['custom_fields'])
+    for p in range(first, last):
+        family = FAMILIES[p % len(FAMILIES)]
+        recurring = family in ('Subscription', 'Support')
+        record = {
+            'attributes': {'type': 'Product2'},
+            'Id': salesforce_id('Product2', p), 'Name': f'{family} Product {p + 1}',
+            'ProductCode': f'{family[:3].upper()}-{p + 1:07d}', 'Family': family,
+            'Description': f'Synthetic {family.lower()} product {p + 1}', 'IsActive': rng.random() < 0.95,
+            'CreatedDate': _created(rng)[1],
+            'SBQQ__ChargeType__c': 'Recurring' if recurring else rng.choice(CHARGE_TYPES[::2]),
+            'SBQQ__BillingFrequency__c': rng.choice(BILLING_FREQUENCIES) if recurring else None,
+            'SBQQ__SubscriptionPricing__c': 'Fixed Price' if recurring else None,
+            'SBQQ__SubscriptionTerm__c': 12 if recurring else None,
+            'SBQQ__PricingMethod__c': rng.choice(PRICING_METHODS),
+        }
+        record.update(_custom_values(rng, fields))
+        yield record
+
+
+def pricebooks(spec, first, last, rng):
+    fields = custom_field_specs(spec['custom_fields'])
+    for b in range(first, last):
+        record = {
+            'attributes': {'type': 'Pricebook2'},
+            'Id': salesforce_id('Pricebook2', b),
+            'Name': 'Standard Price Book' if b == 0 else f'{REGIONS[(b - 1) % len(REGIONS)]} Price Book {b}',
+            'IsStandard': b == 0, 'IsActive': True, 'Description': None if b == 0 else f'Custom price book {b}',
+            'CreatedDate': _created(rng)[1],
+        }
+        record.update(_custom_values(rng, fields))
+        yield record
+
+
+def pricebook_entries(spec, first, last, rng):
+    """Entry e is product e % products in price book e // products."""
+    seed, count = spec['seed'], spec['products']
+    for e in range(first, last):
+        b, p = divmod(e, count)
+        yield {
+            'attributes': {'type': 'PricebookEntry'},
+            'Id': salesforce_id('PricebookEntry', e),
+            'Pricebook2Id': salesforce_id('Pricebook2', b), 'Product2Id': salesforce_id('Product2', p),
+            'UnitPrice': entry_price(seed, p, b), 'IsActive': True, 'UseStandardPrice': b == 0,
+            'CreatedDate': _created(rng)[1],
+        }
+
+
+def quotes_with_lines(spec, first, last, rng):
+    """(quote, lines) for quotes first..last-1. Line ids are quote * MAX_LINES + line number."""
+    seed, count, books = spec['seed'], spec['products'], spec['pricebooks'] + 1
+    fields = custom_field_specs(spec['custom_fields'])
+    for q in range(first, last):
+        quote_id = salesforce_id('SBQQ__Quote__c', q)
+        b = rng.randrange(books)
+        created, created_at = _created(rng)
+        start = created + rng.randrange(60)
+        term = rng.choice((12, 24, 36))
+        end = start + term * 365 // 12 - 1
+        lines = []
+        list_amount = net_amount = 0.0
+        for n in range(min(MAX_LINES, 1 + int(rng.expovariate(1 / 7.5)))):
+            p = rng.randrange(count)
+            price = entry_price(seed, p, b)
+            quantity = rng.choice((1, 1, 1, 2, 5, 10, 25, 100))
+            discount = rng.choice((0, 0, 0, 5, 10, 15, 20))
+            net = round(price * (100 - discount) / 100, 2)
+            list_amount += price * quantity
+            net_amount += net * quantity
+            line = {
+                'attributes': {'type': 'SBQQ__QuoteLine__c'},
+                'Id': salesforce_id('SBQQ__QuoteLine__c', q * MAX_LINES + n), 'Name': f'QL-{q * MAX_LINES + n:010d}',
+                'SBQQ__Quote__c': quote_id, 'SBQQ__Product__c': salesforce_id('Product2', p),
+                'SBQQ__PricebookEntryId__c': salesforce_id('PricebookEntry', b * count + p),
+                'SBQQ__Number__c': n + 1, 'SBQQ__Quantity__c': quantity, 'SBQQ__ListPrice__c': price,
+                'SBQQ__Discount__c': discount or None, 'SBQQ__NetPrice__c': net,
+                'SBQQ__NetTotal__c': round(net * quantity, 2),
+                'SBQQ__StartDate__c': DATES[start], 'SBQQ__EndDate__c': DATES[end],
+                'CreatedDate': created_at,
+            }
+            line.update(_custom_values(rng, fields))
+            lines.append(line)
+        quote = {
+            'attributes': {'type': 'SBQQ__Quote__c'},
+            'Id': quote_id, 'Name': f'Q-{q + 1:08d}',
+            'SBQQ__Account__c': salesforce_id('Account', rng.randrange(spec['accounts'])),
+            'SBQQ__PriceBook__c': salesforce_id('Pricebook2', b), 'SBQQ__PricebookId__c': salesforce_id('Pricebook2', b),
+            'SBQQ__Status__c': rng.choice(QUOTE_STATUSES), 'SBQQ__Type__c': rng.choice(QUOTE_TYPES),
+            'SBQQ__Primary__c': rng.random() < 0.7,
+            'SBQQ__StartDate__c': DATES[start], 'SBQQ__EndDate__c': DATES[end],
+            'SBQQ__SubscriptionTerm__c': term,
+            'SBQQ__ExpirationDate__c': DATES[created + 30],
+            'SBQQ__ListAmount__c': round(list_amount, 2), 'SBQQ__NetAmount__c': round(net_amount, 2),
+            'SBQQ__LineItemCount__c': len(lines),
+            'CreatedDate': created_at,
+        }
+        quote.update(_custom_values(rng, fields))
+        yield quote, lines
+
+
+# ---------------------------------------------------------------------------
+# Shards
+# ---------------------------------------------------------------------------
+
+class ShardWriter:
+    """Streams records of one object into <Object>-NNNNN shard files, starting a
+    <Object>-NNNNN-P part whenever a file reaches `rows` records."""
+
+    def __init__(self, out_dir, object_name, shard, rows, fmt):
+        self.out_dir = out_dir
+        self.object_name = object_name
+        self.shard = shard
+        self.rows = rows
+        self.fmt = fmt
+        self.count = 0
+        self.part = 0
+        self.file = None
+        self.buffer = []
+        self.schema = None
+        self.files = []
+
+    def _path(self):
+        part = f'-{self.part}' if self.part else ''
+        return self.out_dir / f'{self.object_name}-{self.shard:05d}{part}.{self.fmt}'
+
+    def _open(self):
+        path = self._path()
+        self.files.append(path.name)
+        if self.fmt == 'parquet':
+            return None
+        if self.fmt.endswith('.gz'):
+            return gzip.open(path, 'wt', encoding='utf-8', compresslevel=1)
+        return open(path, 'w', encoding='utf-8')
+
+    def write(self, record):
+        if self.count and self.count % self.rows == 0:
+            self._close()
+            self.part += 1
+        if self.count % self.rows == 0:
+            self.file = self._open()
+        if self.fmt == 'parquet':
+            self.buffer.append(record)
+            if len(self.buffer) >= PARQUET_ROW_GROUP:
+                self._flush()
+        else:
+            self.file.write(ENCODER.encode(record) + '\n')
+        self.count += 1
+
+    def _flush(self):
+        """Write the buffered records as one Parquet row group; the first one fixes the schema."""
+        import pyarrow
+        import pyarrow.parquet
+
+        rows = [{k: v for k, v in record.items() if k != 'attributes'} for record in self.buffer]
+        table = pyarrow.Table.from_pylist(rows, schema=self.schema)
+        if self.file is None:
+            self.schema = table.schema
+            self.file = pyarrow.parquet.ParquetWriter(self._path(), self.schema)
+        self.file.write_table(table)
+        self.buffer = []
+
+    def _close(self):
+        if self.buffer:
+            self._flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def close(self):
+        self._close()
+        return self.files
+
+
+def _task_rng(seed, object_name, task):
+    return random.Random(f'{seed}:{object_name}:{task}')
+
+
+def run_task(task):
+    """Generate one shard task: a range of one object's records (quotes also write their lines)."""
+    spec, object_name, index, first, last = task
+    out_dir, fmt, rows = Path(spec['out']), spec['format'], spec['shard_rows']
+    rng = _task_rng(spec['seed'], object_name, index)
+    if object_name == 'SBQQ__Quote__c':
+        quotes = ShardWriter(out_dir, 'SBQQ__Quote__c', index, rows, fmt)
+        lines = ShardWriter(out_dir, 'SBQQ__QuoteLine__c', index, rows, fmt)
+        for quote, quote_lines in quotes_with_lines(spec, first, last, rng):
+            quotes.write(quote)
+            for line in quote_lines:
+                lines.write(line)
+        return {'SBQQ__Quote__c': (quotes.count, quotes.close()), 'SBQQ__QuoteLine__c': (lines.count, lines.close())}
+    generate = {'Product2': products, 'Pricebook2': pricebooks, 'PricebookEntry': pricebook_entries}[object_name]
+    writer = ShardWriter(out_dir, object_name, index, rows, fmt)
+    for record in generate(spec, first, last, rng):
+        writer.write(record)
+    return {object_name: (writer.count, writer.close())}
+
+
+def plan_tasks(spec):
+    """One task per shard of each object; quote tasks are sized so their lines fill about one shard."""
+    # Quotes first, as the longest tasks, so the pool does not end on one of them
+    totals = {'SBQQ__Quote__c': spec['quotes'], 'PricebookEntry': spec['products'] * (spec['pricebooks'] + 1),
+              'Product2': spec['products'], 'Pricebook2': spec['pricebooks'] + 1}
+    tasks = []
+    for object_name, total in totals.items():
+        size = spec['shard_rows'] if object_name != 'SBQQ__Quote__c' else max(1, spec['shard_rows'] // 9)
+        for index, first in enumerate(range(0, total, size)):
+            tasks.append((spec, object_name, index, first, min(total, first + size)))
+    return tasks
+
+
+def generate(spec, workers=1, report=print):
+    tasks = plan_tasks(spec)
+    results = []
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(run_task, tasks):
+                results.append(result)
+                report(f"   {', '.join(f'{name} {count:,}' for name, (count, _) in result.items())}")
+    else:
+        for task in tasks:
+            result = run_task(task)
+            results.append(result)
+            report(f"   {', '.join(f'{name} {count:,}' for name, (count, _) in result.items())}")
+    counts = {name: 0 for name in OBJECTS}
+    shards = {name: [] for name in OBJECTS}
+    for result in results:
+        for name, (count, files) in result.items():
+            counts[name] += count
+            shards[name].extend(files)
+    return counts, {name: sorted(files) for name, files in shards.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic Salesforce CPQ dataset')
+    parser.add_argument('--preset', choices=list(PRESETS), default='small',
+                        help='Scale preset: quotes, products, custom price books, accounts (default: small)')
+    parser.add_argument('--quotes', type=int, help='Quotes (overrides the preset; ~8.5 lines each)')
+    parser.add_argument('--products', type=int, help='Products (overrides the preset)')
+    parser.add_argument('--pricebooks', type=int, help='Custom price books besides the standard one')
+    parser.add_argument('--accounts', type=int, help='Distinct accounts referenced by quotes')
+    parser.add_argument('--custom-fields', type=int, default=5, help='Extra custom fields per object (default: 5)')
+    parser.add_argument('--format', choices=FORMATS, default='ndjson', help='Shard format (default: ndjson)')
+    parser.add_argument('--shard-rows', type=int, default=DEFAULT_SHARD_ROWS,
+                        help=f'Records per shard file (default: {DEFAULT_SHARD_ROWS:,})')
+    parser.add_argument('--workers', type=int, default=1, help='Processes generating shards (default: 1)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed (default: 1)')
+    parser.add_argument('--out', help='Output directory (default: build/synthetic-cpq/<preset>)')
+    parser.add_argument('--force', action='store_true', help='Replace the output directory if it exists')
+    args = parser.parse_args(argv)
+
+    if args.format == 'parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            print("ERROR: pyarrow is required for --format parquet: pip install pyarrow")
+            return 4
+
+    quotes, product_count, pricebook_count, accounts = PRESETS[args.preset]
+    out_dir = Path(args.out) if args.out else DEFAULT_OUT_DIR / args.preset
+    if out_dir.exists() and any(out_dir.iterdir()):
+        if not args.force:
+            print(f"❌ {out_dir} is not empty (use --force to replace it)")
+            return 1
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    spec = {
+        'seed': args.seed, 'out': str(out_dir), 'format': args.format, 'shard_rows': max(1, args.shard_rows),
+        'quotes': args.quotes if args.quotes is not None else quotes,
+        'products': max(1, args.products or product_count),
+        'pricebooks': args.pricebooks if args.pricebooks is not None else pricebook_count,
+        'accounts': max(1, args.accounts or accounts),
+        'custom_fields': args.custom_fields,
+    }
+    workers = max(1, min(args.workers, os.cpu_count() or 1))
+    print(f"🏭 Generating {spec['quotes']:,} quotes over {spec['products']:,} products and "
+          f"{spec['pricebooks'] + 1} price books → {out_dir} ({args.format}, {workers} worker(s))")
+    start = time.perf_counter()
+    counts, shards = generate(spec, workers)
+    seconds = time.perf_counter() - start
+
+    total = sum(counts.values())
+    manifest = {
+        'seed': args.seed, 'format': args.format, 'shard_rows': spec['shard_rows'],
+        'scale': {key: spec[key] for key in ('quotes', 'products', 'pricebooks', 'accounts', 'custom_fields')},
+        'counts': counts, 'shards': shards,
+        # Body for POST /api/v1/projects/:id/analyze, as in backend/__tests__/analyze-test.http
+        'analyze_request': {'objects': ANALYZE_OBJECTS},
+    }
+    with open(out_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    size = sum(p.stat().st_size for p in out_dir.iterdir())
+    print(f"\n✅ {total:,} records in {seconds:.1f}s ({total / seconds if seconds else 0:,.0f} records/s), "
+          f"{size / 1024 / 1024:.1f} MB")
+    for name in OBJECTS:
+        print(f"   {name:<20} {counts[name]:>12,} records  {len(shards[name]):>4} shard(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
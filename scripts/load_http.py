@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+Replay .http request files under load.
+
+Each .http file (the REST Client format of backend/__tests__/) is one
+scenario: its requests run in order, and a run of the scenario is one
+iteration. --concurrency virtual users, each with its own keep-alive
+connections, run iterations back to back until --duration or --iterations
+is reached, and the driver reports per request and per scenario:
+
+    count, errors (connection failures and non-2xx), requests/s and
+    p50 / p90 / p95 / p99 / max latency
+
+Besides what REST Client understands (### separators and titles, @var = value
+file variables, {{var}}, {{$timestamp}}, {{$guid}}, {{$randomInt min max}},
+and `# @name` with {{name.response.body.$.path}} / {{name.response.headers.X}}
+references to earlier responses), one comment directive drives polling:
+
+    # @until status=completed|failed
+
+repeats the request every --poll-interval until the top-level JSON field has
+one of the values (or --poll-timeout runs out, which counts as an error).
+The time until the condition was observed is reported as "<request> (wait)".
+It is only as fine as --poll-interval: a job is seen done at the first poll
+after it finishes, so the wait overstates the job's time in the queue by up
+to one interval (plus a poll's round trip). The 50 ms default keeps that small
+next to the backend's 2 s jobs; raise it to poll less under high concurrency.
+
+--base-url points the files' URLs at another server. --stub starts the
+bundled stub of the analyze routes in a child process and points the files
+at it, which measures the driver itself and gives a baseline to compare a
+real backend against; --serve-stub runs only the stub.
+
+Usage:
+    python scripts/load_http.py backend/__tests__/analyze-test.http --concurrency 50 --duration 30
+    python scripts/load_http.py backend/__tests__/analyze-test.http --stub --stub-job-seconds 0.2
+    python scripts/load_http.py --serve-stub --port 3000
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import ssl
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import docs_profile
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_DURATION = 10.0
+DEFAULT_POLL_INTERVAL = 0.05
+DEFAULT_POLL_TIMEOUT = 30.0
+# The backend completes analyze jobs after a 2s setTimeout
+DEFAULT_STUB_JOB_SECONDS = 2.0
+PERCENTILES = (50, 90, 95, 99)
+
+REQUEST_LINE_RE = re.compile(r'^(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+(\S+)(?:\s+HTTP/[\d.]+)?\s*$', re.I)
+VARIABLE_RE = re.compile(r'^@([\w.-]+)\s*=\s*(.*)$')
+DIRECTIVE_RE = re.compile(r'^(?:#|//)\s*@(name|until)\s+(.*)$')
+TEMPLATE_RE = re.compile(r'\{\{\s*([^}]+?)\s*\}\}')
+
+
+class HttpRequest:
+    """One request of a scenario, with its {{...}} templates unresolved."""
+
+    def __init__(self, method, url, headers, body, name=None, title=None, until=None):
+        self.method = method.upper()
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.name = name
+        self.title = title
+        # (field, allowed values) for `# @until field=a|b`
+        self.until = until
+
+    @property
+    def label(self):
+        return self.title or self.name or f'{self.method} {self.url}'
+
+
+class Scenario:
+    def __init__(self, name, requests, variables):
+        self.name = name
+        self.requests = requests
+        self.variables = variables
+
+
+def _clean_title(text):
+    """'### 🧪 1. Start Analysis Job' -> 'Start Analysis Job'."""
+    return re.sub(r'^[^\w]*(\d+\.\s*)?', '', text).strip() or None
+
+
+def parse_http(text, name='scenario'):
+    """Parse the requests of a .http file into a Scenario."""
+    requests, variables = [], {}
+    title, directives, current = None, {}, None
+
+    def finish():
+        if current is not None:
+            method, url, headers, body = current
+            requests.append(HttpRequest(method, url, headers, '\n'.join(body).strip() or None,
+                                        directives.get('name'), title, directives.get('until')))
+
+    in_body = False
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('###'):
+            finish()
+            current, in_body, directives = None, False, {}
+            title = _clean_title(stripped[3:])
+            continue
+        if current is None:
+            match = DIRECTIVE_RE.match(stripped)
+            if match:
+                key, value = match.groups()
+                if key == 'until':
+                    field, _, values = value.partition('=')
+                    directives['until'] = (field.strip(), set(v.strip() for v in values.split('|')))
+                else:
+                    directives['name'] = value.strip()
+                continue
+            if not stripped or stripped.startswith(('#', '//')):
+                continue
+            match = VARIABLE_RE.match(stripped)
+            if match:
+                variables[match.group(1)] = match.group(2).strip()
+                continue
+            match = REQUEST_LINE_RE.match(stripped)
+            if match:
+                current = (match.group(1), match.group(2), [], [])
+            continue
+        if in_body:
+            current[3].append(line)
+        elif not stripped:
+            in_body = True
+        elif ':' in stripped and not stripped.startswith(('#', '//')):
+            key, value = stripped.split(':', 1)
+            current[2].append((key.strip(), value.strip()))
+    finish()
+    return Scenario(name, requests, variables)
+
+
+def load_scenario(path):
+    path = Path(path)
+    return parse_http(path.read_text(encoding='utf-8'), path.stem)
+
+
+# ---------------------------------------------------------------------------
+# Templates
+# ---------------------------------------------------------------------------
+
+def _json_path(value, path):
+    for key in [k for k in path.lstrip('$').split('.') if k]:
+        if isinstance(value, list):
+            value = value[int(key)]
+        elif isinstance(value, dict):
+            value = value.get(key)
+        else:
+            return None
+    return value
+
+
+def resolve(text, variables, responses):
+    """Substitute {{...}} in text from file variables, builtins and earlier named responses."""
+    def replace(match):
+        expression = match.group(1)
+        if expression.startswith('$'):
+            parts = expression.split()
+            if parts[0] == '$timestamp':
+                return str(int(time.time()))
+            if parts[0] == '$guid':
+                return str(uuid.uuid4())
+            if parts[0] == '$randomInt' and len(parts) == 3:
+                return str(random.randrange(int(parts[1]), int(parts[2])))
+            return match.group(0)
+        if expression in variables:
+            return resolve(variables[expression], variables, responses)
+        name, _, rest = expression.partition('.response.')
+        if name in responses and rest:
+            status, headers, body = responses[name]
+            if rest.startswith('headers.'):
+                return headers.get(rest[len('headers.'):].lower(), '')
+            if rest.startswith('body'):
+                try:
+                    value = _json_path(json.loads(body or 'null'), rest[len('body'):].lstrip('.'))
+                except (ValueError, IndexError):
+                    return ''
+                return value if isinstance(value, str) else json.dumps(value)
+        return match.group(0)
+
+    return TEMPLATE_RE.sub(replace, text)
+
+
+# ---------------------------------------------------------------------------
+# HTTP/1.1 over asyncio streams
+# ---------------------------------------------------------------------------
+
+async def read_message(reader, request=False):
+    """Read one HTTP message: (start line, {lowercased header: value}, body bytes)."""
+    start = await reader.readline()
+    if not start:
+        raise ConnectionError('connection closed')
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        key, _, value = line.decode('latin-1').partition(':')
+        headers[key.strip().lower()] = value.strip()
+    if 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    elif headers.get('transfer-encoding', '').lower() == 'chunked':
+        parts = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if not size:
+                await reader.readline()
+                break
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b''.join(parts)
+    elif request:
+        body = b''
+    else:
+        body = await reader.read()
+    return start.decode('latin-1').strip(), headers, body
+
+
+class Connection:
+    """A keep-alive connection to one origin, reopened when the server closes it."""
+
+    def __init__(self, scheme, host, port):
+        self.scheme, self.host, self.port = scheme, host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, target, headers, body):
+        for attempt in (0, 1):
+            if self.writer is None:
+                context = ssl.create_default_context() if self.scheme == 'https' else None
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+                fresh = True
+            else:
+                fresh = False
+            lines = [f'{method} {target} HTTP/1.1', f'Host: {self.host}:{self.port}']
+            lines += [f'{key}: {value}' for key, value in headers if key.lower() not in ('host', 'content-length')]
+            lines.append(f'Content-Length: {len(body)}')
+            try:
+                self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+                await self.writer.drain()
+                start, response_headers, response_body = await read_message(self.reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if fresh or attempt:
+                    raise
+                continue  # A kept-alive connection the server had already closed
+            if response_headers.get('connection', '').lower() == 'close':
+                self.close()
+            return int(start.split()[1]), response_headers, response_body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+class Stats:
+    """Latencies in seconds and error counts per metric name."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, name, seconds, ok=True):
+        self.latencies.setdefault(name, []).append(seconds)
+        self.errors[name] = self.errors.get(name, 0) + (not ok)
+
+    def summary(self, elapsed):
+        rows = {}
+        for name, values in self.latencies.items():
+            values = sorted(values)
+            rows[name] = {
+                'count': len(values), 'errors': self.errors[name],
+                'per_second': round(len(values) / elapsed, 1) if elapsed else None,
+                **{f'p{p}_ms': round(values[max(0, math.ceil(p / 100 * len(values)) - 1)] * 1000, 2)
+                   for p in PERCENTILES},
+                'max_ms': round(values[-1] * 1000, 2),
+            }
+        return rows
+
+
+class LoadDriver:
+    def __init__(self, scenarios, concurrency=DEFAULT_CONCURRENCY, duration=DEFAULT_DURATION, iterations=None,
+                 base_url=None, poll_interval=DEFAULT_POLL_INTERVAL, poll_timeout=DEFAULT_POLL_TIMEOUT,
+                 timeout=30.0):
+        self.scenarios = scenarios
+        self.concurrency = concurrency
+        self.duration = duration
+        self.iterations = iterations
+        self.base = urlsplit(base_url) if base_url else None
+        self.poll_interval = poll_interval
+        self.poll_timeout = poll_timeout
+        self.timeout = timeout
+        self.stats = Stats()
+        self._started = 0
+
+    def _target(self, url):
+        parts = urlsplit(url)
+        origin = self.base or parts
+        scheme = origin.scheme or 'http'
+        port = origin.port or (443 if scheme == 'https' else 80)
+        # A base URL's path prefixes the request's (e.g. a reverse proxy mount)
+        path = (self.base.path.rstrip('/') if self.base else '') + (parts.path or '/')
+        return (scheme, origin.hostname, port), path + (f'?{parts.query}' if parts.query else '')
+
+    def _next_iteration(self, deadline):
+        if self.iterations is not None:
+            if self._started >= self.iterations:
+                return None
+        elif time.perf_counter() >= deadline:
+            return None
+        scenario = self.scenarios[self._started % len(self.scenarios)]
+        self._started += 1
+        return scenario
+
+    async def _send(self, connections, request, variables, responses):
+        origin, target = self._target(resolve(request.url, variables, responses))
+        connection = connections.get(origin)
+        if connection is None:
+            connection = connections[origin] = Connection(*origin)
+        headers = [(key, resolve(value, variables, responses)) for key, value in request.headers]
+        body = resolve(request.body, variables, responses).encode('utf-8') if request.body else b''
+        start = time.perf_counter()
+        try:
+            status, response_headers, response_body = await asyncio.wait_for(
+                connection.request(request.method, target, headers, body), self.timeout)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+            connection.close()
+            self.stats.record(request.label, time.perf_counter() - start, ok=False)
+            return None
+        self.stats.record(request.label, time.perf_counter() - start, ok=200 <= status < 300)
+        return status, response_headers, response_body.decode('utf-8', errors='replace')
+
+    def _satisfied(self, request, response):
+        field, values = request.until
+        try:
+            value = json.loads(response[2]).get(field)
+        except (ValueError, AttributeError):
+            return False
+        return str(value) in values
+
+    async def _run_scenario(self, scenario, connections):
+        responses = {}
+        start = time.perf_counter()
+        ok = True
+        for request in scenario.requests:
+            first = time.perf_counter()
+            response = await self._send(connections, request, scenario.variables, responses)
+            while request.until and response is not None and not self._satisfied(request, response):
+                if time.perf_counter() - first > self.poll_timeout:
+                    response = None
+                    break
+                await asyncio.sleep(self.poll_interval)
+                response = await self._send(connections, request, scenario.variables, responses)
+            if request.until:
+                self.stats.record(f'{request.label} (wait)', time.perf_counter() - first, ok=response is not None)
+            if response is None:
+                ok = False
+                break
+            if request.name:
+                responses[request.name] = response
+        self.stats.record(f'scenario: {scenario.name}', time.perf_counter() - start, ok=ok)
+
+    async def _user(self, deadline):
+        connections = {}
+        try:
+            while True:
+                scenario = self._next_iteration(deadline)
+                if scenario is None:
+                    return
+                await self._run_scenario(scenario, connections)
+        finally:
+            for connection in connections.values():
+                connection.close()
+
+    async def run(self):
+        start = time.perf_counter()
+        deadline = start + self.duration
+        await asyncio.gather(*(self._user(deadline) for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - start
+        return elapsed, self.stats.summary(elapsed)
+
+
+def print_report(summary, elapsed, concurrency):
+    requests = sum(row['count'] for name, row in summary.items() if not name.startswith('scenario:')
+                   and not name.endswith('(wait)'))
+    print(f"\n✅ {requests:,} requests in {elapsed:.1f}s at concurrency {concurrency}: "
+          f"{requests / elapsed if elapsed else 0:,.1f} requests/s")
+    header = f"   {'':<40} {'count':>8} {'errors':>7} {'per s':>8}" + ''.join(
+        f"{f'p{p} ms':>10}" for p in PERCENTILES) + f"{'max ms':>10}"
+    print(header)
+    for name, row in summary.items():
+        label = name if len(name) <= 40 else name[:39] + '…'
+        print(f"   {label:<40} {row['count']:>8,} {row['errors']:>7,} {row['per_second']:>8,.1f}"
+              + ''.join(f"{row[f'p{p}_ms']:>10,.1f}" for p in PERCENTILES) + f"{row['max_ms']:>10,.1f}")
+
+
+# ---------------------------------------------------------------------------
+# Stub backend
+# ---------------------------------------------------------------------------
+
+class StubBackend:
+    """The analyze routes of backend/src/routes/analyze.routes.ts, in memory.
+
+    Jobs are queued until job_seconds have passed and completed after, like
+    the backend's setTimeout; there is no Redis, so the stub measures the
+    driver and the HTTP path alone.
+    """
+
+    ROUTES = [
+        ('POST', re.compile(r'^/api/v1/projects/(\d+)/analyze$'), 'start'),
+        ('GET', re.compile(r'^/api/v1/projects/(\d+)/analyze/summary$'), 'summary'),
+        ('GET', re.compile(r'^/api/v1/projects/(\d+)/analyze/jobs$'), 'jobs'),
+        ('GET', re.compile(r'^/api/v1/projects/(\d+)/analyze/([\w-]+)$'), 'status'),
+    ]
+
+    def __init__(self, job_seconds=DEFAULT_STUB_JOB_SECONDS):
+        self.job_seconds = job_seconds
+        self.jobs = {}
+        self._next_job = 0
+
+    def _job(self, job_id):
+        job = self.jobs[job_id]
+        done = time.time() - job['created'] >= self.job_seconds
+        result = {'status': 'completed' if done else 'queued', 'projectId': job['projectId'], 'objects': job['objects'],
+                  'createdAt': job['createdAt']}
+        if done:
+            result['result'] = {'analyzedObjects': len(job['objects']),
+                                'message': 'Schema analysis finished successfully'}
+        return result
+
+    def handle(self, method, path, body):
+        for route_method, pattern, action in self.ROUTES:
+            match = pattern.match(path)
+            if not match or method != route_method:
+                continue
+            project_id = match.group(1)
+            if action == 'start':
+                try:
+                    objects = json.loads(body or b'{}').get('objects')
+                except ValueError:
+                    return 400, {'error': 'Invalid JSON body'}
+                objects = objects or ['Product2', 'Pricebook2', 'PricebookEntry']
+                self._next_job += 1
+                job_id = f'job_{int(time.time() * 1000)}_{self._next_job}'
+                self.jobs[job_id] = {'projectId': project_id, 'objects': objects, 'created': time.time(),
+                                     'createdAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+                return 200, {'job_id': job_id, 'status': 'queued', 'message': 'Analysis started', 'objects': objects}
+            if action == 'summary':
+                return 200, {'project_id': int(project_id), 'total_objects': 5, 'custom_objects': 2,
+                             'total_fields': 78, 'custom_fields': 25, 'readiness_score': 0.84, 'warnings': []}
+            if action == 'jobs':
+                jobs = [{'job_id': job_id, **self._job(job_id)} for job_id, job in self.jobs.items()
+                        if job['projectId'] == project_id]
+                return 200, {'project_id': project_id, 'total_jobs': len(jobs), 'jobs': jobs}
+            job_id = match.group(2)
+            if job_id not in self.jobs:
+                return 404, {'error': f'Job {job_id} not found'}
+            return 200, self._job(job_id)
+        return 404, {'error': f'Cannot {method} {path}'}
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    start, headers, body = await read_message(reader, request=True)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    break
+                method, target = start.split()[:2]
+                status, payload = self.handle(method.upper(), urlsplit(target).path, body)
+                content = json.dumps(payload).encode('utf-8')
+                writer.write(f'HTTP/1.1 {status} {"OK" if status == 200 else "Error"}\r\n'
+                             f'Content-Type: application/json; charset=utf-8\r\n'
+                             f'Content-Length: {len(content)}\r\nConnection: keep-alive\r\n\r\n'.encode('latin-1')
+                             + content)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def serve_stub(host, port, job_seconds, ready=print):
+    stub = StubBackend(job_seconds)
+    server = await asyncio.start_server(stub.serve_connection, host, port, backlog=1024)
+    ready(f'stub listening on http://{host}:{server.sockets[0].getsockname()[1]}')
+    async with server:
+        await server.serve_forever()
+
+
+def start_stub_process(job_seconds):
+    """Run the stub in a child process (so it does not share the driver's CPU); returns (process, base URL)."""
+    process = subprocess.Popen([sys.executable, __file__, '--serve-stub', '--port', '0',
+                                '--stub-job-seconds', str(job_seconds)],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    match = re.search(r'(http://\S+)', line)
+    if not match:
+        process.kill()
+        raise RuntimeError('stub server did not start')
+    return process, match.group(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay .http request files under load')
+    parser.add_argument('files', nargs='*', help='.http files, one scenario each')
+    parser.add_argument('-c', '--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Virtual users (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('-d', '--duration', type=float, default=DEFAULT_DURATION,
+                        help=f'Seconds to keep starting iterations (default: {DEFAULT_DURATION:g})')
+    parser.add_argument('-n', '--iterations', type=int, help='Scenario iterations in total (overrides --duration)')
+    parser.add_argument('--base-url', help='Send every request to this origin, e.g. http://localhost:3000')
+    parser.add_argument('--poll-interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f'Seconds between @until polls, the resolution of (wait) times '
+                             f'(default: {DEFAULT_POLL_INTERVAL:g})')
+    parser.add_argument('--poll-timeout', type=float, default=DEFAULT_POLL_TIMEOUT,
+                        help=f'Seconds before an @until poll fails (default: {DEFAULT_POLL_TIMEOUT:g})')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Seconds per request (default: 30)')
+    parser.add_argument('--stub', action='store_true', help='Replay against the bundled stub backend')
+    parser.add_argument('--stub-job-seconds', type=float, default=DEFAULT_STUB_JOB_SECONDS,
+                        help=f'Seconds a stub job stays queued (default: {DEFAULT_STUB_JOB_SECONDS:g})')
+    parser.add_argument('--serve-stub', action='store_true', help='Only run the stub backend')
+    parser.add_argument('--host', default='127.0.0.1', help='Stub host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3000, help='Stub port (default: 3000)')
+    parser.add_argument('-o', '--output', help='Write the report as JSON')
+    args = parser.parse_args(argv)
+
+    if args.serve_stub:
+        try:
+            asyncio.run(serve_stub(args.host, args.port, args.stub_job_seconds,
+                                   ready=lambda line: print(line, flush=True)))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if not args.files:
+        parser.error('at least one .http file is required (or use --serve-stub)')
+
+    scenarios = [load_scenario(path) for path in args.files]
+    for scenario in scenarios:
+        if not scenario.requests:
+            parser.error(f'no requests found in {scenario.name}')
+    base_url, stub = args.base_url, None
+    if args.stub:
+        stub, base_url = start_stub_process(args.stub_job_seconds)
+    requests = sum(len(s.requests) for s in scenarios)
+    print(f"🚀 {len(scenarios)} scenario(s), {requests} request(s) each iteration, concurrency {args.concurrency}, "
+          + (f"{args.iterations} iterations" if args.iterations else f"{args.duration:g}s")
+          + (f" → {base_url}" if base_url else ''))
+    driver = LoadDriver(scenarios, max(1, args.concurrency), args.duration, args.iterations, base_url,
+                        args.poll_interval, args.poll_timeout, args.timeout)
+    try:
+        elapsed, summary = asyncio.run(driver.run())
+    finally:
+        if stub:
+            stub.terminate()
+            stub.wait()
+    print_report(summary, elapsed, args.concurrency)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'concurrency': args.concurrency, 'seconds': round(elapsed, 3), 'base_url': base_url,
+                       'scenarios': [s.name for s in scenarios], 'results': summary}, f, indent=1, ensure_ascii=False)
+        print(f"📄 Report written to {args.output}")
+    return 1 if any(row['errors'] for row in summary.values()) else 0
+
+
+if __name__ == '__main__':
+    with docs_profile.profile_from_argv():
+        sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Minify generated docs pages for publishing.
+
+Copies docs/ into a publish directory (build/docs by default), minifying each
+HTML page on the way:
+  - collapses whitespace runs to a single space, except inside
+    <pre>, <code> and <textarea>, and never inside attribute values
+  - strips comments such as <!-- Week N Subsection --> (conditional
+    comments <!--[if ...]> are kept)
+  - minifies inline <style> CSS and inline <script> JS
+
+docs/ itself is never modified, so the source of truth stays readable. The
+minifier is deliberately conservative: it only removes whitespace and
+comments, keeping line breaks in JS so automatic semicolon insertion still
+behaves the same.
+
+Usage:
+    python scripts/minify_html.py
+    python scripts/minify_html.py --out build/docs --quiet
+"""
+
+import argparse
+import os
+import re
+import shutil
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+DOCS_DIR = REPO_ROOT / 'docs'
+DEFAULT_OUT_DIR = REPO_ROOT / 'build' / 'docs'
+
+# Comments, raw-text / whitespace-sensitive elements, tags (quote-aware), text.
+HTML_TOKEN_PATTERN = re.compile(
+    r'(?P<comment><!--.*?-->)'
+    r'|(?P<raw_open><(?P<raw_tag>pre|textarea|code|script|style)\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>)'
+    r'(?P<raw_body>.*?)(?P<raw_close></(?P=raw_tag)\s*>)'
+    r'|(?P<tag><[a-zA-Z/!](?:"[^"]*"|\'[^\']*\'|[^\'">])*>)'
+    r'|(?P<text>[^<]+|<)',
+    re.DOTALL | re.IGNORECASE
+)
+
+TAG_WHITESPACE_PATTERN = re.compile(r'("[^"]*"|\'[^\']*\')|\s+')
+SCRIPT_TYPE_PATTERN = re.compile(r'\btype\s*=\s*["\']?([^"\'\s>]+)', re.IGNORECASE)
+JS_TYPES = {'text/javascript', 'application/javascript', 'module'}
+
+# After these characters a "/" starts a regex literal rather than a division.
+JS_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+def _skip_quoted(source, start):
+    """Return the index just past the string literal opening at source[start]."""
+    quote = source[start]
+    i = start + 1
+    while i < len(source):
+        if source[i] == '\\':
+            i += 2
+            continue
+        if source[i] == quote:
+            return i + 1
+        i += 1
+    return len(source)
+
+
+def _skip_regex(source, start):
+    """Return the index just past the regex literal (and flags) at source[start]."""
+    i = start + 1
+    in_class = False
+    while i < len(source):
+        c = source[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '\n':
+            return i
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            i += 1
+            while i < len(source) and source[i].isalpha():
+                i += 1
+            return i
+        i += 1
+    return len(source)
+
+
+def _compact_css(css):
+    # Spaces around these are never significant ("+" and "-" are, inside calc()).
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}')
+
+
+def minify_css(source):
+    """Strip comments and collapse whitespace in CSS, leaving strings intact.
+
+    The punctuation rewrites run on the code between string literals only, so
+    values like content: " : " or url("a, b.png") come through unchanged.
+    """
+    out = []
+    code = []
+    i = 0
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c in '"\'':
+            end = _skip_quoted(source, i)
+            out.append(_compact_css(''.join(code)))
+            out.append(source[i:end])
+            code = []
+            i = end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+        elif c.isspace():
+            while i < n and source[i].isspace():
+                i += 1
+            code.append(' ')
+        else:
+            code.append(c)
+            i += 1
+    out.append(_compact_css(''.join(code)))
+    return ''.join(out).strip()
+
+
+def minify_js(source):
+    """Strip comments, indentation and blank lines from JS, keeping line breaks."""
+    out = []
+    i = 0
+    n = len(source)
+    last_significant = ''
+    while i < n:
+        c = source[i]
+        if c in '"\'`':
+            end = _skip_quoted(source, i)
+            out.append(source[i:end])
+            last_significant = c
+            i = end
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end < 0 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            out.append(' ')
+        elif c == '/' and (not last_significant or last_significant in JS_REGEX_PRECEDERS):
+            end = _skip_regex(source, i)
+            out.append(source[i:end])
+            last_significant = '/'
+            i = end
+        elif c.isspace():
+            start = i
+            while i < n and source[i].isspace():
+                i += 1
+            out.append('\n' if '\n' in source[start:i] else ' ')
+        else:
+            out.append(c)
+            last_significant = c
+            i += 1
+
+    lines = (line.strip() for line in ''.join(out).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _minify_tag(tag):
+    """Collapse whitespace between attributes without touching attribute values."""
+    tag = TAG_WHITESPACE_PATTERN.sub(lambda m: m.group(1) or ' ', tag)
+    return tag.replace(' >', '>').replace(' />', '/>')
+
+
+def _minify_raw(match):
+    tag_name = match.group('raw_tag').lower()
+    open_tag = match.group('raw_open')
+    body = match.group('raw_body')
+
+    if tag_name == 'style':
+        body = minify_css(body)
+    elif tag_name == 'script':
+        script_type = SCRIPT_TYPE_PATTERN.search(open_tag)
+        if script_type is None or script_type.group(1).lower() in JS_TYPES:
+            body = minify_js(body)
+    # <pre>, <code> and <textarea> keep their content byte-for-byte.
+    return _minify_tag(open_tag) + body + match.group('raw_close')
+
+
+def minify_html(html):
+    """Return a minified copy of an HTML document."""
+    parts = []
+    for match in HTML_TOKEN_PATTERN.finditer(html):
+        if match.group('comment'):
+            comment = match.group('comment')
+            if comment.startswith('<!--[if') or comment.startswith('<![endif'):
+                parts.append(comment)
+        elif match.group('raw_open'):
+            parts.append(_minify_raw(match))
+        elif match.group('tag'):
+            parts.append(_minify_tag(match.group('tag')))
+        else:
+            parts.append(re.sub(r'\s+', ' ', match.group('text')))
+    return ''.join(parts).strip() + '\n'
+
+
+def minify_tree(source_dir=DOCS_DIR, out_dir=DEFAULT_OUT_DIR, report=print):
+    """Mirror source_dir into out_dir, minifying HTML. Returns (before, after) byte totals."""
+    source_dir = Path(source_dir)
+    out_dir = Path(out_dir)
+    total_before = total_after = 0
+
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        target_dir = out_dir / Path(dirpath).relative_to(source_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        for filename in sorted(filenames):
+            source = Path(dirpath) / filename
+            target = target_dir / filename
+            if source.suffix.lower() != '.html':
+                shutil.copy2(source, target)
+                continue
+
+            with open(source, 'r', encoding='utf-8') as f:
+                html = f.read()
+            minified = minify_html(html)
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(minified)
+
+            before = len(html.encode('utf-8'))
+            after = len(minified.encode('utf-8'))
+            total_before += before
+            total_after += after
+            if report:
+                relative = source.relative_to(source_dir).as_posix()
+                report(f"  {relative:<60} {before:>9,} → {after:>9,} bytes "
+                       f"(-{(before - after) / before * 100 if before else 0:.0f}%)")
+
+    return total_before, total_after
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Minify docs HTML into a publish directory')
+    parser.add_argument('--src', default=str(DOCS_DIR), help='Source directory (default: docs/)')
+    parser.add_argument('--out', default=str(DEFAULT_OUT_DIR), help='Output directory (default: build/docs)')
+    parser.add_argument('--quiet', action='store_true', help='Only print the totals')
+    args = parser.parse_args(argv)
+
+    if Path(args.out).resolve() == Path(args.src).resolve():
+        print("❌ --out must differ from --src; docs/ stays the readable source of truth")
+        return 2
+
+    print(f"🗜️  Minifying {args.src} → {args.out}\n")
+    before, after = minify_tree(args.src, args.out, report=None if args.quiet else print)
+    saved = before - after
+    print(f"\n✅ HTML: {before:,} → {after:,} bytes "
+          f"(saved {saved:,} bytes, {saved / before * 100 if before else 0:.1f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
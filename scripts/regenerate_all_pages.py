@@ -1,136 +1,50 @@
 """
 Regenerate all onboarding pages with Salesforce-style template
+
+The onboarding layout lives in scripts/data/onboarding-cohorts.json: named
+tracks (weeks and days) and cohorts that assign a track to each developer
+prefix. Every cohort is built in one run into its own directory; the template
+is parsed once, and each developer's sidebar section is rendered once and
+shared by every cohort that uses the same developer/track pair.
+
+Existing day pages keep their own body and status banner; only the head, the
+Daily Tasks sidebar and the breadcrumb are regenerated. Pages that do not exist
+yet get the template's body with the day's title, subtitle, breadcrumb and
+navigation filled in, and no status banner.
+
+Usage:
+    python scripts/regenerate_all_pages.py
+    python scripts/regenerate_all_pages.py --cohort core --config path/to/cohorts.json
 """
+import argparse
+import json
 import os
 import re
 from pathlib import Path
 
-# Define the structure
-DEVELOPERS = [
-    {
-        'name': 'Developer 1: Backend & Database',
-        'prefix': 'dev1',
-        'weeks': [
-            {'title': 'Week 1: Backend Setup', 'days': [
-                (1, 'Workstation Setup'),
-                (2, 'Database Tables (STG1)'),
-                (3, 'Database Tables (STG2)'),
-                (4, 'Database Tables (EAV)'),
-                (5, 'First API Endpoint')
-            ]},
-            {'title': 'Week 2: Schema Analysis APIs', 'days': [
-                (6, 'Schema Analysis API (Part 1)'),
-                (7, 'Schema Analysis API (Part 2)'),
-                (8, 'Metadata Extraction'),
-                (9, 'Relationship Detection'),
-                (10, 'Week 2 Testing & PR')
-            ]},
-            {'title': 'Week 3: Field Mapping & AI', 'days': [
-                (11, 'Field Mapping API (Part 1)'),
-                (12, 'Field Mapping API (Part 2)'),
-                (13, 'AI Integration Setup'),
-                (14, 'Confidence Scoring'),
-                (15, 'Week 3 Testing & PR')
-            ]},
-            {'title': 'Week 4: Transformation & Queue', 'days': [
-                (16, 'Data Transformation Engine'),
-                (17, 'Queue System Setup'),
-                (18, 'Job Management'),
-                (19, 'Error Handling'),
-                (20, 'Week 4 Testing & PR')
-            ]},
-            {'title': 'Week 5: Execution & Testing', 'days': [
-                (21, 'Migration Execution'),
-                (22, 'Validation & Rollback'),
-                (23, 'Performance Optimization'),
-                (24, 'Integration Testing'),
-                (25, 'Final Review & Handoff')
-            ]}
-        ]
-    },
-    {
-        'name': 'Developer 2: Frontend & React',
-        'prefix': 'dev2',
-        'weeks': [
-            {'title': 'Week 1: React Setup', 'days': [
-                (1, 'React & Vite Setup'),
-                (2, 'Project Structure'),
-                (3, 'Routing & Navigation'),
-                (4, 'State Management'),
-                (5, 'UI Component Library')
-            ]},
-            {'title': 'Week 2: Core Pages', 'days': [
-                (6, 'Dashboard Page'),
-                (7, 'Project Creation'),
-                (8, 'Connection Setup UI'),
-                (9, 'Schema Analysis UI'),
-                (10, 'Week 2 Testing & PR')
-            ]},
-            {'title': 'Week 3: Mapping Interface', 'days': [
-                (11, 'Field Mapping UI (Part 1)'),
-                (12, 'Field Mapping UI (Part 2)'),
-                (13, 'Drag & Drop Interface'),
-                (14, 'AI Suggestions UI'),
-                (15, 'Week 3 Testing & PR')
-            ]},
-            {'title': 'Week 4: Transformation UI', 'days': [
-                (16, 'Transformation Rules UI'),
-                (17, 'Preview & Validation'),
-                (18, 'Queue Status Dashboard'),
-                (19, 'Error Display & Retry'),
-                (20, 'Week 4 Testing & PR')
-            ]},
-            {'title': 'Week 5: Testing & Polish', 'days': [
-                (21, 'Execution Progress UI'),
-                (22, 'Results & Reports'),
-                (23, 'Responsive Design'),
-                (24, 'E2E Testing'),
-                (25, 'Final Polish & Handoff')
-            ]}
-        ]
-    },
-    {
-        'name': 'Developer 3: DevOps & QA',
-        'prefix': 'dev3',
-        'weeks': [
-            {'title': 'Week 1: DevOps Setup', 'days': [
-                (1, 'AWS & Infrastructure'),
-                (2, 'Docker Setup'),
-                (3, 'CI/CD Pipeline'),
-                (4, 'Monitoring Setup'),
-                (5, 'Security Configuration')
-            ]},
-            {'title': 'Week 2: Testing Framework', 'days': [
-                (6, 'Unit Testing Setup'),
-                (7, 'Backend Tests'),
-                (8, 'Integration Tests'),
-                (9, 'API Tests'),
-                (10, 'Week 2 Testing & PR')
-            ]},
-            {'title': 'Week 3: QA & Testing', 'days': [
-                (11, 'Frontend Testing'),
-                (12, 'E2E Test Setup'),
-                (13, 'Test Automation'),
-                (14, 'Load Testing'),
-                (15, 'Week 3 Testing & PR')
-            ]},
-            {'title': 'Week 4: Performance', 'days': [
-                (16, 'Performance Monitoring'),
-                (17, 'Database Optimization'),
-                (18, 'Caching Strategy'),
-                (19, 'Load Balancing'),
-                (20, 'Week 4 Testing & PR')
-            ]},
-            {'title': 'Week 5: Production', 'days': [
-                (21, 'Production Deployment'),
-                (22, 'Backup & Recovery'),
-                (23, 'Documentation'),
-                (24, 'Final QA'),
-                (25, 'Production Handoff')
-            ]}
-        ]
-    }
-]
+import docs_pages
+import docs_profile
+import docs_writer
+
+REPO_ROOT = Path(__file__).parent.parent
+ONBOARDING_DIR = REPO_ROOT / 'docs' / 'Onboarding'
+TEMPLATE_PATH = ONBOARDING_DIR / 'dev1-day07.html'
+CONFIG_PATH = Path(__file__).parent / 'data' / 'onboarding-cohorts.json'
+
+PREFIX_PATTERN = re.compile(r'dev\d+')
+# From the first developer's Daily Tasks section (whatever the cohort calls its developers)
+# to the end of the nav. This and STATUS_BANNER_PATTERN are matched with
+# docs_pages.find_indented, which adds the indentation before them.
+SIDEBAR_PATTERN = re.compile(r'<!-- [^<>\n]*: Daily Tasks Section -->.*?</nav>', re.DOTALL)
+GUIDES_PATTERN = re.compile(
+    r'(<!-- Developer Guides Section -->.*?<div class="nav-section-content">\n)(.*?)(\n\s*</div>)', re.DOTALL)
+# Links to shared onboarding pages; day pages are the only cohort-local ones.
+SHARED_LINK_PATTERN = re.compile(r'href="(?!dev\d+-day\d+\.html)([^"/:#]+\.html)"')
+STATUS_BANNER_PATTERN = re.compile(r'<div class="status-banner".*?</div>', re.DOTALL)
+TITLE_PATTERN = re.compile(r'<title>.*?</title>', re.DOTALL)
+BREADCRUMB_PATTERN = re.compile(r'(<div class="breadcrumb">)(\s*)(.*?)(\s*</div>)', re.DOTALL)
+PAGE_TITLE_PATTERN = re.compile(r'<h1 class="page-title">.*?</h1>', re.DOTALL)
+PAGE_SUBTITLE_PATTERN = re.compile(r'<p class="page-subtitle">.*?</p>', re.DOTALL)
 
 def generate_sidebar_weeks_html(dev_prefix, weeks):
     """Generate the sidebar weeks HTML for a developer"""
@@ -162,26 +76,73 @@ def generate_sidebar_weeks_html(dev_prefix, weeks):
     
     return '\n'.join(html_parts)
 
-def generate_all_developers_sidebar():
-    """Generate complete sidebar with ALL THREE developers' tasks"""
-    all_devs_html = []
-    
-    for dev in DEVELOPERS:
-        dev_name = dev['name']
-        dev_prefix = dev['prefix']
-        weeks = dev['weeks']
-        
-        dev_short = {
-            'dev1': 'Developer 1',
-            'dev2': 'Developer 2',
-            'dev3': 'Developer 3'
-        }[dev_prefix]
-        
-        # Generate weeks HTML for this developer
-        weeks_html = generate_sidebar_weeks_html(dev_prefix, weeks)
-        
-        # Create section for this developer
-        dev_section = f'''                <!-- {dev_short}: Daily Tasks Section -->
+def load_cohorts(config_path=CONFIG_PATH):
+    """Load the cohort config. Returns cohort dicts whose developers carry their track's weeks."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    # Each track's weeks are built once and shared by every developer on it
+    tracks = {
+        track_id: [{'title': week['title'], 'days': [tuple(day) for day in week['days']]}
+                   for week in track['weeks']]
+        for track_id, track in config['tracks'].items()
+    }
+    _section_cache.clear()
+
+    cohorts = []
+    seen_dirs = {}
+    for entry in config['cohorts']:
+        cohort_id = entry['id']
+        output_dir = REPO_ROOT / entry['dir']
+        if output_dir.resolve() in seen_dirs:
+            raise ValueError(f"Cohorts '{seen_dirs[output_dir.resolve()]}' and '{cohort_id}' share {entry['dir']}")
+        seen_dirs[output_dir.resolve()] = cohort_id
+
+        developers = []
+        for dev in entry['developers']:
+            prefix = dev['prefix']
+            if not PREFIX_PATTERN.fullmatch(prefix):
+                raise ValueError(f"Cohort '{cohort_id}': prefix '{prefix}' must look like dev<N>")
+            if dev['track'] not in tracks:
+                raise ValueError(f"Cohort '{cohort_id}': unknown track '{dev['track']}'")
+            if any(other['prefix'] == prefix for other in developers):
+                raise ValueError(f"Cohort '{cohort_id}': prefix '{prefix}' is used twice")
+            short = dev.get('short', f"Developer {int(prefix[3:])}")
+            developers.append({
+                'name': f"{short}: {config['tracks'][dev['track']]['title']}",
+                'short': short,
+                'prefix': prefix,
+                'track': dev['track'],
+                'weeks': tracks[dev['track']],
+            })
+
+        shared = os.path.relpath(ONBOARDING_DIR, output_dir)
+        cohorts.append({
+            'id': cohort_id,
+            'name': entry.get('name', cohort_id),
+            'dir': output_dir,
+            # Prefix for links to the shared onboarding pages ('' when the cohort lives beside them)
+            'shared': '' if shared == '.' else shared.replace(os.sep, '/') + '/',
+            'developers': developers,
+        })
+    return cohorts
+
+def parse_template(template):
+    """Split the day page template around its Daily Tasks sidebar, once per run"""
+    span = docs_pages.find_indented(SIDEBAR_PATTERN, template)
+    if span is None:
+        return {'head': template, 'tail': None}
+    return {'head': template[:span[0]], 'tail': template[span[1]:]}
+
+_section_cache = {}
+
+def generate_developer_section(dev):
+    """Sidebar Daily Tasks section for one developer, shared by every cohort that uses it"""
+    key = (dev['short'], dev['prefix'], dev['track'])
+    if key not in _section_cache:
+        dev_short = dev['short']
+        weeks_html = generate_sidebar_weeks_html(dev['prefix'], dev['weeks'])
+        _section_cache[key] = f'''                <!-- {dev_short}: Daily Tasks Section -->
                 <div class="nav-section">
                     <button class="nav-section-header">
                         <svg class="nav-section-icon" fill="currentColor" viewBox="0 0 20 20">
@@ -194,133 +155,190 @@ def generate_all_developers_sidebar():
                     </div>
                 </div>
                 '''
-        all_devs_html.append(dev_section)
-    
-    return '\n'.join(all_devs_html)
+    return _section_cache[key]
+
+def generate_cohort_sidebar(cohort):
+    """Generate complete sidebar with every developer's tasks in the cohort"""
+    return '\n'.join(generate_developer_section(dev) for dev in cohort['developers'])
+
+def build_cohort_base(parsed, cohort):
+    """Fill the parsed template with the cohort's Developer Guides and Daily Tasks sidebar"""
+    guides_html = '\n'.join(f'                        <a href="onboarding-{dev["prefix"]}.html" class="nav-link">{dev["name"]}</a>'
+                            for dev in cohort['developers'])
+    head = GUIDES_PATTERN.sub(lambda m: m.group(1) + guides_html + m.group(3), parsed['head'], count=1)
+    tail = parsed['tail']
+    if cohort['shared']:
+        relink = lambda text: SHARED_LINK_PATTERN.sub(lambda m: f'href="{cohort["shared"]}{m.group(1)}"', text)
+        head = relink(head)
+        tail = tail and relink(tail)
+    if tail is None:
+        return head
+    return head + generate_cohort_sidebar(cohort) + '\n            </nav>' + tail
 
-def main():
-    # Read template
-    template_path = Path('docs/Onboarding/dev1-day07.html')
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
+def iter_day_pages(cohorts):
+    """Yield (cohort, dev, week_num, week, day_num, day_title) for every onboarding day page"""
+    for cohort in cohorts:
+        for dev in cohort['developers']:
+            for week_num, week in enumerate(dev['weeks'], 1):
+                for day_num, day_title in week['days']:
+                    yield cohort, dev, week_num, week, day_num, day_title
+
+def day_page_path(cohort, dev, day_num):
+    return cohort['dir'] / f"{dev['prefix']}-day{day_num:02d}.html"
+
+def render_day_page(base, cohort, dev, week_num, week, day_num, day_title, content=None):
+    """Render a single day page from the cohort's base page (see build_cohort_base)
+
+    `content` is the page as it is now. Its own body (everything after the
+    sidebar) and status banner are kept; only pages that do not exist yet get
+    the template's body.
+    """
+    dev_name = dev['name']
+    dev_prefix = dev['prefix']
+    dev_short = dev['short']
+    shared = cohort['shared']
     
-    total_pages = sum(len(week['days']) for dev in DEVELOPERS for week in dev['weeks'])
-    processed = 0
+    # Create new page from the cohort's base page
+    page = base
+    own = content and docs_pages.find_indented(SIDEBAR_PATTERN, content)
+    sidebar = own and docs_pages.find_indented(SIDEBAR_PATTERN, page)
+    if sidebar:
+        own_banner = docs_pages.find_indented(STATUS_BANNER_PATTERN, content, 0, own[0], newline=True)
+        own_banner = content[own_banner[0]:own_banner[1]] if own_banner else ''
+        head = docs_pages.sub_indented(STATUS_BANNER_PATTERN, lambda m: own_banner, page[:sidebar[1]],
+                                       count=1, newline=True)
+        page = head + content[own[1]:]
+    else:
+        # A new page starts without a status; the template's banner is its own
+        page = docs_pages.sub_indented(STATUS_BANNER_PATTERN, '', page, count=1, newline=True)
     
-    print(f"Regenerating {total_pages} pages with ALL THREE developers in sidebar...")
-    print()
+    # Replace title
+    page = TITLE_PATTERN.sub(
+        lambda m: f'<title>Day {day_num}: {day_title} - RevNova Developer Onboarding</title>', page, count=1)
     
-    # Generate complete sidebar HTML with ALL THREE developers
-    complete_sidebar_html = generate_all_developers_sidebar()
+    # Replace breadcrumb (kept pages too: it is navigation, like the sidebar)
+    page = BREADCRUMB_PATTERN.sub(
+        lambda m: (f'{m.group(1)}{m.group(2)}<a href="{shared}onboarding-home.html">Home</a> › {m.group(2)}'
+                   f'<a href="{shared}onboarding-{dev_prefix}.html">{dev_short}</a> › Week {week_num} › Day {day_num}'
+                   f'{m.group(4)}'),
+        page, count=1)
     
-    for dev in DEVELOPERS:
-        dev_name = dev['name']
-        dev_prefix = dev['prefix']
-        weeks = dev['weeks']
+    if not sidebar:
+        # Replace page title
+        page = PAGE_TITLE_PATTERN.sub(
+            lambda m: f'<h1 class="page-title">Day {day_num}: {day_title}</h1>', page, count=1)
         
-        print(f"Processing {dev_name}...")
+        # Replace subtitle
+        page = PAGE_SUBTITLE_PATTERN.sub(
+            lambda m: f'<p class="page-subtitle">{dev_name} | Duration: ~6-8 hours</p>', page, count=1)
+    
+    # Mark current page as active
+    day_file = f"{dev_prefix}-day{day_num:02d}.html"
+    page = page.replace(
+        f'<a href="{day_file}" class="nav-subsection-link">',
+        f'<a href="{day_file}" class="nav-subsection-link active">'
+    )
+    
+    # Expand current developer's section
+    page = page.replace(
+        f'<button class="nav-section-header">\n                        <svg class="nav-section-icon" fill="currentColor" viewBox="0 0 20 20">\n                            <path d="M6 6L14 10L6 14V6Z"/>\n                        </svg>\n                        {dev_short}: Daily Tasks',
+        f'<button class="nav-section-header expanded">\n                        <svg class="nav-section-icon" fill="currentColor" viewBox="0 0 20 20">\n                            <path d="M6 6L14 10L6 14V6Z"/>\n                        </svg>\n                        {dev_short}: Daily Tasks'
+    )
+    page = re.sub(
+        f'({re.escape(dev_short)}: Daily Tasks.*?</button>\\s+<div class="nav-section-content")>',
+        r'\1 expanded>',
+        page,
+        flags=re.DOTALL
+    )
+    
+    # Auto-expand current week
+    current_week_title = week['title']
+    page = page.replace(
+        f'<button class="nav-subsection-header">\n                                <svg class="nav-subsection-icon" fill="currentColor" viewBox="0 0 20 20">\n                                    <path d="M6 6L14 10L6 14V6Z"/>\n                                </svg>\n                                {current_week_title}',
+        f'<button class="nav-subsection-header expanded">\n                                <svg class="nav-subsection-icon" fill="currentColor" viewBox="0 0 20 20">\n                                    <path d="M6 6L14 10L6 14V6Z"/>\n                                </svg>\n                                {current_week_title}'
+    )
+    page = re.sub(
+        f'({re.escape(current_week_title)}.*?</button>\\s+<div class="nav-subsection-content")>',
+        r'\1 expanded>',
+        page,
+        flags=re.DOTALL
+    )
+    
+    if sidebar:
+        return page
+    
+    # Update the template body's navigation buttons
+    last_day = dev['weeks'][-1]['days'][-1][0]
+    prev_day = day_num - 1
+    next_day = day_num + 1
+    prev_file = f"{dev_prefix}-day{prev_day:02d}.html" if prev_day > 0 else f"{shared}onboarding-{dev_prefix}.html"
+    next_file = f"{dev_prefix}-day{next_day:02d}.html" if next_day <= last_day else f"{shared}onboarding-home.html"
+    prev_text = f"Previous: Day {prev_day}" if prev_day > 0 else "Back to Overview"
+    next_text = f"Next: Day {next_day}" if next_day <= last_day else "Back to Home"
+    
+    page = re.sub(
+        r'<a href="dev1-day\d+\.html" class="btn btn-secondary">[^<]+</a>',
+        f'<a href="{prev_file}" class="btn btn-secondary">{prev_text}</a>',
+        page
+    )
+    page = re.sub(
+        r'<a href="dev1-day\d+\.html" class="btn">[^<]+</a>',
+        f'<a href="{next_file}" class="btn">{next_text}</a>',
+        page
+    )
+    
+    return page
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Regenerate onboarding day pages for every cohort')
+    parser.add_argument('--config', default=str(CONFIG_PATH), help='Cohort config (default: scripts/data/onboarding-cohorts.json)')
+    parser.add_argument('--cohort', action='append', help='Only build this cohort id (repeatable)')
+    args = parser.parse_args(argv)
+    
+    try:
+        cohorts = load_cohorts(args.config)
+    except (KeyError, ValueError) as e:
+        print(f"❌ Invalid cohort config {args.config}: {e}")
+        return 1
+    if args.cohort:
+        unknown = set(args.cohort) - {cohort['id'] for cohort in cohorts}
+        if unknown:
+            print(f"❌ Unknown cohort(s): {', '.join(sorted(unknown))}")
+            return 1
+        cohorts = [cohort for cohort in cohorts if cohort['id'] in args.cohort]
+    
+    # Read and parse the template once for every cohort
+    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
+        parsed = parse_template(f.read())
+    
+    total_pages = sum(len(week['days']) for cohort in cohorts for dev in cohort['developers'] for week in dev['weeks'])
+    processed = 0
+    
+    print(f"Regenerating {total_pages} pages for {len(cohorts)} cohort(s)...")
+    
+    # Every page of every cohort is written, or none is
+    with docs_writer.transaction() as tx:
+        current_cohort = current_dev = None
+        for cohort, dev, week_num, week, day_num, day_title in iter_day_pages(cohorts):
+            if cohort is not current_cohort:
+                # Complete sidebar HTML with every developer in the cohort
+                base = build_cohort_base(parsed, cohort)
+                print()
+                print(f"Cohort {cohort['name']} → {cohort['dir'].relative_to(REPO_ROOT).as_posix()}")
+                current_cohort = cohort
+            if dev is not current_dev:
+                print(f"Processing {dev['name']}...")
+                current_dev = dev
         
-        # Process each day
-        for week_num, week in enumerate(weeks, 1):
-            for day_num, day_title in week['days']:
-                # Create new page from template
-                page = template
-                
-                # Replace title
-                page = page.replace(
-                    '<title>Day 7: Schema Analysis API (Part 2) - RevNova Developer Onboarding</title>',
-                    f'<title>Day {day_num}: {day_title} - RevNova Developer Onboarding</title>'
-                )
-                
-                # Replace breadcrumb
-                dev_short = {
-                    'dev1': 'Developer 1',
-                    'dev2': 'Developer 2',
-                    'dev3': 'Developer 3'
-                }[dev_prefix]
-                page = page.replace(
-                    '<a href="onboarding-dev1.html">Developer 1</a> › \n                Week 2 › Day 7',
-                    f'<a href="onboarding-{dev_prefix}.html">{dev_short}</a> › Week {week_num} › Day {day_num}'
-                )
-                
-                # Replace page title
-                page = page.replace(
-                    '<h1 class="page-title">Day 7: Schema Analysis API (Part 2)</h1>',
-                    f'<h1 class="page-title">Day {day_num}: {day_title}</h1>'
-                )
-                
-                # Replace subtitle
-                page = page.replace(
-                    '<p class="page-subtitle">Developer 1 — Backend & Database | Duration: ~6-8 hours</p>',
-                    f'<p class="page-subtitle">{dev_name} | Duration: ~6-8 hours</p>'
-                )
-                
-                # Replace ALL developer sections with complete sidebar
-                # Find and replace from first Developer section to end of nav
-                pattern = r'<!-- Developer 1: Daily Tasks Section -->.*?</nav>'
-                replacement = complete_sidebar_html + '\n            </nav>'
-                page = re.sub(pattern, replacement, page, flags=re.DOTALL)
-                
-                # Mark current page as active
-                day_file = f"{dev_prefix}-day{day_num:02d}.html"
-                page = page.replace(
-                    f'<a href="{day_file}" class="nav-subsection-link">',
-                    f'<a href="{day_file}" class="nav-subsection-link active">'
-                )
-                
-                # Expand current developer's section
-                page = page.replace(
-                    f'<button class="nav-section-header">\n                        <svg class="nav-section-icon" fill="currentColor" viewBox="0 0 20 20">\n                            <path d="M6 6L14 10L6 14V6Z"/>\n                        </svg>\n                        {dev_short}: Daily Tasks',
-                    f'<button class="nav-section-header expanded">\n                        <svg class="nav-section-icon" fill="currentColor" viewBox="0 0 20 20">\n                            <path d="M6 6L14 10L6 14V6Z"/>\n                        </svg>\n                        {dev_short}: Daily Tasks'
-                )
-                page = re.sub(
-                    f'({re.escape(dev_short)}: Daily Tasks.*?</button>\\s+<div class="nav-section-content")>',
-                    r'\1 expanded>',
-                    page,
-                    flags=re.DOTALL
-                )
-                
-                # Auto-expand current week
-                current_week_title = week['title']
-                page = page.replace(
-                    f'<button class="nav-subsection-header">\n                                <svg class="nav-subsection-icon" fill="currentColor" viewBox="0 0 20 20">\n                                    <path d="M6 6L14 10L6 14V6Z"/>\n                                </svg>\n                                {current_week_title}',
-                    f'<button class="nav-subsection-header expanded">\n                                <svg class="nav-subsection-icon" fill="currentColor" viewBox="0 0 20 20">\n                                    <path d="M6 6L14 10L6 14V6Z"/>\n                                </svg>\n                                {current_week_title}'
-                )
-                page = re.sub(
-                    f'({re.escape(current_week_title)}.*?</button>\\s+<div class="nav-subsection-content")>',
-                    r'\1 expanded>',
-                    page,
-                    flags=re.DOTALL
-                )
-                
-                # Update navigation buttons
-                prev_day = day_num - 1
-                next_day = day_num + 1
-                prev_file = f"{dev_prefix}-day{prev_day:02d}.html" if prev_day > 0 else f"onboarding-{dev_prefix}.html"
-                next_file = f"{dev_prefix}-day{next_day:02d}.html" if next_day <= 25 else "onboarding-home.html"
-                prev_text = f"Previous: Day {prev_day}" if prev_day > 0 else "Back to Overview"
-                next_text = f"Next: Day {next_day}" if next_day <= 25 else "Back to Home"
-                
-                page = re.sub(
-                    r'<a href="dev1-day\d+\.html" class="btn btn-secondary">[^<]+</a>',
-                    f'<a href="{prev_file}" class="btn btn-secondary">{prev_text}</a>',
-                    page
-                )
-                page = re.sub(
-                    r'<a href="dev1-day\d+\.html" class="btn">[^<]+</a>',
-                    f'<a href="{next_file}" class="btn">{next_text}</a>',
-                    page
-                )
-                
-                # Write file
-                output_path = Path(f'docs/Onboarding/{day_file}')
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(page)
-                
-                processed += 1
-                print(f"  ✓ Generated {day_file} ({processed}/{total_pages})")
+            # Stage the file; cohort directories are created on commit
+            output_path = day_page_path(cohort, dev, day_num)
+            page = render_day_page(base, cohort, dev, week_num, week, day_num, day_title, tx.read(output_path))
+            tx.write(output_path, page)
         
-        print()
+            processed += 1
+            print(f"  ✓ Generated {output_path.name} ({processed}/{total_pages})")
+    
+    print()
     
     print("=" * 50)
     print(f"Complete! Regenerated {processed} pages")
@@ -328,13 +346,16 @@ def main():
     print()
     print("All pages now have:")
     print("  - Salesforce-style look and feel")
-    print("  - ALL THREE developers' tasks in sidebar")
+    print("  - Every developer's tasks in their cohort's sidebar")
     print("  - Collapsible Getting Started section")
     print("  - Collapsible Developer Guides section")
     print("  - Collapsible week subsections for all devs")
-    print("  - IDENTICAL sidebar HTML (prevents refresh)")
+    print("  - IDENTICAL sidebar HTML within a cohort (prevents refresh)")
     print("  - Auto-expand current developer and week")
     print("  - Highlight current page")
+    return 0
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        status = main()
+    raise SystemExit(status)
@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+Analyze object relationships for migration execution planning.
+
+RelationshipService records reference fields one at a time into
+object_relationships. This script loads such an export into an
+adjacency-indexed graph (object -> objects it references, as integer arrays)
+and works out what the execute phase needs from it:
+
+    load order  objects in dependency order, parents before the children that
+                reference them, grouped into waves whose objects do not depend
+                on each other and can load in parallel
+    cycles      strongly connected components (Tarjan, iterative): objects that
+                reference each other, directly or through others. Their members
+                load together; required references (master-detail, cascade
+                delete or non-nillable) are honoured inside the component and
+                the remaining lookups are deferred to an update pass
+    fan-in/out  distinct objects referencing / referenced by each object, and
+                the reference fields behind them
+
+The result is rendered to docs/RevNovaRequirements/requirements-relationships.html
+(through docs_writer, so --dry-run and --diff work) and optionally written as
+JSON for the backend. The page takes its header, sidebar and scripts from
+requirements-mapping.html next to it, so it sits in the requirements docs like
+any other page; without that page it is written standalone. The page holds no
+timings, so the same export always renders the same bytes. Every step is
+linear in objects + references; an org with thousands of objects is analyzed
+in milliseconds (--bench).
+
+The checked-in page is rendered from scripts/data/relationships-sample.json,
+the CPQ objects the migration reads; render a project's own export with
+--html to keep the sample page intact.
+
+Exports are JSON or CSV:
+    - object_relationships rows (source_object, source_field, target_object,
+      relationship_type, cascade_delete), camelCase as the service returns them,
+      or the GET /projects/:id/relationships response
+    - describeSObject results (a single object, a list, or {"objects": [...]}):
+      reference fields with referenceTo become edges
+
+Usage:
+    python scripts/relationship_graph.py scripts/data/relationships-sample.json
+    python scripts/relationship_graph.py relationships.json --html build/relationships.html
+    python scripts/relationship_graph.py describe.json -o build/load-plan.json --no-docs
+    python scripts/relationship_graph.py --bench 1000,5000,20000
+"""
+
+import argparse
+import csv
+import heapq
+import html
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import docs_profile
+import docs_writer
+
+DEFAULT_OUTPUT = Path(__file__).parent.parent / 'docs' / 'RevNovaRequirements' / 'requirements-relationships.html'
+# Sibling page whose header, sidebar and scripts the rendered page reuses
+CHROME_PAGE = 'requirements-mapping.html'
+PAGE_TITLE = 'Object Relationships &amp; Load Order'
+# Objects listed in the hub tables of the rendered page
+TOP_HUBS = 25
+
+EDGE_KEYS = {
+    'source': ('source_object', 'sourceObject', 'object', 'object_name'),
+    'field': ('source_field', 'sourceField', 'field', 'field_name', 'name'),
+    'target': ('target_object', 'targetObject', 'referenceTo', 'reference_to'),
+    'type': ('relationship_type', 'relationshipType', 'type'),
+}
+
+
+# ---------------------------------------------------------------------------
+# Exports
+# ---------------------------------------------------------------------------
+
+def _pick(row, key):
+    for name in EDGE_KEYS[key]:
+        value = row.get(name)
+        if value not in (None, ''):
+            return value
+    return ''
+
+
+def _truthy(value):
+    return value is True or str(value).strip().lower() in ('true', 't', '1', 'yes')
+
+
+def _edge_rows(row):
+    """Edges of one object_relationships row; a target may be a referenceTo list."""
+    targets = _pick(row, 'target')
+    if isinstance(targets, str):
+        targets = [t for t in re.split(r'[;,]', targets) if t.strip()]
+    required = (re.sub(r'[^a-z]', '', str(_pick(row, 'type')).lower()) == 'masterdetail'
+                or _truthy(row.get('cascade_delete', row.get('cascadeDelete')))
+                or str(row.get('nillable', '')).lower() == 'false')
+    return [{'source': str(_pick(row, 'source')), 'field': str(_pick(row, 'field')), 'target': str(t).strip(),
+             'type': str(_pick(row, 'type') or 'lookup'), 'required': required} for t in targets]
+
+
+def _describe_edges(describe):
+    """Reference fields of a describeSObject result as edges."""
+    edges = []
+    for field in describe.get('fields', []):
+        if field.get('type') != 'reference' or not field.get('referenceTo'):
+            continue
+        edges.extend(_edge_rows({
+            'source_object': describe.get('name', ''), 'source_field': field.get('name', ''),
+            'target_object': list(field['referenceTo']),
+            'relationship_type': field.get('relationshipType') or ('masterdetail' if field.get('cascadeDelete')
+                                                                   else 'lookup'),
+            'cascade_delete': field.get('cascadeDelete') or field.get('deleteConstraint') == 'Cascade',
+            'nillable': field.get('nillable', ''),
+        }))
+    return edges
+
+
+def load_export(path):
+    """Read a relationships or describe export into (objects, edges).
+
+    objects lists every object named in the export, including those without
+    reference fields; edges are {'source', 'field', 'target', 'type', 'required'}.
+    """
+    path = Path(path)
+    objects = []
+    if path.suffix.lower() == '.csv':
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+        edges = [edge for row in rows for edge in _edge_rows(row)]
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and 'fields' in data:
+            data = [data]
+        elif isinstance(data, dict):
+            data = data.get('relationships') or data.get('objects') or data.get('sobjects') or []
+        edges = []
+        for row in data:
+            if 'fields' in row:
+                objects.append(row.get('name', ''))
+                edges.extend(_describe_edges(row))
+            else:
+                edges.extend(_edge_rows(row))
+    edges = [edge for edge in edges if edge['source'] and edge['target']]
+    return [name for name in objects if name], edges
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+class RelationshipGraph:
+    """Objects as integer ids with their distinct references in CSR form.
+
+    Edges point from the referencing (child) object to the referenced
+    (parent) object, so a parent must load before everything that can reach it.
+    """
+
+    def __init__(self, edges, objects=()):
+        self.names = sorted({*objects, *(e['source'] for e in edges), *(e['target'] for e in edges)})
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.edges = edges
+        count = len(self.names)
+        pairs = sorted({(self.ids[e['source']], self.ids[e['target']]) for e in edges})
+        required = {(self.ids[e['source']], self.ids[e['target']]) for e in edges if e['required']}
+        # out_start[v]:out_start[v + 1] slices out_targets to v's distinct references
+        self.out_start = [0] * (count + 1)
+        for source, _ in pairs:
+            self.out_start[source + 1] += 1
+        for v in range(count):
+            self.out_start[v + 1] += self.out_start[v]
+        self.out_targets = [target for _, target in pairs]
+        self.out_required = [pair in required for pair in pairs]
+        self.fan_in = [0] * count
+        for source, target in pairs:
+            if source != target:
+                self.fan_in[target] += 1
+        self.fan_out = [len(self.references(v)) - self._self_loop(v) for v in range(count)]
+        self.fields_in = [0] * count
+        self.fields_out = [0] * count
+        for e in edges:
+            self.fields_out[self.ids[e['source']]] += 1
+            self.fields_in[self.ids[e['target']]] += 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def references(self, v):
+        return self.out_targets[self.out_start[v]:self.out_start[v + 1]]
+
+    def _self_loop(self, v):
+        return v in self.references(v)
+
+    def components(self):
+        """Strongly connected components, each a list of ids, dependencies first.
+
+        Iterative Tarjan: a component is emitted once everything it references
+        has been, which for child -> parent edges is already a load order.
+        """
+        count = len(self.names)
+        start, targets = self.out_start, self.out_targets
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack, components = [], []
+        counter = 0
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, start[root])]
+            while work:
+                v, i = work[-1]
+                if i < start[v + 1]:
+                    work[-1] = (v, i + 1)
+                    w = targets[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, start[w]))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+        return components
+
+    def _order_component(self, members):
+        """Members of a cycle ordered so required references point backwards (Kahn, by name on ties).
+
+        Returns (order, unresolved), unresolved being True when the required
+        references alone form a cycle and no order satisfies them.
+        """
+        member = set(members)
+        pending = {v: 0 for v in members}
+        children = {v: [] for v in members}
+        for v in members:
+            for i in range(self.out_start[v], self.out_start[v + 1]):
+                w = self.out_targets[i]
+                if self.out_required[i] and w in member and w != v:
+                    pending[v] += 1
+                    children[w].append(v)
+        # Ids follow name order, so a min-heap of ids breaks ties by name
+        ready = [v for v in members if not pending[v]]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            v = heapq.heappop(ready)
+            order.append(v)
+            for child in children[v]:
+                pending[child] -= 1
+                if not pending[child]:
+                    heapq.heappush(ready, child)
+        unresolved = len(order) < len(members)
+        if unresolved:
+            order.extend(sorted(v for v in members if pending[v]))
+        return order, unresolved
+
+    def analyze(self):
+        """Load plan: waves, per-object stats, cycles and the reference fields to defer."""
+        components = self.components()
+        component_of = [0] * len(self.names)
+        for c, members in enumerate(components):
+            for v in members:
+                component_of[v] = c
+
+        # Wave of a component: one past the latest wave it references
+        wave_of = [0] * len(components)
+        for c, members in enumerate(components):
+            wave = 0
+            for v in members:
+                for w in self.references(v):
+                    d = component_of[w]
+                    if d != c and wave_of[d] + 1 > wave:
+                        wave = wave_of[d] + 1
+            wave_of[c] = wave
+
+        load_order, cycles, position = [], [], [0] * len(self.names)
+        cyclic = [len(members) > 1 or self._self_loop(members[0]) for members in components]
+        for c, members in enumerate(components):
+            order, unresolved = self._order_component(members) if cyclic[c] else (members, False)
+            for v in order:
+                position[v] = len(load_order)
+                load_order.append(v)
+            if cyclic[c]:
+                cycles.append({'component': c, 'members': order, 'unresolved': unresolved})
+
+        # References that point at a parent not yet loaded have to be set by a later update
+        ids = self.ids
+        deferred = [e for e in self.edges if position[ids[e['target']]] >= position[ids[e['source']]]]
+
+        waves = [[] for _ in range(max(wave_of, default=-1) + 1)]
+        for v in load_order:
+            waves[wave_of[component_of[v]]].append(v)
+
+        names = self.names
+        deferred_by_object = {}
+        for e in deferred:
+            deferred_by_object.setdefault(e['source'], []).append(e)
+        return {
+            'summary': {
+                'objects': len(names), 'references': len(self.edges), 'object_links': len(self.out_targets),
+                'waves': len(waves), 'cycles': len(cycles),
+                'objects_in_cycles': sum(len(c['members']) for c in cycles),
+                'deferred_fields': len(deferred),
+                'unresolved_cycles': sum(c['unresolved'] for c in cycles),
+            },
+            'load_order': [names[v] for v in load_order],
+            'waves': [[names[v] for v in wave] for wave in waves],
+            'objects': [{'object': names[v], 'position': position[v], 'wave': wave_of[component_of[v]],
+                         'fan_in': self.fan_in[v], 'fan_out': self.fan_out[v],
+                         'fields_in': self.fields_in[v], 'fields_out': self.fields_out[v],
+                         'cycle': component_of[v] if cyclic[component_of[v]] else None}
+                        for v in load_order],
+            'cycles': [{'component': c['component'], 'members': [names[v] for v in c['members']],
+                        'unresolved': c['unresolved'],
+                        'deferred': [f"{e['source']}.{e['field']} -> {e['target']}"
+                                     for v in c['members'] for e in deferred_by_object.get(names[v], [])]}
+                       for c in cycles],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+PAGE_STYLE = """  <style>
+    .relationships section { margin-bottom: 40px; }
+    .relationships table { border-collapse: collapse; width: 100%; max-width: 1200px; }
+    .relationships table, .relationships th, .relationships td { border: 1px solid #ddd; }
+    .relationships th, .relationships td { padding: 6px 8px; text-align: left; font-size: 13px; vertical-align: top; }
+    .relationships th { background: #f7f7f7; }
+    .relationships .meta { color:#666; margin-bottom:12px }
+    .relationships .stats { display:flex; gap:16px; flex-wrap:wrap }
+    .relationships .stat { border:1px solid #ddd; padding:10px 16px; min-width:120px }
+    .relationships .stat b { display:block; font-size:22px }
+    .relationships .warn { color:#c23934; font-weight:bold }
+  </style>
+"""
+
+MAIN_TEMPLATE = """<main class="main-content">
+      <div class="relationships">
+      <h1>{title}</h1>
+      <p class="meta">Generated from: {source}</p>
+      <section><div class="stats">{stats_html}</div></section>
+      {sections_html}
+      </div>
+    </main>"""
+
+HTML_TEMPLATE = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width,initial-scale=1">
+  <title>{title} | RevNova Requirements</title>
+{style}</head>
+<body>
+    {main}
+</body>
+</html>
+"""
+
+
+def _table(headers, rows):
+    head = ''.join(f'<th>{html.escape(h)}</th>' for h in headers)
+    body = ''.join('<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>' for row in rows)
+    return f'<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
+
+
+def _section(title, body, note=''):
+    note = f'<p class="meta">{note}</p>' if note else ''
+    return f'<section><h2>{html.escape(title)}</h2>{note}{body}</section>'
+
+
+def load_chrome(page):
+    """Split a requirements page into (up to its <main>, after its </main>), or None."""
+    try:
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    start = content.find('<main class="main-content"')
+    end = content.rfind('</main>')
+    if start < 0 or end < start or '</head>' not in content[:start]:
+        return None
+    return content[:start], content[end + len('</main>'):]
+
+
+def _with_chrome(chrome, main, name):
+    """The page: chrome around main, titled, styled, and with the sidebar link to `name` active."""
+    before, after = chrome
+    before = re.sub(r'<title>.*?</title>', lambda m: f'<title>{PAGE_TITLE} | RevNova Requirements</title>',
+                    before, count=1, flags=re.DOTALL)
+    before = before.replace('</head>', PAGE_STYLE + '</head>', 1)
+    before = re.sub(r'class="(nav-link|nav-subsection-link) active"', r'class="\1"', before)
+    before = before.replace(f'<a href="{name}" class="nav-link">', f'<a href="{name}" class="nav-link active">')
+    return before + main + after
+
+
+def render_html(plan, source, chrome=None, name=DEFAULT_OUTPUT.name):
+    """The requirements page for a load plan, inside chrome from load_chrome() when given."""
+    esc = html.escape
+    summary = plan['summary']
+    stats = [('Objects', summary['objects']), ('Reference fields', summary['references']),
+             ('Load waves', summary['waves']), ('Cycles', summary['cycles']),
+             ('Objects in cycles', summary['objects_in_cycles']), ('Deferred fields', summary['deferred_fields'])]
+    stats_html = ''.join(f'<div class="stat"><b>{value:,}</b>{label}</div>' for label, value in stats)
+
+    sections = [_section(
+        'Load Waves',
+        _table(['Wave', 'Objects', 'Load in order'],
+               [(i + 1, len(wave), esc(', '.join(wave))) for i, wave in enumerate(plan['waves'])]),
+        'Every object in a wave references only objects of earlier waves or of its own cycle, '
+        'so the objects and cycles of one wave can load in parallel.')]
+
+    if plan['cycles']:
+        rows = [(c['component'], ' &rarr; '.join(map(esc, c['members'])),
+                 '<br>'.join(esc(d) for d in c['deferred']) or '&mdash;',
+                 '<span class="warn">required references form a cycle</span>' if c['unresolved'] else 'resolved')
+                for c in plan['cycles']]
+        sections.append(_section(
+            'Cycles', _table(['Component', 'Load order', 'Deferred to update pass', 'Status'], rows),
+            'Members of a cycle load together in the order shown. Required references (master-detail, '
+            'cascade delete, non-nillable) are satisfied by that order; the deferred lookups are left empty '
+            'on insert and set by an update once the whole component has loaded.'))
+
+    by_object = plan['objects']
+    for title, key, fields, note in (
+            ('Most Referenced Objects', 'fan_in', 'fields_in', 'Fan-in: distinct objects that reference it.'),
+            ('Most Referencing Objects', 'fan_out', 'fields_out', 'Fan-out: distinct objects it references.')):
+        hubs = sorted((o for o in by_object if o[key]), key=lambda o: (-o[key], -o[fields], o['object']))[:TOP_HUBS]
+        if hubs:
+            sections.append(_section(title, _table(
+                ['Object', 'Objects', 'Reference fields', 'Wave'],
+                [(esc(o['object']), o[key], o[fields], o['wave'] + 1) for o in hubs]), note))
+
+    sections.append(_section('All Objects', _table(
+        ['#', 'Object', 'Wave', 'Fan-in', 'Fan-out', 'Cycle'],
+        [(o['position'] + 1, esc(o['object']), o['wave'] + 1, o['fan_in'], o['fan_out'],
+          '' if o['cycle'] is None else o['cycle']) for o in by_object])))
+
+    main = MAIN_TEMPLATE.format(title=PAGE_TITLE, source=esc(source), stats_html=stats_html,
+                                sections_html='\n      '.join(sections))
+    if chrome is None:
+        return HTML_TEMPLATE.format(title=PAGE_TITLE, style=PAGE_STYLE, main=main)
+    return _with_chrome(chrome, main, name)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic orgs and benchmark
+# ---------------------------------------------------------------------------
+
+def synthetic_edges(objects, seed=1):
+    """Edges of an org with `objects` objects: mostly references to earlier objects (a DAG
+    of parents), a sprinkling of back references forming cycles and some self lookups."""
+    rng = random.Random(seed)
+    names = [f'Object{i}__c' for i in range(objects)]
+    edges = []
+    for i, name in enumerate(names):
+        for j in range(rng.randint(0, 6) if i else 0):
+            required = rng.random() < 0.2
+            edges.append({'source': name, 'field': f'Parent{j}__c', 'target': names[rng.randrange(i)],
+                          'type': 'masterdetail' if required else 'lookup', 'required': required})
+        if rng.random() < 0.02 and i > 1:
+            edges.append({'source': names[rng.randrange(i)], 'field': f'Back{i}__c', 'target': name,
+                          'type': 'lookup', 'required': False})
+        if rng.random() < 0.05:
+            edges.append({'source': name, 'field': 'Parent__c', 'target': name, 'type': 'lookup', 'required': False})
+    return names, edges
+
+
+def benchmark(sizes, report=print):
+    results = []
+    for size in sizes:
+        objects, edges = synthetic_edges(size)
+        start = time.perf_counter()
+        graph = RelationshipGraph(edges, objects)
+        built = time.perf_counter()
+        plan = graph.analyze()
+        done = time.perf_counter()
+        html_text = render_html(plan, f'synthetic {size}')
+        rendered = time.perf_counter()
+        result = {'objects': size, 'references': len(edges), 'build_ms': round((built - start) * 1000, 2),
+                  'analyze_ms': round((done - built) * 1000, 2), 'render_ms': round((rendered - done) * 1000, 2),
+                  'html_bytes': len(html_text), **{k: plan['summary'][k] for k in ('waves', 'cycles', 'deferred_fields')}}
+        report(f"{size:>7} objects {len(edges):>8} references  build {result['build_ms']:8.2f}ms  "
+               f"analyze {result['analyze_ms']:8.2f}ms  render {result['render_ms']:8.2f}ms  "
+               f"{result['waves']} waves, {result['cycles']} cycles")
+        results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Analyze object relationships into a migration load plan')
+    parser.add_argument('export', nargs='?', help='Relationships or describe export (.json or .csv)')
+    parser.add_argument('-o', '--output', help='Also write the load plan as JSON')
+    parser.add_argument('--html', default=str(DEFAULT_OUTPUT), help='Rendered page (default: %(default)s)')
+    parser.add_argument('--no-docs', action='store_true', help='Do not render the requirements page')
+    parser.add_argument('--bench', help='Comma-separated synthetic org sizes (objects) to benchmark, e.g. 1000,10000')
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        results = benchmark([int(size) for size in args.bench.split(',')])
+        if args.output:
+            Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump({'benchmark': results}, f, indent=1)
+            print(f"📄 Results written to {args.output}")
+        return
+    if not args.export:
+        parser.error('a relationships export is required (or use --bench)')
+
+    export = Path(args.export)
+    if not export.exists():
+        print(f"ERROR: export not found: {export}")
+        sys.exit(2)
+    objects, edges = load_export(export)
+    start = time.perf_counter()
+    plan = RelationshipGraph(edges, objects).analyze()
+    milliseconds = (time.perf_counter() - start) * 1000
+    plan['summary']['analyze_ms'] = round(milliseconds, 2)
+
+    summary = plan['summary']
+    print(f"✅ {summary['objects']} objects, {summary['references']} references analyzed in {milliseconds:.1f}ms: "
+          f"{summary['waves']} waves, {summary['cycles']} cycles, {summary['deferred_fields']} deferred fields")
+    if summary['unresolved_cycles']:
+        print(f"⚠️  {summary['unresolved_cycles']} cycles are made of required references only")
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=1, ensure_ascii=False)
+        print(f"📄 Load plan written to {args.output}")
+    if not args.no_docs:
+        page = Path(args.html)
+        with docs_writer.transaction() as tx:
+            tx.write(page, render_html(plan, export.name, load_chrome(page.with_name(CHROME_PAGE)), page.name))
+        print(f"Wrote relationships HTML: {args.html}")
+
+
+if __name__ == '__main__':
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -0,0 +1,3 @@
+@echo off
+rem revnova-docs: see scripts\revnova_docs.py
+python "%~dp0revnova_docs.py" %*
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+revnova-docs: one entry point for the docs scripts.
+
+Each subcommand maps to a script in scripts/. Nothing is imported until a
+subcommand runs, and then only that script (and its dependencies, e.g. pandas
+for `mapping`) is loaded, so `--help` and the light commands start
+instantly. Arguments after the subcommand go to the script
+unchanged, including the --profile flags for scripts that run under
+docs_profile.profile_from_argv() (see docs_profile.py).
+
+Usage:
+    python scripts/revnova_docs.py --help
+    python scripts/revnova_docs.py build --stages regenerate,copilot-prompts
+    python scripts/revnova_docs.py serve --port 8080
+    python scripts/revnova_docs.py run fix-sidebar-overlap.py
+"""
+
+# os.path rather than pathlib: pathlib's import alone is ~10ms of startup.
+import os
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (script, summary, whether the script parses its own arguments)
+COMMANDS = {
+    'build': ('docs_pipeline.py', 'Run the docs build pipeline once', True),
+    'watch': ('watch_docs.py', 'Rebuild incrementally whenever sources change', True),
+    'serve': ('dev_server.py', 'Serve docs/ from memory with live reload', True),
+    'regenerate': ('regenerate_all_pages.py', 'Regenerate the onboarding day pages of every cohort', True),
+    'update-sidebars': ('update-sidebars.py', 'Replace sidebars on requirements and onboarding pages', False),
+    'requirements-sidebar': ('fix-requirements-sidebar-final.py', 'Fix the requirements page sidebars', False),
+    'standardize-sidebar': ('standardize-requirements-sidebar.py', 'Standardize requirements sidebar markup', False),
+    'fix-home': ('fix_onboarding_home.py', 'Rebuild onboarding-home.html from the day page template', False),
+    'fix-css': ('fix-css-double-semicolon.py', 'Fix doubled semicolons in page CSS', False),
+    'fix-navigation': ('fix-navigation-consistency.py', 'Make week/day navigation consistent', False),
+    'copilot-prompts': ('add-copilot-prompts.py', 'Insert Copilot prompts from scripts/data/copilot-prompts.json', True),
+    'task-status': ('update-task-completion-status.py', 'Set status banners on onboarding day pages', False),
+    'mapping': ('generate_mapping_html.py', 'Render the mapping workbook as HTML (needs pandas, openpyxl)', True),
+    'similarity': ('field_similarity.py', 'Precompute top-k field mapping suggestions for two catalogs (needs numpy)', True),
+    'relationships': ('relationship_graph.py', 'Analyze a relationships export into cycles and a migration load order', True),
+    'stage': ('load_staging.py', 'COPY NDJSON/CSV record exports into stg1, stg2 and EAV tables (needs psycopg2)', True),
+    'load': ('load_http.py', 'Replay .http request files under load and report latency percentiles', True),
+    'audit': ('audit-onboarding.py', 'Audit onboarding day pages', False),
+    'audit-full': ('comprehensive-audit.py', 'Comprehensive onboarding audit', False),
+    'search': ('build_search_index.py', 'Build the client-side docs search index', True),
+    'compress': ('compress_assets.py', 'Write .gz/.br siblings for nginx gzip_static', True),
+    'minify': ('minify_html.py', 'Minify docs/ into build/docs', True),
+    'fingerprint': ('fingerprint_assets.py', 'Content-hash assets in build/docs and write nginx cache rules', True),
+    'recover': ('docs_writer.py', 'Roll back docs writes interrupted by a crash', True),
+    'synth': ('generate_synthetic_corpus.py', 'Generate a synthetic docs corpus for scale testing', True),
+    'synth-cpq': ('generate_synthetic_cpq.py', 'Generate sharded synthetic CPQ records (quotes, lines, products, price books)', True),
+    'bench': ('benchmark_docs.py', 'Benchmark every stage on real and synthetic corpora', True),
+    'verify': ('verify_idempotency.py', 'Check that every rewriting script is a no-op on a second run', True),
+    'html': ('docs_html.py', 'Show the HTML parser backends; --bench measures parse throughput', True),
+    'pages': ('docs_pages.py', 'Refresh the docs corpus index and summarize it by page kind', True),
+    'content': ('docs_content.py', 'Report steps, prompts, code and endpoints from cached content records', True),
+}
+
+# Commands that rewrite pages through docs_writer and so accept its dry-run flags
+PREVIEWABLE = {'build', 'regenerate', 'update-sidebars', 'requirements-sidebar', 'standardize-sidebar',
+               'fix-home', 'fix-css', 'fix-navigation', 'copilot-prompts', 'task-status'}
+
+# Commands whose script runs under docs_profile.profile_from_argv() and so accepts --profile*
+PROFILABLE = PREVIEWABLE | {'mapping', 'similarity', 'relationships', 'stage', 'load', 'audit', 'audit-full'}
+
+
+def print_help(out=sys.stdout):
+    out.write('usage: revnova-docs <command> [args...]\n\nCommands:\n')
+    for name, (script, summary, _) in COMMANDS.items():
+        out.write(f'  {name:<22} {summary}\n')
+    out.write(f"  {'run <script> [args]':<22} Run any script in scripts/ by file name\n")
+    out.write('\nUse `revnova-docs <command> --help` for command options. Commands that\n'
+              'rewrite pages accept --dry-run, --diff and --diff-report[=PATH] to preview\n'
+              'their changes without writing anything. Those commands, plus\n'
+              f"{', '.join(sorted(PROFILABLE - PREVIEWABLE))},\n"
+              'also accept --profile[=PATH], --profile-cprofile and --profile-memory.\n')
+
+
+def run_script(script, args):
+    """Execute scripts/<script> as __main__ with args. Returns its exit status."""
+    import runpy
+
+    path = os.path.join(SCRIPTS_DIR, script)
+    if not os.path.isfile(path) or not path.endswith('.py'):
+        sys.stderr.write(f'revnova-docs: no such script: {script}\n')
+        return 2
+    sys.argv = [path, *args]
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        sys.stderr.write(f'{e.code}\n')
+        return 1
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help', 'help'):
+        print_help()
+        return 0
+
+    name, args = argv[0], argv[1:]
+    if name == 'run':
+        if not args:
+            sys.stderr.write('usage: revnova-docs run <script> [args...]\n')
+            return 2
+        return run_script(args[0], args[1:])
+
+    if name not in COMMANDS:
+        sys.stderr.write(f"revnova-docs: unknown command '{name}' (see revnova-docs --help)\n")
+        return 2
+
+    script, summary, parses_args = COMMANDS[name]
+    if not parses_args and ('-h' in args or '--help' in args):
+        # These scripts run immediately; never let --help rewrite pages.
+        preview = ' [--dry-run] [--diff] [--diff-report[=PATH]]' if name in PREVIEWABLE else ''
+        profile = ' [--profile[=PATH]] [--profile-cprofile] [--profile-memory]' if name in PROFILABLE else ''
+        print(f'usage: revnova-docs {name}{preview}{profile}\n\n'
+              f'{summary} ({script}).')
+        return 0
+    return run_script(script, args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Complete CSS matching onboarding style exactly
 STANDARD_CSS = """    <style>
         .requirements-layout{display:flex;min-height:calc(100vh - 80px);margin-top:80px}
@@ -110,6 +114,7 @@ STANDARD_SIDEBAR = """        <aside class="sidebar">
                         </div>
                         
                         <a href="requirements-mapping.html" class="nav-link">Complete Field Mapping</a>
+                        <a href="requirements-relationships.html" class="nav-link">Object Relationships &amp; Load Order</a>
                     </div>
                 </div>
                 
@@ -260,46 +265,37 @@ COLLAPSIBLE_SCRIPT = """
     </script>"""
 
 
-def fix_requirements_file(file_path):
-    """Fix a single requirements HTML file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Step 1: Replace the entire <style> block with standard CSS
-        # Match from <style> to </style> including any content before main-content class
-        style_pattern = r'<style>.*?\.main-content\{[^}]*\}'
-        if re.search(style_pattern, content, re.DOTALL):
-            content = re.sub(style_pattern, STANDARD_CSS + '\n        ', content, flags=re.DOTALL)
-        
-        # Step 2: Replace sidebar HTML structure
-        # Match entire sidebar from <aside class="sidebar"> to </aside>
-        sidebar_pattern = r'<aside class="sidebar">.*?</aside>'
-        if re.search(sidebar_pattern, content, re.DOTALL):
-            content = re.sub(sidebar_pattern, STANDARD_SIDEBAR, content, flags=re.DOTALL)
-        
-        # Step 3: Ensure collapsible script is present
-        if COLLAPSIBLE_SCRIPT.strip() not in content:
-            # Remove old script if exists
-            script_pattern = r'<script>.*?// Wait for DOM to be ready.*?</script>'
-            content = re.sub(script_pattern, '', content, flags=re.DOTALL)
-            
-            # Add new script before closing </body>
-            if '</body>' in content:
-                content = content.replace('</body>', f'{COLLAPSIBLE_SCRIPT}\n</body>')
-        
-        # Only write if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
+def fix_requirements_file(file_path, tx):
+    """Fix a single requirements HTML file, staging the result in tx."""
+    content = tx.read(file_path)
+    
+    original_content = content
+    
+    # Step 1: Replace the entire <style> block with standard CSS
+    # Match from <style> to </style> including any content before main-content class
+    style_pattern = r'<style>.*?\.main-content\{[^}]*\}\s*'
+    content = docs_pages.sub_indented(style_pattern, STANDARD_CSS + '\n        ', content)
+    
+    # Step 2: Replace sidebar HTML structure
+    # Match entire sidebar from <aside class="sidebar"> to </aside>
+    sidebar_pattern = r'<aside class="sidebar">.*?</aside>'
+    content = docs_pages.sub_indented(sidebar_pattern, STANDARD_SIDEBAR, content)
+    
+    # Step 3: Ensure collapsible script is present
+    if COLLAPSIBLE_SCRIPT.strip() not in content:
+        # Remove old script if exists
+        script_pattern = r'<script>.*?// Wait for DOM to be ready.*?</script>'
+        content = re.sub(script_pattern, '', content, flags=re.DOTALL)
         
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return False
+        # Add new script before closing </body>
+        if '</body>' in content:
+            content = content.replace('</body>', f'{COLLAPSIBLE_SCRIPT}\n</body>')
+    
+    # Only write if changes were made
+    if content != original_content:
+        tx.write(file_path, content)
+        return True
+    return False
 
 
 def main():
@@ -310,7 +306,7 @@ def main():
         print(f"Requirements directory not found: {requirements_dir}")
         return
     
-    html_files = sorted(requirements_dir.glob('*.html'))
+    html_files = docs_pages.list_pages(requirements_dir)
     
     if not html_files:
         print("No HTML files found in requirements directory")
@@ -322,17 +318,19 @@ def main():
     fixed_count = 0
     unchanged_count = 0
     
-    for html_file in html_files:
-        if fix_requirements_file(html_file):
-            print(f"✅ Fixed: {html_file.name}")
-            fixed_count += 1
-        else:
-            print(f"⏭  No changes: {html_file.name}")
-            unchanged_count += 1
+    with docs_writer.transaction() as tx:
+        for html_file in html_files:
+            if fix_requirements_file(html_file, tx):
+                print(f"✅ Fixed: {html_file.name}")
+                fixed_count += 1
+            else:
+                print(f"⏭  No changes: {html_file.name}")
+                unchanged_count += 1
     
     print("-" * 60)
     print(f"📊 Summary: {fixed_count} files updated, {unchanged_count} files unchanged")
 
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
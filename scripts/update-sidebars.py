@@ -8,6 +8,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Define the standard sidebar HTML for Requirements pages
 REQUIREMENTS_SIDEBAR = '''        <aside class="sidebar">
             <h3>Platform Vision</h3>
@@ -39,6 +43,7 @@ REQUIREMENTS_SIDEBAR = '''        <aside class="sidebar">
                     </ul>
                 </li>
                 <li><a href="requirements-mapping.html">Complete Field Mapping (70+ Fields)</a></li>
+                <li><a href="requirements-relationships.html">Object Relationships &amp; Load Order</a></li>
             </ul>
             
             <h3>Phase 2 - AI Product Configuration</h3>
@@ -161,67 +166,68 @@ ONBOARDING_SIDEBAR = '''        <aside class="sidebar">
         </aside>'''
 
 
-def update_sidebar(filepath, new_sidebar):
-    """Replace the sidebar in an HTML file with the new standard sidebar."""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Pattern to match the entire <aside class="sidebar">...</aside> block
-        pattern = r'<aside class="sidebar">.*?</aside>'
-        
-        # Replace with new sidebar (preserve indentation)
-        updated_content = re.sub(pattern, new_sidebar.strip(), content, flags=re.DOTALL)
-        
-        # Write back if changed
-        if updated_content != content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
-            return True
-        return False
-    except Exception as e:
-        print(f"Error processing {filepath}: {e}")
-        return False
+def replace_sidebar(content, new_sidebar):
+    """Return content with its <aside class="sidebar"> block replaced by new_sidebar."""
+    # Pattern to match the entire <aside class="sidebar">...</aside> block
+    pattern = r'<aside class="sidebar">.*?</aside>'
+    
+    # Replace with new sidebar (preserve indentation)
+    return re.sub(pattern, new_sidebar.strip(), content, flags=re.DOTALL)
+
+
+def update_sidebar(filepath, new_sidebar, tx):
+    """Replace the sidebar in an HTML file with the new standard sidebar (staged in tx)."""
+    content = tx.read(filepath)
+    updated_content = replace_sidebar(content, new_sidebar)
+    
+    # Write back if changed
+    if updated_content != content:
+        tx.write(filepath, updated_content)
+        return True
+    return False
 
 
 def main():
     """Main function to update all sidebar navigations."""
     repo_root = Path(__file__).parent.parent
     
-    # Update Requirements pages
-    requirements_dir = repo_root / 'docs' / 'RevNovaRequirements'
-    req_count = 0
-    if requirements_dir.exists():
-        print("Updating Requirements pages...")
-        for html_file in requirements_dir.glob('*.html'):
-            # Skip requirements-home.html (it's the source)
-            if html_file.name == 'requirements-home.html':
-                continue
+    # Requirements and onboarding pages are written together, or not at all
+    with docs_writer.transaction() as tx:
+        # Update Requirements pages
+        requirements_dir = repo_root / 'docs' / 'RevNovaRequirements'
+        req_count = 0
+        if requirements_dir.exists():
+            print("Updating Requirements pages...")
+            for html_file in docs_pages.list_pages(requirements_dir):
+                # Skip requirements-home.html (it's the source)
+                if html_file.name == 'requirements-home.html':
+                    continue
             
-            if update_sidebar(html_file, REQUIREMENTS_SIDEBAR):
-                print(f"  ✓ Updated {html_file.name}")
-                req_count += 1
-            else:
-                print(f"  - Skipped {html_file.name} (no changes)")
+                if update_sidebar(html_file, REQUIREMENTS_SIDEBAR, tx):
+                    print(f"  ✓ Updated {html_file.name}")
+                    req_count += 1
+                else:
+                    print(f"  - Skipped {html_file.name} (no changes)")
     
-    # Update Onboarding pages
-    onboarding_dir = repo_root / 'docs' / 'Onboarding'
-    onb_count = 0
-    if onboarding_dir.exists():
-        print("\nUpdating Onboarding pages...")
-        for html_file in onboarding_dir.glob('*.html'):
-            # Skip onboarding-home.html (it's the source)
-            if html_file.name == 'onboarding-home.html':
-                continue
+        # Update Onboarding pages
+        onboarding_dir = repo_root / 'docs' / 'Onboarding'
+        onb_count = 0
+        if onboarding_dir.exists():
+            print("\nUpdating Onboarding pages...")
+            for html_file in docs_pages.list_pages(onboarding_dir):
+                # Skip onboarding-home.html (it's the source)
+                if html_file.name == 'onboarding-home.html':
+                    continue
             
-            if update_sidebar(html_file, ONBOARDING_SIDEBAR):
-                print(f"  ✓ Updated {html_file.name}")
-                onb_count += 1
-            else:
-                print(f"  - Skipped {html_file.name} (no changes)")
+                if update_sidebar(html_file, ONBOARDING_SIDEBAR, tx):
+                    print(f"  ✓ Updated {html_file.name}")
+                    onb_count += 1
+                else:
+                    print(f"  - Skipped {html_file.name} (no changes)")
     
     print(f"\n✓ Complete! Updated {req_count} Requirements pages and {onb_count} Onboarding pages")
 
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
@@ -7,6 +7,10 @@ import os
 import re
 from pathlib import Path
 
+import docs_pages
+import docs_profile
+import docs_writer
+
 # Task completion status based on comprehensive code audit
 TASK_STATUS = {
     # Developer 1 (Backend) - 25 days total
@@ -95,57 +99,50 @@ TASK_STATUS = {
     }
 }
 
-def add_status_badge_to_page(file_path, status):
-    """Add or update a status badge at the top of the page content."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Define status badge HTML
-        if status == 'COMPLETE':
-            badge_html = '''
+STATUS_BADGES = {
+    'COMPLETE': '''
             <div class="status-banner" style="background: #d4edda; border-left: 4px solid #28a745; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <strong style="color: #155724;">✅ STATUS: COMPLETE</strong> - This task has been implemented and committed to the repository.
-            </div>'''
-        elif status == 'PARTIAL':
-            badge_html = '''
+            </div>''',
+    'PARTIAL': '''
             <div class="status-banner" style="background: #fff3cd; border-left: 4px solid #ffc107; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <strong style="color: #856404;">⚠️ STATUS: PARTIALLY COMPLETE</strong> - Some components implemented, but core functionality incomplete.
-            </div>'''
-        elif status == 'UNKNOWN':
-            badge_html = '''
+            </div>''',
+    'UNKNOWN': '''
             <div class="status-banner" style="background: #e7f3ff; border-left: 4px solid #2196F3; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <strong style="color: #0c5460;">ℹ️ STATUS: CANNOT VERIFY</strong> - Infrastructure tasks require AWS/cloud access to verify completion.
-            </div>'''
-        else:  # NOT STARTED
-            badge_html = '''
+            </div>''',
+    'NOT STARTED': '''
             <div class="status-banner" style="background: #f8d7da; border-left: 4px solid #dc3545; padding: 1rem; margin: 1rem 0; border-radius: 4px;">
                 <strong style="color: #721c24;">❌ STATUS: NOT STARTED</strong> - This task has not been completed yet. Implementation needed.
-            </div>'''
-        
-        # Remove existing status banner if present
-        content = re.sub(
-            r'<div class="status-banner".*?</div>',
-            '',
-            content,
-            flags=re.DOTALL
-        )
-        
-        # Insert status banner after page title (h1 tag)
-        pattern = r'(<h1[^>]*>.*?</h1>)'
-        replacement = r'\1' + badge_html
-        
-        if re.search(pattern, content):
-            content = re.sub(pattern, replacement, content, count=1)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        return False
-        
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return False
+            </div>''',
+}
+
+STATUS_BANNER_PATTERN = re.compile(r'<div class="status-banner".*?</div>', re.DOTALL)
+
+def apply_status_badge(content, status):
+    """Return content with its status banner set to `status`, or None if the page has no h1."""
+    badge_html = STATUS_BADGES.get(status, STATUS_BADGES['NOT STARTED'])
+    
+    # Remove existing status banner if present, with the line break and
+    # indentation badge_html brings back
+    content = docs_pages.sub_indented(STATUS_BANNER_PATTERN, '', content, newline=True)
+    
+    # Insert status banner after page title (h1 tag)
+    pattern = r'(<h1[^>]*>.*?</h1>)'
+    replacement = r'\1' + badge_html
+    
+    if re.search(pattern, content):
+        return re.sub(pattern, replacement, content, count=1)
+    return None
+
+def add_status_badge_to_page(file_path, status, tx):
+    """Add or update a status badge at the top of the page content (staged in tx)."""
+    content = apply_status_badge(tx.read(file_path), status)
+    if content is not None:
+        tx.write(file_path, content)
+        return True
+    return False
 
 def main():
     script_dir = Path(__file__).parent
@@ -158,23 +155,24 @@ def main():
     print("Updating developer task completion status...")
     print("=" * 60)
     
-    for dev, tasks in TASK_STATUS.items():
-        print(f"\n{dev.upper()} ({len(tasks)} tasks):")
-        print("-" * 60)
+    with docs_writer.transaction() as tx:
+        for dev, tasks in TASK_STATUS.items():
+            print(f"\n{dev.upper()} ({len(tasks)} tasks):")
+            print("-" * 60)
         
-        for day, status in tasks.items():
-            total_count += 1
-            file_path = onboarding_dir / f"{dev}-day{day:02d}.html"
+            for day, status in tasks.items():
+                total_count += 1
+                file_path = onboarding_dir / f"{dev}-day{day:02d}.html"
             
-            if file_path.exists():
-                if add_status_badge_to_page(file_path, status):
-                    updated_count += 1
-                    symbol = "✅" if status == "COMPLETE" else "⚠️" if status == "PARTIAL" else "ℹ️" if status == "UNKNOWN" else "❌"
-                    print(f"  {symbol} Day {day:02d}: {status} - Updated")
+                if file_path.exists():
+                    if add_status_badge_to_page(file_path, status, tx):
+                        updated_count += 1
+                        symbol = "✅" if status == "COMPLETE" else "⚠️" if status == "PARTIAL" else "ℹ️" if status == "UNKNOWN" else "❌"
+                        print(f"  {symbol} Day {day:02d}: {status} - Updated")
+                    else:
+                        print(f"  ⚠️ Day {day:02d}: {status} - Failed to update")
                 else:
-                    print(f"  ⚠️ Day {day:02d}: {status} - Failed to update")
-            else:
-                print(f"  ⚠️ Day {day:02d}: File not found - {file_path.name}")
+                    print(f"  ⚠️ Day {day:02d}: File not found - {file_path.name}")
     
     print("\n" + "=" * 60)
     print(f"Updated {updated_count} out of {total_count} task pages")
@@ -192,4 +190,5 @@ def main():
     print(f"  ℹ️ Cannot Verify: {unknown} tasks ({unknown/total_count*100:.1f}%)")
 
 if __name__ == '__main__':
-    main()
+    with docs_profile.profile_from_argv(), docs_writer.dry_run_from_argv():
+        main()
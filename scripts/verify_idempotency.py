@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Verify that every rewriting docs script is idempotent.
+
+A rewrite rule that is not idempotent corrupts pages a little more on every
+build: fix-navigation-consistency.py once appended ';cursor:default' to styles
+that already had it, which is why fix-css-double-semicolon.py exists. This
+verifier runs each rewriting script (every script that writes through
+docs_writer.transaction, plus the docs_pipeline build) over a throwaway copy of
+the real docs/ and of synthetic corpora, twice, and checks that the second pass
+is a byte-for-byte no-op.
+Scripts that render a page from an input file (relationship_graph.py) run
+on the bundled fixture given in SCRIPT_ARGS.
+
+Scripts that still change pages on the second pass get up to --max-passes
+more passes and are classified as converging late (a fixpoint after N passes),
+oscillating (the tree returns to an earlier state) or diverging (pages keep
+changing). A short diff of one offending page is shown.
+
+The tree is hashed after every pass; a file is only re-read when its size,
+mtime or inode changed, so verifying thousands of pages costs little more than
+running the scripts. Files rewritten with identical content are counted too:
+they are not a correctness problem but mean the script does needless work.
+
+Usage:
+    python scripts/verify_idempotency.py
+    python scripts/verify_idempotency.py --corpora real --scripts update-task-completion-status.py
+    python scripts/verify_idempotency.py --corpora real,1x,10x --max-passes 6
+"""
+
+import argparse
+import difflib
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import benchmark_docs
+import docs_pipeline
+
+DEFAULT_CORPORA = ['real', '1x']
+TRANSACTION_PATTERN = re.compile(r'\bdocs_writer\.transaction\(')
+# The build itself is verified too: its stages must agree with each other
+PIPELINE_SCRIPT = 'docs_pipeline.py'
+DIFF_CONTEXT_LINES = 12
+# Arguments for transaction writers that render a page from an input file;
+# they are run on a small bundled fixture, so their rendering must be
+# deterministic as well as idempotent.
+SCRIPT_ARGS = {'relationship_graph.py': ['scripts/data/relationships-sample.json']}
+
+
+def find_rewriting_scripts(scripts_dir=docs_pipeline.SCRIPTS_DIR):
+    """Scripts that write pages through docs_writer transactions, plus the pipeline."""
+    scripts = []
+    for path in sorted(Path(scripts_dir).glob('*.py')):
+        if path.name in ('docs_writer.py', PIPELINE_SCRIPT, Path(__file__).name):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            if TRANSACTION_PATTERN.search(f.read()):
+                scripts.append(path.name)
+    return scripts + [PIPELINE_SCRIPT]
+
+
+def hash_tree(root, previous=None):
+    """Map every file under root to ((size, mtime_ns, inode), sha256).
+
+    Digests from `previous` are reused for files whose stat key is unchanged.
+    docs_writer replaces files by rename, so a rewritten file always gets a new
+    inode even when its size and mtime happen to match.
+    """
+    previous = previous or {}
+    manifest = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            stat = os.stat(path)
+            key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            relative = os.path.relpath(path, root).replace(os.sep, '/')
+            entry = previous.get(relative)
+            if entry is None or entry[0] != key:
+                with open(path, 'rb') as f:
+                    entry = (key, hashlib.sha256(f.read()).hexdigest())
+            manifest[relative] = entry
+    return manifest
+
+
+def tree_digest(manifest):
+    digest = hashlib.sha256()
+    for relative in sorted(manifest):
+        digest.update(f'{relative}\0{manifest[relative][1]}\n'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def compare(before, after):
+    """Return (changed paths, paths rewritten with identical content)."""
+    changed = sorted(path for path in before.keys() | after.keys()
+                     if path not in before or path not in after or before[path][1] != after[path][1])
+    touched = sorted(path for path in before.keys() & after.keys()
+                     if before[path][1] == after[path][1] and before[path][0] != after[path][0])
+    return changed, touched
+
+
+def read_files(root, paths):
+    contents = {}
+    for relative in paths:
+        try:
+            with open(os.path.join(root, relative), 'rb') as f:
+                contents[relative] = f.read()
+        except FileNotFoundError:
+            contents[relative] = None
+    return contents
+
+
+def sample_diff(relative, old, new, limit=DIFF_CONTEXT_LINES):
+    """The first lines of the unified diff between two versions of a file."""
+    decode = lambda data: '' if data is None else data.decode('utf-8', errors='replace')
+    diff = difflib.unified_diff(decode(old).splitlines(), decode(new).splitlines(),
+                                f'pass 1/{relative}', f'pass 2/{relative}', lineterm='', n=1)
+    lines = []
+    for line in diff:
+        lines.append(line if len(line) <= 160 else line[:157] + '...')
+        if len(lines) >= limit:
+            lines.append('...')
+            break
+    return lines
+
+
+def run_pass(workspace, script, timeout):
+    """Run a script once inside the workspace. Returns (exit code, seconds, output tail)."""
+    start = time.perf_counter()
+    command = [sys.executable, str(workspace / 'scripts' / script), *SCRIPT_ARGS.get(script, ())]
+    try:
+        process = subprocess.run(command, cwd=workspace,
+                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout,
+                                 env={**os.environ, 'PYTHONIOENCODING': 'utf-8'})
+        code, output = process.returncode, process.stdout.decode('utf-8', errors='replace')
+    except subprocess.TimeoutExpired:
+        code, output = None, f'timed out after {timeout}s'
+    return code, time.perf_counter() - start, output.strip().splitlines()[-3:]
+
+
+def restore(docs_dir, pristine_dir, pristine, current):
+    """Put docs_dir back to the pristine state, copying only files that differ."""
+    changed, _ = compare(pristine, current)
+    for relative in changed:
+        target = docs_dir / relative
+        if relative in pristine:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(pristine_dir / relative, target)
+        elif target.exists():
+            target.unlink()
+    return len(changed)
+
+
+def verify_script(workspace, script, pristine, max_passes, timeout):
+    """Run script repeatedly from the pristine corpus. Returns the verdict dict."""
+    docs_dir = workspace / 'docs'
+    # Restored files have new inodes; only those are re-hashed
+    manifest = hash_tree(docs_dir, pristine)
+    seen = {tree_digest(pristine): 0}
+    passes = []
+    saved = {}
+
+    for number in range(1, max_passes + 1):
+        code, seconds, tail = run_pass(workspace, script, timeout)
+        after = hash_tree(docs_dir, manifest)
+        changed, touched = compare(manifest, after)
+        growth = sum(after[p][0][0] for p in changed if p in after) - sum(manifest[p][0][0] for p in changed if p in manifest)
+        passes.append({'changed': len(changed), 'touched': len(touched), 'growth': growth,
+                       'seconds': seconds, 'exit_code': code})
+        if code != 0:
+            return {'verdict': 'error', 'passes': passes, 'output': tail}
+
+        if number == 2 and changed:
+            offender = next((p for p in changed if p in saved), changed[0])
+            sample = sample_diff(offender, saved.get(offender), read_files(docs_dir, [offender])[offender])
+        if number == 1:
+            # Keep pass-1 content of the pages it changed: those are the likely offenders on pass 2
+            saved = read_files(docs_dir, changed)
+        manifest = after
+
+        state = tree_digest(after)
+        if number >= 2 and not changed:
+            verdict = 'idempotent' if number == 2 else f'converges after {number - 1} passes'
+            result = {'verdict': verdict, 'passes': passes}
+            if number > 2:
+                result['sample'] = sample
+            return result
+        if number >= 2 and state in seen and seen[state] < number - 1:
+            return {'verdict': f'oscillates (period {number - seen[state]})', 'passes': passes, 'sample': sample}
+        seen[state] = number
+
+    return {'verdict': 'diverges', 'passes': passes, 'sample': sample}
+
+
+def verify_corpus(corpus, scripts, max_passes=4, timeout=300, report=print):
+    """Verify every script on one corpus. Returns {script: verdict dict}."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix=f'revnova-idempotency-{corpus}-') as tmp:
+        workspace = Path(tmp) / 'workspace'
+        workspace.mkdir()
+        stats = benchmark_docs.prepare_workspace(corpus, workspace, report=report)
+        pristine_dir = Path(tmp) / 'pristine'
+        shutil.copytree(workspace / 'docs', pristine_dir)
+        pristine = hash_tree(workspace / 'docs')
+        report(f"\n📚 Corpus {corpus}: {stats['pages']} pages, {stats['bytes'] / 1024 / 1024:.1f} MB")
+
+        for script in scripts:
+            if not (workspace / 'scripts' / script).exists():
+                continue
+            result = verify_script(workspace, script, pristine, max_passes, timeout)
+            results[script] = result
+            print_result(script, result, report)
+            restore(workspace / 'docs', pristine_dir, pristine, hash_tree(workspace / 'docs', pristine))
+    return results
+
+
+def print_result(script, result, report=print):
+    passes = result['passes']
+    first = passes[0]
+    icon = {'idempotent': '✅', 'error': '💥'}.get(result['verdict'], '❌')
+    counts = ', '.join(f"pass {i}: {p['changed']}" + (f" (+{p['touched']} rewritten unchanged)" if p['touched'] else '')
+                       for i, p in enumerate(passes, 1))
+    report(f"  {icon} {script:<40} {result['verdict']:<26} {counts}  [{first['seconds']:.2f}s/pass]")
+    if result['verdict'] == 'error':
+        for line in result['output']:
+            report(f"       {line}")
+    elif result['verdict'] == 'diverges':
+        report(f"       grows {passes[-1]['growth']:+,} bytes per pass")
+    for line in result.get('sample', []):
+        report(f"       {line}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Verify that every rewriting docs script is idempotent')
+    parser.add_argument('--corpora', default=','.join(DEFAULT_CORPORA),
+                        help=f"Comma-separated corpora: real and/or synthetic presets "
+                             f"{','.join(benchmark_docs.generate_synthetic_corpus.PRESETS)} "
+                             f"(default: {','.join(DEFAULT_CORPORA)})")
+    parser.add_argument('--scripts', help='Comma-separated scripts to verify (default: every rewriting script)')
+    parser.add_argument('--max-passes', type=int, default=4, help='Passes before a script is declared divergent (default: 4)')
+    parser.add_argument('--timeout', type=int, default=300, help='Per-pass timeout in seconds (default: 300)')
+    args = parser.parse_args(argv)
+
+    scripts = args.scripts.split(',') if args.scripts else find_rewriting_scripts()
+    print(f"🔁 Verifying {len(scripts)} rewriting script(s) over {args.corpora}")
+    failures = []
+    for corpus in args.corpora.split(','):
+        results = verify_corpus(corpus, scripts, max(2, args.max_passes), args.timeout)
+        failures.extend((corpus, script) for script, result in results.items() if result['verdict'] != 'idempotent')
+
+    if failures:
+        print(f"\n❌ {len(failures)} script/corpus pair(s) do not converge in one pass:")
+        for corpus, script in failures:
+            print(f"   {corpus}: {script}")
+        return 1
+    print("\n✅ Every rewriting script is idempotent")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Watch the docs sources and incrementally rebuild on every edit.
+
+Watches scripts/ (including scripts/data/), docs/Onboarding,
+docs/RevNovaRequirements and every cohort directory listed in
+scripts/data/onboarding-cohorts.json (cohorts added to the config while the
+watcher runs are picked up after the rebuild that creates them). Bursts of
+events are debounced, then only the affected pipeline stages (see
+docs_pipeline.py) rerun for the affected pages. Files written by the rebuild
+itself are ignored, so a rebuild never triggers another one.
+
+On Linux the watcher uses inotify directly (via ctypes, no extra packages);
+elsewhere it falls back to polling file modification times.
+
+Usage:
+    python scripts/watch_docs.py
+    python scripts/watch_docs.py --stages regenerate,copilot-prompts,audit-onboarding
+    python scripts/watch_docs.py --debounce 0.1
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+import docs_pipeline
+
+WATCH_DIRS = [
+    docs_pipeline.SCRIPTS_DIR,
+    docs_pipeline.SCRIPTS_DIR / 'data',
+    docs_pipeline.ONBOARDING_DIR,
+    docs_pipeline.REQUIREMENTS_DIR,
+]
+
+COHORTS_CONFIG = docs_pipeline.SCRIPTS_DIR / 'data' / 'onboarding-cohorts.json'
+
+WATCH_SUFFIXES = ('.py', '.json', '.html', '.css', '.js')
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def watch_dirs(config_path=COHORTS_CONFIG):
+    """WATCH_DIRS plus each cohort's output directory from the cohort config.
+
+    A missing or half-written config only drops the cohort directories; the
+    rebuild reports the config error itself.
+    """
+    directories = list(WATCH_DIRS)
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            cohorts = json.load(f).get('cohorts', [])
+    except (OSError, ValueError):
+        cohorts = []
+    for entry in cohorts:
+        directory = docs_pipeline.REPO_ROOT / entry.get('dir', '')
+        if directory not in directories:
+            directories.append(directory)
+    return directories
+
+
+def _is_watched(path):
+    name = path.name
+    return name.endswith(WATCH_SUFFIXES) and not name.startswith('.') and not name.endswith('~')
+
+
+class InotifyWatcher:
+    """Linux inotify watcher for a set of directories (non-recursive)."""
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._dirs = {}
+        self.add(directories)
+
+    @property
+    def directories(self):
+        return list(self._dirs.values())
+
+    def add(self, directories):
+        """Start watching any of `directories` that exist and are not watched yet."""
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        for directory in directories:
+            if not directory.is_dir() or directory in self._dirs.values():
+                continue
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self._dirs[wd] = directory
+
+    def wait(self, timeout):
+        """Block up to `timeout` seconds and return the set of changed paths."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if wd in self._dirs and name:
+                path = self._dirs[wd] / os.fsdecode(name)
+                if _is_watched(path):
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback: compares file mtimes/sizes every poll interval."""
+
+    def __init__(self, directories, interval=0.2):
+        self._directories = []
+        self._interval = interval
+        self._snapshot = {}
+        self.add(directories)
+
+    @property
+    def directories(self):
+        return list(self._directories)
+
+    def add(self, directories):
+        """Start watching any of `directories` that exist and are not watched yet."""
+        new = [d for d in directories if d.is_dir() and d not in self._directories]
+        if new:
+            self._directories.extend(new)
+            self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        for directory in self._directories:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and _is_watched(Path(entry.name)):
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                       if snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self._interval, remaining))
+
+    def close(self):
+        pass
+
+
+def create_watcher(directories=None):
+    """Return an inotify watcher on Linux, a polling watcher elsewhere."""
+    if directories is None:
+        directories = watch_dirs()
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(directories)
+
+
+def wait_for_changes(watcher, debounce):
+    """Block until something changes, then keep collecting until `debounce`
+    seconds pass without a new event. Returns the full burst."""
+    changed = set()
+    while not changed:
+        changed = watcher.wait(1.0)
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+def _file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def watch(stage_names=None, debounce=0.15, initial_build=False):
+    """Run the watch loop until interrupted."""
+    stages = docs_pipeline.select_stages(stage_names)
+    watcher = create_watcher()
+    own_writes = {}
+
+    print(f"👀 Watching {len(watcher.directories)} directories "
+          f"({type(watcher).__name__.replace('Watcher', '').lower()})")
+    print(f"   Stages: {', '.join(stage['name'] for stage in stages)}")
+    print("   Press Ctrl+C to stop.\n")
+
+    if initial_build:
+        written, _ = docs_pipeline.run_pipeline(stage_names=stage_names)
+        own_writes.update((path, _file_hash(path)) for path in written)
+
+    try:
+        while True:
+            changed = wait_for_changes(watcher, debounce)
+            event_time = time.perf_counter()
+
+            # Drop events caused by our own writes (content still matches).
+            for path in list(changed):
+                if path in own_writes and own_writes.pop(path) == _file_hash(path):
+                    changed.discard(path)
+            if not changed:
+                continue
+
+            names = ', '.join(sorted(path.name for path in changed)[:5])
+            more = f' (+{len(changed) - 5} more)' if len(changed) > 5 else ''
+            print(f"✏️  Changed: {names}{more}")
+
+            try:
+                written, timings = docs_pipeline.run_pipeline(changed, stage_names)
+            except Exception as e:
+                print(f"❌ Rebuild failed: {e}\n")
+                continue
+
+            own_writes.update((path, _file_hash(path)) for path in written)
+            if COHORTS_CONFIG in changed:
+                # A new cohort's directory only exists once the rebuild wrote it.
+                watcher.add(watch_dirs())
+            elapsed = time.perf_counter() - event_time
+            if not timings:
+                print("   (no stage affected)\n")
+                continue
+            flag = '✅' if elapsed < 1.0 else '🐢'
+            print(f"{flag} Rebuilt in {elapsed * 1000:.0f} ms "
+                  f"(+{debounce * 1000:.0f} ms debounce), {len(written)} files written\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Watch docs sources and rebuild incrementally')
+    parser.add_argument('--stages', help=f"Comma-separated stages (default: {','.join(docs_pipeline.DEFAULT_STAGES)})")
+    parser.add_argument('--debounce', type=float, default=0.15, help='Quiet period in seconds before rebuilding')
+    parser.add_argument('--initial-build', action='store_true', help='Run the full pipeline once before watching')
+    args = parser.parse_args(argv)
+
+    try:
+        watch(args.stages.split(',') if args.stages else None, args.debounce, args.initial_build)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+
+if __name__ == '__main__':
+    main()